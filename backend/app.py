@@ -1,16 +1,30 @@
 from flask import Flask
 from config.config import get_config_class
-from extensions import db, jwt
+from extensions import db, jwt, cache, mail
 from exceptions.error_handlers import register_error_handlers
 from utils.logging_config import init_logging
-from routes import auth_bp, airplane_bp, airport_bp, flight_bp  # import blueprints as required
+from services.flight_search_index import flight_search_index
+from services.itinerary_service import flight_graph
+from services.fare_engine import fare_engine
+from services.booking_hold_service import hold_sweeper
+from services.flight_lifecycle_service import flight_lifecycle_job
+from security.password_utils import password_hasher
+from commands import register_commands
+from celery_app import init_celery
+from utils import query_counter
+from utils.metrics import request_metrics
+from utils.idempotency import idempotency
+from utils.versioned_cache import cache_versions
+from routes import auth_bp, airplane_bp, airport_bp, flight_bp, booking_bp, wallet_bp, review_bp, metrics_bp  # import blueprints as required
 
 
-def create_app(config_name="development"):
+def create_app(config_name="development", test_config=None):
     app = Flask(__name__)
 
-    # loading environment-specific configuration
+    # loading environment-specific configuration (test_config overrides it, e.g. the test database)
     app.config.from_object(get_config_class(config_name))
+    if test_config:
+        app.config.update(test_config)
 
     # setting up logging
     init_logging(app)
@@ -19,22 +33,53 @@ def create_app(config_name="development"):
     # initializing Flask extensions
     db.init_app(app)
     jwt.init_app(app)
+    cache.init_app(app)
+    cache_versions.init_app(app)
+    mail.init_app(app)
+    password_hasher.init_app(app)
+    flight_search_index.init_app(app)
+    flight_graph.init_app(app)
+    fare_engine.init_app(app)
+    query_counter.init_app(app)
+    request_metrics.init_app(app)  # after query_counter: reads its per-request SQL counter
+    idempotency.init_app(app)
+
+    # background tasks (booking emails) and scheduled maintenance jobs (started by start_background_jobs)
+    init_celery(app)
+    hold_sweeper.init_app(app)
+    flight_lifecycle_job.init_app(app)
 
     # registering blueprints
     app.register_blueprint(auth_bp)
     app.register_blueprint(airplane_bp)
     app.register_blueprint(airport_bp)
     app.register_blueprint(flight_bp)
+    app.register_blueprint(booking_bp)
+    app.register_blueprint(wallet_bp)
+    app.register_blueprint(review_bp)
+    if app.config.get("METRICS_ENABLED", True):
+        app.register_blueprint(metrics_bp)
 
     # registering global error handlers
     register_error_handlers(app)
 
+    # registering CLI commands
+    register_commands(app)
+
     return app
 
 
+def start_background_jobs(app):
+    """Start the enabled maintenance jobs; only server entry points call this."""
+    for job in (hold_sweeper, flight_lifecycle_job):
+        if job.enabled:
+            job.start(app)
+
+
 # --- Entry Point ---
 if __name__ == "__main__":
     app = create_app()
+    start_background_jobs(app)
 
     # creating all the tables
     with app.app_context():
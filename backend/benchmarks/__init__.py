@@ -0,0 +1,4 @@
+# backend/benchmarks/__init__.py
+# Performance benchmarks. Run from the backend directory, e.g.:
+#     python -m benchmarks.login_throughput
+#     python -m benchmarks.http_suite --output run.json
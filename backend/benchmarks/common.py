@@ -0,0 +1,175 @@
+# backend/benchmarks/common.py
+# Shared helpers for the benchmarks: app bootstrapping, data seeding and latency stats.
+
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+BENCH_PASSWORD = "bench-password"
+WALLET_BALANCE = Decimal("1000000.00")
+
+
+def create_bench_app(database_path):
+    """
+    create_app("testing") against a fresh SQLite file, with all tables created: no log
+    file, no mail and tasks run inline, so a benchmark leaves nothing behind but its report.
+    """
+    from app import create_app
+    from config.config import engine_options
+    from extensions import db
+
+    # A generous busy timeout so concurrent writers wait for the lock instead of failing
+    url = f"sqlite:///{database_path}?timeout=30"
+    app = create_app("testing", {
+        "SQLALCHEMY_DATABASE_URI": url,
+        "SQLALCHEMY_ENGINE_OPTIONS": engine_options(url),
+        "SQLALCHEMY_BINDS": {},
+        "TESTING": False,  # errors become 500s, as in production, instead of propagating
+        "LOG_TO_FILE": False,
+        "MAIL_SUPPRESS_SEND": True,
+        "CELERY_TASK_MODE": "eager",
+        "SQL_QUERY_BUDGET_STRICT": False,  # measure, do not fail, requests over the budget
+    })
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def seed_database(app, airports=50, airplanes=20, flights=5000, users=100, bookings=2000,
+                  days=30, seed=42):
+    """
+    Fill the database with a deterministic dataset of the given size.
+
+    Returns a context dict used by the scenarios: routes, flight ids, user ids and
+    the admin id. All users share one password hash (BENCH_PASSWORD).
+    """
+    from sqlalchemy import insert
+    from extensions import db
+    from models import Airport, Airplane, Flight, User, Booking, Passenger, SeatInventory, Wallet
+    from models.enums import (
+        UserRole, Gender, FlightStatus, FlightClass, BookingStatusEnum, PassengerStatusEnum
+    )
+    from security.password_utils import password_hasher
+
+    rng = random.Random(seed)
+    start = (datetime.utcnow() + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    with app.app_context():
+        db.session.execute(insert(Airport), [
+            {"name": f"Airport {i}", "city": f"City {i}", "country": "Benchland",
+             "airport_code": f"{chr(65 + i // 676 % 26)}{chr(65 + i // 26 % 26)}{chr(65 + i % 26)}"}
+            for i in range(airports)
+        ])
+        db.session.execute(insert(Airplane), [
+            {"airplane_number": f"BN{i:04d}", "model": rng.choice(["A320", "A321", "B737", "B787"]),
+             "total_seats": 180, "economy_seats": 150, "business_seats": 24, "first_class_seats": 6}
+            for i in range(airplanes)
+        ])
+        airport_ids = list(db.session.scalars(db.select(Airport.id)))
+        airplane_ids = list(db.session.scalars(db.select(Airplane.id)))
+
+        password_hash = password_hasher.hash(BENCH_PASSWORD)
+        user_rows = [
+            {"name": f"User {i}", "email": f"user{i}@bench.example", "password": password_hash,
+             "role": UserRole.USER, "gender": Gender.O, "mobile_number": f"9{i:09d}"}
+            for i in range(users)
+        ]
+        user_rows.append({"name": "Admin", "email": "admin@bench.example", "password": password_hash,
+                          "role": UserRole.ADMIN, "gender": Gender.O, "mobile_number": "8000000000"})
+        db.session.execute(insert(User), user_rows)
+        user_ids = list(db.session.scalars(db.select(User.id).where(User.role == UserRole.USER)))
+        admin_id = db.session.scalar(db.select(User.id).where(User.role == UserRole.ADMIN))
+        # Bookings are paid from the wallet; fund every user well beyond what a run can spend
+        db.session.execute(insert(Wallet), [
+            {"user_id": user_id, "balance": WALLET_BALANCE} for user_id in user_ids
+        ])
+
+        flight_rows = []
+        for i in range(flights):
+            departure_airport_id, arrival_airport_id = rng.sample(airport_ids, 2)
+            departure_time = start + timedelta(days=rng.randrange(days), minutes=rng.randrange(0, 24 * 60, 5))
+            flight_rows.append({
+                "flight_number": f"BN{i:06d}",
+                "airplane_id": rng.choice(airplane_ids),
+                "departure_airport_id": departure_airport_id,
+                "arrival_airport_id": arrival_airport_id,
+                "departure_time": departure_time,
+                "arrival_time": departure_time + timedelta(minutes=rng.randrange(45, 600, 5)),
+                "status": FlightStatus.ACTIVE.value,
+                "price": Decimal(rng.randrange(5000, 90000)) / 100,
+            })
+        flight_ids = db.session.scalars(
+            insert(Flight).returning(Flight.id, sort_by_parameter_order=True), flight_rows
+        ).all()
+
+        booking_rows, party_sizes = [], []
+        booked = Counter()
+        for i in range(bookings):
+            flight_id = rng.choice(flight_ids)
+            party_size = rng.randint(1, 3)
+            if booked[flight_id] + party_size > 150:
+                continue
+            booked[flight_id] += party_size
+            party_sizes.append(party_size)
+            booking_rows.append({
+                "user_id": rng.choice(user_ids), "flight_id": flight_id,
+                "booking_time": start - timedelta(minutes=i), "status": BookingStatusEnum.CONFIRMED,
+                "total_price": Decimal("100.00") * party_size,
+            })
+        if booking_rows:
+            booking_ids = db.session.scalars(
+                insert(Booking).returning(Booking.id, sort_by_parameter_order=True), booking_rows
+            ).all()
+            db.session.execute(insert(Passenger), [
+                {"booking_id": booking_id, "first_name": "Bench", "last_name": f"Passenger{n}",
+                 "gender": "O", "age": 30, "flight_class": FlightClass.ECONOMY,
+                 "status": PassengerStatusEnum.BOOKED}
+                for booking_id, party_size in zip(booking_ids, party_sizes) for n in range(party_size)
+            ])
+
+        # Economy inventory reflects the seeded bookings
+        db.session.execute(insert(SeatInventory), [
+            {"flight_id": flight_id, "flight_class": flight_class, "total_seats": seats,
+             "seats_remaining": seats - booked[flight_id] if flight_class == FlightClass.ECONOMY else seats}
+            for flight_id in flight_ids
+            for flight_class, seats in ((FlightClass.ECONOMY, 150), (FlightClass.BUSINESS, 24),
+                                        (FlightClass.FIRST_CLASS, 6))
+        ])
+        db.session.commit()
+
+        routes = sorted({(row["departure_airport_id"], row["arrival_airport_id"]) for row in flight_rows})
+        return {
+            "airport_ids": airport_ids,
+            "flight_ids": flight_ids,
+            "routes": routes,
+            "user_ids": user_ids,
+            "admin_id": admin_id,
+            "start": start,
+            "days": days,
+        }
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def latency_summary(latencies):
+    """p50/p95/p99/max in milliseconds for a list of latencies in seconds."""
+    values = sorted(latencies)
+
+    def ms(value):
+        return round(value * 1000, 2) if value is not None else None
+
+    return {
+        "count": len(values),
+        "p50_ms": ms(percentile(values, 0.50)),
+        "p95_ms": ms(percentile(values, 0.95)),
+        "p99_ms": ms(percentile(values, 0.99)),
+        "max_ms": ms(values[-1] if values else None),
+    }
+
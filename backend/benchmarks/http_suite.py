@@ -0,0 +1,271 @@
+# backend/benchmarks/http_suite.py
+# End-to-end HTTP benchmarks for the hot paths: flight search, bookings, login and lists.
+#
+#     python -m benchmarks.http_suite --flights 20000 --concurrency 1 8 32 --output run.json
+#
+# Boots create_app("testing") against a throwaway SQLite database seeded with a deterministic
+# dataset (see benchmarks.common.seed_database), then replays weighted request mixes
+# through the Flask test client at each concurrency level and reports p50/p95/p99
+# latency and throughput per mix and per scenario. The JSON output is stable for a
+# given seed and arguments, so two runs can be diffed to spot regressions.
+#
+# An "oversell" check also fires concurrent bookings at a flight with a few seats
+# left and reports whether more seats were sold than existed.
+
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from benchmarks.common import BENCH_PASSWORD, create_bench_app, seed_database, latency_summary
+
+
+# --- Scenarios: (client, rng, ctx) -> response ---
+
+def _route(rng, ctx):
+    return rng.choice(ctx["routes"])
+
+
+def search(client, rng, ctx):
+    departure_airport_id, arrival_airport_id = _route(rng, ctx)
+    return client.get(f"/api/flights/search?departure_airport_id={departure_airport_id}"
+                      f"&arrival_airport_id={arrival_airport_id}")
+
+
+def search_expanded(client, rng, ctx):
+    departure_airport_id, arrival_airport_id = _route(rng, ctx)
+    departure_time = ctx["start"] + timedelta(days=rng.randrange(ctx["days"]))
+    return client.get(f"/api/flights/search?departure_airport_id={departure_airport_id}"
+                      f"&arrival_airport_id={arrival_airport_id}"
+                      f"&departure_time={departure_time:%Y-%m-%dT%H:%M:%S}&expand=1")
+
+
+def itineraries(client, rng, ctx):
+    departure_airport_id, arrival_airport_id = rng.sample(ctx["airport_ids"], 2)
+    date = ctx["start"] + timedelta(days=rng.randrange(ctx["days"]))
+    return client.get(f"/api/flights/itineraries?date={date:%Y-%m-%d}&max_stops=1"
+                      f"&departure_airport_id={departure_airport_id}&arrival_airport_id={arrival_airport_id}")
+
+
+def flight_list(client, rng, ctx):
+    return client.get("/api/flights/?limit=50")
+
+
+def airport_list(client, rng, ctx):
+    return client.get("/api/airports/?limit=50")
+
+
+def airplane_list(client, rng, ctx):
+    return client.get("/api/airplanes/?limit=50")
+
+
+def user_bookings(client, rng, ctx):
+    user_id = rng.choice(ctx["user_ids"])
+    return client.get("/api/bookings/user?limit=20", headers=ctx["headers"][user_id])
+
+
+def admin_bookings(client, rng, ctx):
+    return client.get("/api/bookings/?limit=50", headers=ctx["admin_headers"])
+
+
+def create_booking(client, rng, ctx):
+    user_id = rng.choice(ctx["user_ids"])
+    return client.post("/api/bookings/", headers=ctx["headers"][user_id], json={
+        "flight_id": rng.choice(ctx["flight_ids"]),
+        "total_price": "100.00",
+        "passengers": [{"first_name": "Bench", "last_name": "Traveller", "gender": "O", "age": 30}],
+    })
+
+
+def login(client, rng, ctx):
+    user_id = rng.choice(ctx["user_ids"])
+    return client.post("/api/auth/login", json={"email": ctx["emails"][user_id], "password": BENCH_PASSWORD})
+
+
+SCENARIOS = {fn.__name__: fn for fn in (
+    search, search_expanded, itineraries, flight_list, airport_list, airplane_list,
+    user_bookings, admin_bookings, create_booking, login,
+)}
+
+# Request mixes as scenario weights
+MIXES = {
+    "search": {"search": 6, "search_expanded": 2, "itineraries": 1, "flight_list": 1},
+    "browse": {"search": 3, "flight_list": 3, "airport_list": 2, "airplane_list": 1,
+               "user_bookings": 2, "admin_bookings": 1},
+    "booking": {"search": 5, "create_booking": 3, "user_bookings": 2},
+    "login": {"login": 1},
+}
+
+
+def _prepare_context(app, data, token_users):
+    from flask_jwt_extended import create_access_token
+
+    ctx = dict(data)
+    ctx["user_ids"] = data["user_ids"][:token_users]
+    with app.app_context():
+        ctx["headers"] = {
+            user_id: {"Authorization": f"Bearer {create_access_token(identity=user_id)}"}
+            for user_id in ctx["user_ids"]
+        }
+        ctx["admin_headers"] = {"Authorization": f"Bearer {create_access_token(identity=data['admin_id'])}"}
+    ctx["emails"] = {user_id: f"user{user_id - data['user_ids'][0]}@bench.example" for user_id in ctx["user_ids"]}
+    return ctx
+
+
+def run_mix(app, ctx, mix_name, requests, concurrency, seed):
+    weights = MIXES[mix_name]
+    names, cumulative = list(weights), []
+    total = 0
+    for name in names:
+        total += weights[name]
+        cumulative.append(total)
+
+    plan_rng = random.Random(f"{seed}:{mix_name}:{concurrency}")
+    plan = [plan_rng.choices(names, cum_weights=cumulative)[0] for _ in range(requests)]
+    local = threading.local()
+
+    def execute(index):
+        if not hasattr(local, "client"):
+            local.client = app.test_client()
+        rng = random.Random(f"{seed}:{mix_name}:{index}")
+        scenario = plan[index]
+        started = time.perf_counter()
+        response = SCENARIOS[scenario](local.client, rng, ctx)
+        latency = time.perf_counter() - started
+        response.close()
+        return scenario, response.status_code, latency
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(execute, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    by_scenario = defaultdict(list)
+    statuses = defaultdict(Counter)
+    for scenario, status, latency in results:
+        by_scenario[scenario].append(latency)
+        statuses[scenario][status] += 1
+
+    server_errors = sum(1 for _, status, _ in results if status >= 500)
+    return {
+        "mix": mix_name,
+        "concurrency": concurrency,
+        "requests": requests,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 2),
+        "server_errors": server_errors,
+        "latency": latency_summary([latency for _, _, latency in results]),
+        "scenarios": {
+            name: {**latency_summary(by_scenario[name]), "status_codes": dict(sorted(statuses[name].items()))}
+            for name in sorted(by_scenario)
+        },
+    }
+
+
+def run_oversell_check(app, ctx, seats, attempts, concurrency):
+    """Fire `attempts` single-seat bookings at a flight with `seats` economy seats left."""
+    from extensions import db
+    from models import SeatInventory
+    from models.enums import FlightClass
+
+    flight_id = ctx["flight_ids"][-1]
+    with app.app_context():
+        inventory = SeatInventory.query.filter_by(flight_id=flight_id, flight_class=FlightClass.ECONOMY).one()
+        inventory.seats_remaining = seats
+        db.session.commit()
+
+    def book(index):
+        user_id = ctx["user_ids"][index % len(ctx["user_ids"])]
+        response = app.test_client().post("/api/bookings/", headers=ctx["headers"][user_id], json={
+            "flight_id": flight_id,
+            "total_price": "100.00",
+            "passengers": [{"first_name": "Bench", "last_name": "Rush", "gender": "O", "age": 30}],
+        })
+        return response.status_code
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        statuses = Counter(executor.map(book, range(attempts)))
+
+    with app.app_context():
+        remaining = SeatInventory.query.filter_by(flight_id=flight_id, flight_class=FlightClass.ECONOMY).one()
+        seats_remaining = remaining.seats_remaining
+
+    accepted = statuses.get(201, 0)
+    return {
+        "seats": seats,
+        "attempts": attempts,
+        "concurrency": concurrency,
+        "status_codes": dict(sorted(statuses.items())),
+        "accepted": accepted,
+        "seats_remaining": seats_remaining,
+        "oversold": accepted > seats or seats_remaining < 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP benchmark suite for search, booking, login and lists.")
+    parser.add_argument("--airports", type=int, default=50)
+    parser.add_argument("--airplanes", type=int, default=20)
+    parser.add_argument("--flights", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--bookings", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=30, help="days of schedule to generate")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--mixes", nargs="+", choices=sorted(MIXES), default=sorted(MIXES))
+    parser.add_argument("--requests", type=int, default=500, help="requests per mix and concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--warmup", type=int, default=50, help="unrecorded requests per mix before measuring")
+    parser.add_argument("--skip-oversell", action="store_true")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        app = create_bench_app(os.path.join(workdir, "bench.db"))
+        seeding_started = time.perf_counter()
+        data = seed_database(app, airports=args.airports, airplanes=args.airplanes, flights=args.flights,
+                             users=args.users, bookings=args.bookings, days=args.days, seed=args.seed)
+        seeding_seconds = time.perf_counter() - seeding_started
+        ctx = _prepare_context(app, data, token_users=min(args.users, 50))
+
+        results = []
+        for mix_name in args.mixes:
+            if args.warmup:
+                run_mix(app, ctx, mix_name, args.warmup, 1, args.seed)
+            for concurrency in args.concurrency:
+                results.append(run_mix(app, ctx, mix_name, args.requests, concurrency, args.seed))
+
+        oversell = None
+        if not args.skip_oversell:
+            oversell = run_oversell_check(app, ctx, seats=10, attempts=100, concurrency=max(args.concurrency))
+
+    report = json.dumps({
+        "benchmark": "http_suite",
+        "config": {
+            "dataset": {name: getattr(args, name) for name in
+                        ("airports", "airplanes", "flights", "users", "bookings", "days", "seed")},
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+        },
+        "seeding_seconds": round(seeding_seconds, 2),
+        "results": results,
+        "oversell": oversell,
+    }, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# backend/benchmarks/login_throughput.py
+# Login throughput for different password-hashing pool sizes.
+#
+#     python -m benchmarks.login_throughput --pool-sizes 1 2 4 8 --requests 200 --concurrency 16
+#
+# Boots the app against a throwaway SQLite database, registers one user and then fires
+# concurrent POST /api/auth/login requests through the Flask test client.
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import create_bench_app
+
+EMAIL = "bench@example.com"
+PASSWORD = "bench-password"
+
+
+def _register_user(app):
+    from services.auth_service import register_user
+    with app.app_context():
+        register_user({
+            "name": "Bench User",
+            "email": EMAIL,
+            "password": PASSWORD,
+            "role": "USER",
+            "gender": "O",
+            "mobile_number": "9999999999",
+        })
+
+
+def run(app, pool_size, requests, concurrency):
+    from security.password_utils import password_hasher
+
+    app.config["PASSWORD_HASH_POOL_SIZE"] = pool_size
+    password_hasher.init_app(app)
+
+    def login(_):
+        client = app.test_client()
+        started = time.perf_counter()
+        response = client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+        return response.status_code, time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(login, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for status, latency in results if status == 200)
+    return {
+        "pool_size": pool_size,
+        "requests": requests,
+        "concurrency": concurrency,
+        "status_codes": dict(Counter(status for status, _ in results)),
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2) if latencies else None,
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        app = create_bench_app(os.path.join(workdir, "bench.db"))
+        _register_user(app)
+        results = [run(app, pool_size, args.requests, args.concurrency) for pool_size in args.pool_sizes]
+
+    report = json.dumps({"benchmark": "login_throughput", "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
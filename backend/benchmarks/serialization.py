@@ -0,0 +1,99 @@
+# backend/benchmarks/serialization.py
+# Response serialization: per-request marshmallow schemas vs schemas/serializers.py.
+#
+#     python -m benchmarks.serialization --flights 5000 --bookings 2000 --repeat 5
+#
+# Seeds a throwaway SQLite database, loads each hot response type once and times dumping
+# it three ways: a new schema per call (the old route code), a shared schema instance and
+# the compiled dumper. Before timing, every fast path is checked to produce byte-identical
+# JSON (through the app's JSON provider) to the marshmallow output; a mismatch aborts.
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.common import create_bench_app, seed_database
+
+
+def _datasets():
+    from sqlalchemy.orm import selectinload
+    from models import Flight, Booking, Airplane
+    from schemas.flight_schemas import FlightResponseSchema, FlightDetailSchema
+    from schemas.booking_schemas import BookingSchema
+    from schemas.airplane_schemas import AirplaneResponseSchema
+    from services.flight_service import flight_details_query
+
+    return [
+        ("flights", FlightResponseSchema, Flight.query.order_by(Flight.id).all()),
+        ("flight_details", FlightDetailSchema, flight_details_query().order_by(Flight.id).all()),
+        ("bookings", BookingSchema,
+         Booking.query.options(selectinload(Booking.passengers)).order_by(Booking.id).all()),
+        ("airplanes", AirplaneResponseSchema, Airplane.query.order_by(Airplane.id).all()),
+    ]
+
+
+def _best_of(repeat, function):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run(app, repeat):
+    from schemas.serializers import schema, dumper
+
+    results = []
+    with app.app_context():
+        for name, schema_cls, objects in _datasets():
+            shared = schema(schema_cls, many=True)
+            compiled = dumper(schema_cls, many=True)
+
+            expected = app.json.dumps(schema_cls(many=True).dump(objects))
+            for label, output in (("shared", shared.dump(objects)), ("compiled", compiled(objects))):
+                if app.json.dumps(output) != expected:
+                    raise SystemExit(f"{name}: {label} output differs from marshmallow")
+
+            # The old routes built a schema per object when streaming and per page otherwise
+            per_call = _best_of(repeat, lambda: [schema_cls().dump(obj) for obj in objects])
+            per_page = _best_of(repeat, lambda: schema_cls(many=True).dump(objects))
+            shared_seconds = _best_of(repeat, lambda: shared.dump(objects))
+            compiled_seconds = _best_of(repeat, lambda: compiled(objects))
+            results.append({
+                "type": name,
+                "objects": len(objects),
+                "json_bytes": len(expected),
+                "new_schema_per_object_ms": round(per_call * 1000, 2),
+                "new_schema_per_page_ms": round(per_page * 1000, 2),
+                "shared_schema_ms": round(shared_seconds * 1000, 2),
+                "compiled_ms": round(compiled_seconds * 1000, 2),
+                "speedup_vs_marshmallow": round(per_page / compiled_seconds, 1) if compiled_seconds else None,
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--flights", type=int, default=5000)
+    parser.add_argument("--bookings", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per variant; the best is reported")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        app = create_bench_app(os.path.join(workdir, "bench.db"))
+        seed_database(app, flights=args.flights, bookings=args.bookings)
+        results = run(app, args.repeat)
+
+    report = json.dumps({"benchmark": "serialization", "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# backend/celery_app.py
+# Background tasks (booking emails, ...) on Celery.
+#
+# CELERY_TASK_MODE selects where tasks run:
+#   "broker" - sent to CELERY_BROKER_URL, executed by `celery -A celery_app.celery worker`
+#              Workers build the Flask app with the config named by FLASK_CONFIG (production,
+#              testing, development; default development) and must themselves run with
+#              CELERY_TASK_MODE=broker, e.g.
+#              FLASK_CONFIG=production CELERY_TASK_MODE=broker celery -A celery_app.celery worker
+#   "memory" - executed on an in-process thread pool; single-node dev, no broker needed
+#   "eager"  - executed inline by the caller; for tests
+#
+# Callers enqueue after their commit through enqueue(), which never fails the request:
+# a broker outage is logged and the task is lost, the booking is not.
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from celery import Celery, Task
+from celery.exceptions import Retry
+from celery.result import AsyncResult
+from celery.utils import uuid
+
+logger = logging.getLogger(__name__)
+
+
+class _LocalRunner:
+    """Runs tasks on a thread pool in this process, honouring retry countdowns."""
+
+    def __init__(self):
+        self._executor = None
+        self._flask_app = None
+
+    @property
+    def active(self):
+        return self._executor is not None
+
+    def start(self, flask_app, workers):
+        self.stop()
+        self._flask_app = flask_app
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="celery-local")
+
+    def stop(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def submit(self, task, args, kwargs, countdown=None, retries=0):
+        task_id = uuid()
+        job = (self._run, task, task_id, args, kwargs, retries)
+        if countdown:
+            timer = threading.Timer(countdown, self._submit_now, job)
+            timer.daemon = True
+            timer.start()
+        else:
+            self._submit_now(*job)
+        return AsyncResult(task_id, app=task.app)
+
+    def _submit_now(self, *job):
+        executor = self._executor
+        if executor is not None:
+            executor.submit(*job)
+
+    def _run(self, task, task_id, args, kwargs, retries):
+        # Same request context a worker would set up, so task.retry() works
+        task.push_request(id=task_id, args=args, kwargs=kwargs, retries=retries,
+                          called_directly=False, is_eager=False, delivery_info={})
+        try:
+            with self._flask_app.app_context():
+                task.run(*args, **kwargs)
+        except Retry:
+            pass  # already rescheduled through apply_async
+        except Exception:
+            logger.exception("Task %s[%s] failed after %s retries.", task.name, task_id, retries)
+        finally:
+            task.pop_request()
+
+
+_local_runner = _LocalRunner()
+
+
+class AppTask(Task):
+    """Runs inside a Flask app context; goes to the local runner in "memory" mode."""
+
+    abstract = True
+
+    def __call__(self, *args, **kwargs):
+        if self.app.flask_app is None:
+            # Worker process: build the app once, which calls init_celery()
+            from app import create_app
+            app = create_app(os.getenv("FLASK_CONFIG", "development"))
+            if app.config.get("CELERY_TASK_MODE") != "broker":
+                # Any other mode repoints this worker's broker_url at memory:// or runs
+                # retries in-process, so its tasks would silently go nowhere
+                self.app.flask_app = None
+                raise RuntimeError("Celery workers must run with CELERY_TASK_MODE=broker.")
+        with self.app.flask_app.app_context():
+            return super().__call__(*args, **kwargs)
+
+    def apply_async(self, args=None, kwargs=None, **options):
+        if _local_runner.active:
+            return _local_runner.submit(self, tuple(args or ()), dict(kwargs or {}),
+                                        options.get("countdown"), options.get("retries", 0))
+        return super().apply_async(args, kwargs, **options)
+
+
+celery = Celery("flight_reservation", task_cls=AppTask, include=["tasks.email_tasks"])
+celery.flask_app = None
+
+
+def init_celery(app):
+    """Initialize Celery with the app's configuration."""
+    mode = app.config.get("CELERY_TASK_MODE", "memory")
+    if mode not in ("broker", "memory", "eager"):
+        raise ValueError(f"Unknown CELERY_TASK_MODE {mode!r}")
+
+    celery.flask_app = app
+    celery.conf.update(
+        broker_url=app.config.get("CELERY_BROKER_URL") if mode == "broker" else "memory://localhost/",
+        result_backend=app.config.get("CELERY_RESULT_BACKEND"),
+        task_ignore_result=True,
+        task_always_eager=mode == "eager",
+        task_acks_late=True,  # a worker crash redelivers the email instead of losing it
+        worker_prefetch_multiplier=1,
+        broker_connection_retry_on_startup=True,
+    )
+
+    if mode == "memory":
+        _local_runner.start(app, app.config.get("CELERY_LOCAL_WORKERS", 2))
+    else:
+        _local_runner.stop()
+
+    from tasks import email_tasks  # registers the tasks
+    email_tasks.configure(app)
+    return celery
+
+
+def enqueue(task, *args, **kwargs):
+    """Queue ``task``; call after the commit. Failures to enqueue are logged, not raised."""
+    try:
+        task.delay(*args, **kwargs)
+    except Exception:
+        logger.exception("Could not enqueue %s%s.", task.name, args)
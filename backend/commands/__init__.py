@@ -0,0 +1,13 @@
+# backend/commands/__init__.py
+# Flask CLI commands, e.g. `flask flights import schedule.csv`
+
+from commands.flight_commands import flights_cli
+from commands.reference_commands import airports_cli, airplanes_cli
+from commands.booking_commands import bookings_cli
+
+
+def register_commands(app):
+    app.cli.add_command(flights_cli)
+    app.cli.add_command(airports_cli)
+    app.cli.add_command(airplanes_cli)
+    app.cli.add_command(bookings_cli)
@@ -0,0 +1,17 @@
+# backend/commands/booking_commands.py
+
+import json
+
+import click
+from flask.cli import AppGroup
+
+from services.booking_hold_service import hold_sweeper
+
+bookings_cli = AppGroup("bookings", help="Booking maintenance.")
+
+
+@bookings_cli.command("expire-holds")
+@click.option("--batch-size", type=int, help="Bookings per transaction.")
+def expire_holds_command(batch_size):
+    """Cancel pending bookings whose seat hold has expired and release their seats."""
+    click.echo(json.dumps(hold_sweeper.sweep(batch_size=batch_size), indent=2))
@@ -0,0 +1,37 @@
+# backend/commands/flight_commands.py
+
+import json
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from services.flight_import_service import import_flights
+from services.flight_lifecycle_service import flight_lifecycle_job
+from utils.bulk_import import read_rows, format_from_path, FORMATS
+
+flights_cli = AppGroup("flights", help="Flight schedule management.")
+
+
+@flights_cli.command("import")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "fmt", type=click.Choice(FORMATS), help="Defaults to the file extension.")
+@click.option("--chunk-size", type=int, help="Rows per bulk insert.")
+def import_command(path, fmt, chunk_size):
+    """Bulk import flights from a CSV or JSONL file."""
+    fmt = fmt or format_from_path(path)
+    chunk_size = chunk_size or current_app.config["FLIGHT_IMPORT_CHUNK_SIZE"]
+
+    with open(path, "rb") as f:
+        report = import_flights(read_rows(f, fmt), chunk_size=chunk_size)
+    click.echo(json.dumps(report, indent=2))
+
+
+@flights_cli.command("advance-statuses")
+def advance_statuses_command():
+    """Run one flight status lifecycle tick (under the job lease)."""
+    counts = flight_lifecycle_job.tick()
+    if counts is None:
+        click.echo("Skipped: another node holds the flight lifecycle lease.")
+        return
+    click.echo(json.dumps(counts, indent=2))
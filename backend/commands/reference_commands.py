@@ -0,0 +1,40 @@
+# backend/commands/reference_commands.py
+
+import json
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from services.airport_service import bulk_upsert_airports
+from services.airplane_service import bulk_upsert_airplanes
+from utils.bulk_import import read_rows, format_from_path, FORMATS
+
+airports_cli = AppGroup("airports", help="Airport reference data.")
+airplanes_cli = AppGroup("airplanes", help="Airplane (fleet) reference data.")
+
+
+def _run_file_import(upsert, path, fmt, chunk_size):
+    fmt = fmt or format_from_path(path)
+    chunk_size = chunk_size or current_app.config["REFERENCE_IMPORT_CHUNK_SIZE"]
+    with open(path, "rb") as f:
+        report = upsert(read_rows(f, fmt), chunk_size=chunk_size)
+    click.echo(json.dumps(report, indent=2))
+
+
+@airports_cli.command("import")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "fmt", type=click.Choice(FORMATS), help="Defaults to the file extension.")
+@click.option("--chunk-size", type=int, help="Rows per batch.")
+def import_airports(path, fmt, chunk_size):
+    """Insert or update airports (matched on airport_code) from a CSV or JSONL file."""
+    _run_file_import(bulk_upsert_airports, path, fmt, chunk_size)
+
+
+@airplanes_cli.command("import")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "fmt", type=click.Choice(FORMATS), help="Defaults to the file extension.")
+@click.option("--chunk-size", type=int, help="Rows per batch.")
+def import_airplanes(path, fmt, chunk_size):
+    """Insert or update airplanes (matched on airplane_number) from a CSV or JSONL file."""
+    _run_file_import(bulk_upsert_airplanes, path, fmt, chunk_size)
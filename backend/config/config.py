@@ -3,22 +3,182 @@
 
 import os
 
+
+def engine_options(url):
+    """
+    SQLAlchemy create_engine() options for ``url`` from the DB_* environment variables.
+    Pool sizing is skipped for SQLite, whose pools do not take those arguments.
+    """
+    options = {
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+        "query_cache_size": int(os.getenv("DB_QUERY_CACHE_SIZE", "500")),  # compiled SQL cache
+    }
+    statement_cache_size = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))  # driver-side prepared statements
+
+    if (url or "").startswith("sqlite"):
+        options["connect_args"] = {"cached_statements": statement_cache_size}
+        return options
+
+    options.update(
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),  # seconds to wait for a free connection
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),  # seconds; below firewall/DB idle timeouts
+    )
+    if (url or "").startswith("oracle"):
+        options["connect_args"] = {"stmtcachesize": statement_cache_size}
+    return options
+
+
 class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+
+    # Optional read replica; read-only service calls are routed to it (see utils/db_routing.py)
+    DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+    SQLALCHEMY_BINDS = {
+        "replica": {"url": DATABASE_REPLICA_URL, **engine_options(DATABASE_REPLICA_URL)}
+    } if DATABASE_REPLICA_URL else {}
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "super-secret")
-    CELERY_BROKER_URL = 'your-celery-broker-url'
-    CELERY_RESULT_BACKEND = 'your-result-backend-url'
 
-    # TODO: Add DB config, caching, email config, etc.
+    # Background tasks: "broker" (CELERY_BROKER_URL + separate workers), "memory" (in-process
+    # thread pool, single-node dev) or "eager" (inline, tests). See celery_app.py
+    CELERY_TASK_MODE = os.getenv("CELERY_TASK_MODE", "memory")
+    CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/1")
+    CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND")  # results are not used; unset by default
+    CELERY_LOCAL_WORKERS = int(os.getenv("CELERY_LOCAL_WORKERS", "2"))  # "memory" mode threads
+    EMAIL_TASK_MAX_RETRIES = int(os.getenv("EMAIL_TASK_MAX_RETRIES", "5"))
+    EMAIL_TASK_RETRY_BACKOFF = int(os.getenv("EMAIL_TASK_RETRY_BACKOFF", "10"))  # seconds, doubles per retry
+    EMAIL_TASK_RETRY_BACKOFF_MAX = int(os.getenv("EMAIL_TASK_RETRY_BACKOFF_MAX", "600"))
+
+    # Outgoing mail (Flask-Mail)
+    MAIL_SERVER = os.getenv("MAIL_SERVER", "localhost")
+    MAIL_PORT = int(os.getenv("MAIL_PORT", "25"))
+    MAIL_USE_TLS = os.getenv("MAIL_USE_TLS", "false").lower() == "true"
+    MAIL_USE_SSL = os.getenv("MAIL_USE_SSL", "false").lower() == "true"
+    MAIL_USERNAME = os.getenv("MAIL_USERNAME")
+    MAIL_PASSWORD = os.getenv("MAIL_PASSWORD")
+    MAIL_DEFAULT_SENDER = os.getenv("MAIL_DEFAULT_SENDER", "no-reply@flights.example")
+    MAIL_SUPPRESS_SEND = os.getenv("MAIL_SUPPRESS_SEND", "false").lower() == "true"
+
+    # Password hashing: werkzeug method string (sets the cost) and the bounded hashing pool
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+    PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "thread")  # "thread" or "process"
+    PASSWORD_HASH_POOL_SIZE = int(os.getenv("PASSWORD_HASH_POOL_SIZE", "4"))
+    PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "32"))  # waiting hashes before shedding
+    PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", "5"))  # seconds
+
+    # Cursor pagination for list endpoints
+    PAGINATION_DEFAULT_LIMIT = int(os.getenv("PAGINATION_DEFAULT_LIMIT", "50"))
+    PAGINATION_MAX_LIMIT = int(os.getenv("PAGINATION_MAX_LIMIT", "200"))
+    STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", "500"))  # rows per DB fetch and per flushed chunk
+
+    # Bulk imports (flight schedules, airports, airplanes)
+    FLIGHT_IMPORT_CHUNK_SIZE = int(os.getenv("FLIGHT_IMPORT_CHUNK_SIZE", "1000"))
+    REFERENCE_IMPORT_CHUNK_SIZE = int(os.getenv("REFERENCE_IMPORT_CHUNK_SIZE", "1000"))
+    IMPORT_MAX_REPORTED_ERRORS = int(os.getenv("IMPORT_MAX_REPORTED_ERRORS", "1000"))
+
+    # In-memory route/date index used by /api/flights/search
+    FLIGHT_SEARCH_INDEX_ENABLED = os.getenv("FLIGHT_SEARCH_INDEX_ENABLED", "true").lower() == "true"
+    FLIGHT_SEARCH_INDEX_TTL = int(os.getenv("FLIGHT_SEARCH_INDEX_TTL", "60"))  # seconds, 0 = never expire
+
+    # Connecting-itinerary search over the in-memory flight graph
+    ITINERARY_GRAPH_TTL = int(os.getenv("ITINERARY_GRAPH_TTL", "300"))  # seconds, 0 = never rebuild
+    ITINERARY_MIN_LAYOVER_MINUTES = int(os.getenv("ITINERARY_MIN_LAYOVER_MINUTES", "45"))
+    ITINERARY_MAX_LAYOVER_MINUTES = int(os.getenv("ITINERARY_MAX_LAYOVER_MINUTES", "360"))
+    ITINERARY_MAX_RESULTS = 50
+
+    # Idempotency-Key support on POST /api/bookings/ and POST /api/flights/ (utils/idempotency.py)
+    IDEMPOTENCY_BACKEND = os.getenv("IDEMPOTENCY_BACKEND", "memory")  # "memory", "redis" or "local-redis"
+    IDEMPOTENCY_REDIS_URL = os.getenv("IDEMPOTENCY_REDIS_URL", os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0"))
+    IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))  # how long responses are replayed
+    IDEMPOTENCY_LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "30"))  # in-flight marker, if the owner dies
+    IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "10"))  # duplicates wait this long, then 409
+
+    # Pending-booking holds: seats are held this long until the booking is confirmed
+    # (0 = bookings are confirmed immediately). A background sweeper releases expired holds.
+    BOOKING_HOLD_TTL_SECONDS = int(os.getenv("BOOKING_HOLD_TTL_SECONDS", "900"))
+    BOOKING_HOLD_SWEEPER_ENABLED = os.getenv("BOOKING_HOLD_SWEEPER_ENABLED", "true").lower() == "true"
+    BOOKING_HOLD_SWEEP_INTERVAL = int(os.getenv("BOOKING_HOLD_SWEEP_INTERVAL", "30"))  # seconds
+    BOOKING_HOLD_SWEEP_BATCH_SIZE = int(os.getenv("BOOKING_HOLD_SWEEP_BATCH_SIZE", "500"))  # bookings per transaction
+
+    # Wallets: bookings are paid from the user's wallet in the booking transaction and
+    # refunded when cancelled or when their hold expires
+    WALLET_PAYMENTS_ENABLED = os.getenv("WALLET_PAYMENTS_ENABLED", "true").lower() == "true"
+    WALLET_MAX_DEPOSIT = int(os.getenv("WALLET_MAX_DEPOSIT", "100000"))  # per top-up
+
+    # Flight status lifecycle job (ACTIVE -> IN_PROGRESS -> COMPLETED by departure/arrival time).
+    # Runs on whichever node holds its database lease; the lease outlives a missed tick or two.
+    FLIGHT_LIFECYCLE_ENABLED = os.getenv("FLIGHT_LIFECYCLE_ENABLED", "true").lower() == "true"
+    FLIGHT_LIFECYCLE_INTERVAL = int(os.getenv("FLIGHT_LIFECYCLE_INTERVAL", "60"))  # seconds
+    FLIGHT_LIFECYCLE_LEASE_SECONDS = int(os.getenv("FLIGHT_LIFECYCLE_LEASE_SECONDS", "180"))
+
+    # Dynamic fares: base price x class multiplier x load-factor and last-minute surcharges
+    FARE_CLASS_MULTIPLIERS = os.getenv("FARE_CLASS_MULTIPLIERS", "ECONOMY=1.0,BUSINESS=2.5,FIRST_CLASS=4.0")
+    FARE_LOAD_FACTOR_WEIGHT = float(os.getenv("FARE_LOAD_FACTOR_WEIGHT", "1.0"))  # +100% when a class is full
+    FARE_LOAD_FACTOR_EXPONENT = float(os.getenv("FARE_LOAD_FACTOR_EXPONENT", "2.0"))
+    FARE_LAST_MINUTE_WEIGHT = float(os.getenv("FARE_LAST_MINUTE_WEIGHT", "0.5"))  # +50% at departure
+    FARE_LAST_MINUTE_DAYS = float(os.getenv("FARE_LAST_MINUTE_DAYS", "14"))  # decay of the surcharge
+
+    # Caching (Flask-Caching). CACHE_TYPE may be SimpleCache, FileSystemCache, RedisCache,
+    # or utils.cache_backends.LocalRedisCache (Redis code path without a server, for tests)
+    CACHE_TYPE = os.getenv("CACHE_TYPE", "SimpleCache")
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", "300"))
+    CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(os.getcwd(), "cache"))
+    CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+    CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", "frs:")
+    # Where cache versions live (utils/versioned_cache.py): "cache", "redis" or "local-redis".
+    # With "cache" and a per-process CACHE_TYPE, other workers see writes only after the timeout.
+    CACHE_VERSION_BACKEND = os.getenv("CACHE_VERSION_BACKEND", "cache")
+    CACHE_VERSION_REDIS_URL = os.getenv("CACHE_VERSION_REDIS_URL", CACHE_REDIS_URL)
+    REFERENCE_CACHE_TIMEOUT = int(os.getenv("REFERENCE_CACHE_TIMEOUT", "300"))  # airports/airplanes
+    FARE_CALENDAR_CACHE_TIMEOUT = int(os.getenv("FARE_CALENDAR_CACHE_TIMEOUT", "300"))  # also ages out past days
+
+    # Per-request SQL statement budget (0 = off). Over budget logs a warning, or fails
+    # the request when strict (enabled in TestingConfig to catch N+1 regressions)
+    SQL_QUERY_BUDGET = int(os.getenv("SQL_QUERY_BUDGET", "50"))
+    SQL_QUERY_BUDGET_STRICT = os.getenv("SQL_QUERY_BUDGET_STRICT", "false").lower() == "true"
+
+    # Logging: records go through an in-memory queue to a background writer thread
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT = os.getenv("LOG_FORMAT", "json")  # "json" or "text"
+    LOG_DIR = os.getenv("LOG_DIR")  # defaults to ./logs
+    LOG_TO_FILE = os.getenv("LOG_TO_FILE", "true").lower() == "true"
+    LOG_ROTATION = os.getenv("LOG_ROTATION", "size")  # "size" or "time"
+    LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(50 * 1024 * 1024)))
+    LOG_ROTATE_WHEN = os.getenv("LOG_ROTATE_WHEN", "midnight")  # TimedRotatingFileHandler "when"
+    LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "10"))
+    LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))  # records beyond this are dropped
+    LOG_SAMPLING = os.getenv("LOG_SAMPLING", "")  # e.g. "services.flight_service=0.1,werkzeug=0.5"
+
+    # Request metrics: /metrics (Prometheus text format) and the Server-Timing header
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_SERVER_TIMING = os.getenv("METRICS_SERVER_TIMING", "true").lower() == "true"
+    METRICS_AUTH_TOKEN = os.getenv("METRICS_AUTH_TOKEN")  # /metrics requires "Bearer <token>"
+    METRICS_PUBLIC = False  # without a token /metrics is only served where this is True
+
+    # TODO: Add DB config, etc.
 
 class DevelopmentConfig(Config):
     DEBUG = True
+    METRICS_PUBLIC = os.getenv("METRICS_PUBLIC", "true").lower() == "true"
 
 class ProductionConfig(Config):
     DEBUG = False
 
+class TestingConfig(Config):
+    TESTING = True
+    SQL_QUERY_BUDGET = int(os.getenv("SQL_QUERY_BUDGET", "20"))
+    SQL_QUERY_BUDGET_STRICT = True
+    CELERY_TASK_MODE = "eager"
+    BOOKING_HOLD_SWEEPER_ENABLED = False  # tests call hold_sweeper.sweep() directly
+    FLIGHT_LIFECYCLE_ENABLED = False
+    MAIL_SUPPRESS_SEND = True
+
 def get_config_class(env):
     if env == "production":
         return ProductionConfig
+    if env == "testing":
+        return TestingConfig
     return DevelopmentConfig
\ No newline at end of file
@@ -16,6 +16,34 @@ class InvalidEnumError(ApplicationError):
 class NotFoundError(ApplicationError):
     pass
 
+class SeatsUnavailableError(ApplicationError):
+    """Raised when a flight cannot hold all seats requested by a booking."""
+    pass
+
+class BookingHoldExpiredError(ApplicationError):
+    """Raised when confirming a pending booking whose seat hold has already expired."""
+    pass
+
+class InsufficientFundsError(ApplicationError):
+    """Raised when a wallet balance cannot cover a payment."""
+    pass
+
+class WalletNotFoundError(InsufficientFundsError):
+    """Raised when a payment is due from a user who has no wallet yet."""
+    pass
+
+class ReviewAlreadyExistsError(ApplicationError):
+    """Raised when a user reviews a flight they have already reviewed."""
+    pass
+
+class ServiceOverloadedError(ApplicationError):
+    """Raised when a bounded worker pool is saturated and the request is shed."""
+    pass
+
+class QueryBudgetExceededError(ApplicationError):
+    """Raised (in strict mode) when a request issues more SQL statements than SQL_QUERY_BUDGET."""
+    pass
+
 class BadRequestError(Exception):
     """Exception raised for invalid data or bad request."""
     def __init__(self, message):
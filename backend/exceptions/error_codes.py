@@ -5,3 +5,9 @@ USER_ALREADY_EXISTS = "Email or mobile number already exists"
 INVALID_ROLE_OR_GENDER = "Invalid role or gender"
 INTERNAL_SERVER_ERROR = "Internal server error"
 NOT_FOUND = "Resource not found"
+SEATS_UNAVAILABLE = "Not enough seats available on this flight"
+BOOKING_HOLD_EXPIRED = "The seat hold for this booking has expired"
+INSUFFICIENT_FUNDS = "Insufficient wallet balance"
+WALLET_NOT_FOUND = "No wallet found, add money to your wallet first"
+REVIEW_ALREADY_EXISTS = "You have already reviewed this flight"
+SERVICE_OVERLOADED = "Service is busy, please retry shortly"
@@ -8,12 +8,24 @@ from exceptions.custom_exceptions import (
     UserAlreadyExistsError,
     InvalidEnumError,
     NotFoundError,
+    SeatsUnavailableError,
+    BookingHoldExpiredError,
+    InsufficientFundsError,
+    WalletNotFoundError,
+    ReviewAlreadyExistsError,
+    ServiceOverloadedError,
 )
 from exceptions.error_codes import (
     INVALID_CREDENTIALS,
     USER_ALREADY_EXISTS,
     INVALID_ROLE_OR_GENDER,
     NOT_FOUND,
+    SEATS_UNAVAILABLE,
+    BOOKING_HOLD_EXPIRED,
+    INSUFFICIENT_FUNDS,
+    WALLET_NOT_FOUND,
+    REVIEW_ALREADY_EXISTS,
+    SERVICE_OVERLOADED,
     INTERNAL_SERVER_ERROR,
 )
 
@@ -45,6 +57,39 @@ def register_error_handlers(app):
     def handle_not_found(err):
         return jsonify({"status": "error", "message": NOT_FOUND}), 404
 
+    # Seats Unavailable handler
+    @app.errorhandler(SeatsUnavailableError)
+    def handle_seats_unavailable(err):
+        return jsonify({"status": "error", "message": str(err) or SEATS_UNAVAILABLE}), 409
+
+    # Booking Hold Expired handler
+    @app.errorhandler(BookingHoldExpiredError)
+    def handle_booking_hold_expired(err):
+        return jsonify({"status": "error", "message": str(err) or BOOKING_HOLD_EXPIRED}), 409
+
+    # Insufficient Funds handler
+    @app.errorhandler(InsufficientFundsError)
+    def handle_insufficient_funds(err):
+        return jsonify({"status": "error", "message": str(err) or INSUFFICIENT_FUNDS}), 402
+
+    # Wallet Not Found handler (a payment is due but the user never opened a wallet)
+    @app.errorhandler(WalletNotFoundError)
+    def handle_wallet_not_found(err):
+        return jsonify({"status": "error", "message": str(err) or WALLET_NOT_FOUND}), 402
+
+    # Review Already Exists handler
+    @app.errorhandler(ReviewAlreadyExistsError)
+    def handle_review_exists(err):
+        return jsonify({"status": "error", "message": str(err) or REVIEW_ALREADY_EXISTS}), 409
+
+    # Service Overloaded handler (load shedding)
+    @app.errorhandler(ServiceOverloadedError)
+    def handle_service_overloaded(err):
+        response = jsonify({"status": "error", "message": str(err) or SERVICE_OVERLOADED})
+        response.status_code = 503
+        response.headers["Retry-After"] = "1"
+        return response
+
     # HTTP Exception handler
     @app.errorhandler(HTTPException)
     def handle_http_exception(err):
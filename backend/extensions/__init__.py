@@ -4,9 +4,10 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import JWTManager
 from flask_mail import Mail
 from flask_caching import Cache
+from utils.db_routing import RoutingSession
 # from celery import Celery  # Optional
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 jwt = JWTManager()
 mail = Mail()
 cache = Cache()
@@ -1,6 +1,14 @@
 # backend/models/__init__.py
 from models.user import User
+from models.airplane import Airplane
+from models.airport import Airport
+from models.flight import Flight
+from models.booking import Booking
+from models.passenger_model import Passenger
+from models.seat_inventory import SeatInventory
+from models.job_lease import JobLease
+from models.wallet import Wallet
+from models.transactions import WalletTransaction
+from models.review import Review, FlightRating, RouteRating
 
 # or from backend import models  # If backend/models/__init__.py imports all models
-
-# TODO: Import wallet_model, booking_model, etc. later
\ No newline at end of file
@@ -1,5 +1,6 @@
 # backend/models/airplane.py
 
+from datetime import datetime
 from extensions import db
 from sqlalchemy import Sequence
 
@@ -17,6 +18,7 @@ class Airplane(db.Model):
     economy_seats = db.Column(db.Integer, nullable=False)
     business_seats = db.Column(db.Integer, nullable=False)
     first_class_seats = db.Column(db.Integer, nullable=False)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)  # ETags
 
     def serialize(self):
         return {
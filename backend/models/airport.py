@@ -1,5 +1,6 @@
 # backend/models/airport.py
 
+from datetime import datetime
 from extensions import db
 from sqlalchemy import Sequence
 
@@ -15,6 +16,7 @@ class Airport(db.Model):
     city = db.Column(db.String(100), nullable=False)
     country = db.Column(db.String(100), nullable=False)
     airport_code = db.Column(db.String(3), unique=True, nullable=False)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)  # ETags
 
     def serialize(self):
         return {
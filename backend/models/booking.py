@@ -1,11 +1,16 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum, Numeric, Sequence
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum, Numeric, Sequence, Index
 from sqlalchemy.orm import relationship
 from extensions import db
 from models.enums import BookingStatusEnum
 
 class Booking(db.Model):
     __tablename__ = "bookings"
+    __table_args__ = (
+        Index("ix_bookings_time_id", "booking_time", "id"),
+        Index("ix_bookings_user_time_id", "user_id", "booking_time", "id"),
+        Index("ix_bookings_status_hold", "status", "hold_expires_at"),  # hold sweeper
+    )
 
     id = Column(
         Integer,
@@ -17,6 +22,7 @@ class Booking(db.Model):
     booking_time = Column(DateTime, default=datetime.utcnow)
     status = Column(Enum(BookingStatusEnum), default=BookingStatusEnum.PENDING)
     total_price = Column(Numeric(10, 2), nullable=False)
+    hold_expires_at = Column(DateTime, nullable=True)  # PENDING bookings release their seats after this
 
     # Relationships
     user = relationship("User", back_populates="bookings")
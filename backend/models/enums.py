@@ -15,10 +15,10 @@ class FlightStatus(str, Enum):
     COMPLETED = "COMPLETED"
     CANCELLED = "CANCELLED"
 
-# class FlightClass(str, Enum):
-#     ECONOMY = "ECONOMY"
-#     BUSINESS = "BUSINESS"
-#     FIRST_CLASS = "FIRST_CLASS"
+class FlightClass(str, Enum):
+    ECONOMY = "ECONOMY"
+    BUSINESS = "BUSINESS"
+    FIRST_CLASS = "FIRST_CLASS"
 
 class BookingStatusEnum(str, Enum):
     PENDING = "PENDING"
@@ -27,4 +27,8 @@ class BookingStatusEnum(str, Enum):
 
 class PassengerStatusEnum(str, Enum):
     BOOKED = "BOOKED"
-    CANCELLED = "CANCELLED"
\ No newline at end of file
+    CANCELLED = "CANCELLED"
+class TransactionType(str, Enum):
+    DEPOSIT = "DEPOSIT"
+    PAYMENT = "PAYMENT"  # booking paid from the wallet
+    REFUND = "REFUND"    # booking cancelled or its hold expired
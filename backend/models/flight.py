@@ -1,10 +1,15 @@
 # backend/models/flight.py
 
+from datetime import datetime
 from extensions import db
 from sqlalchemy import Sequence
 
 class Flight(db.Model):
     __tablename__ = 'flights'
+    __table_args__ = (
+        db.Index('ix_flights_route_departure', 'departure_airport_id', 'arrival_airport_id', 'departure_time'),
+        db.Index('ix_flights_departure_id', 'departure_time', 'id'),
+    )
 
     id = db.Column(
         db.Integer,
@@ -15,15 +20,17 @@ class Flight(db.Model):
     airplane_id = db.Column(db.Integer, db.ForeignKey('airplanes.id'), nullable=False)
     departure_airport_id = db.Column(db.Integer, db.ForeignKey('airports.id'), nullable=False)
     arrival_airport_id = db.Column(db.Integer, db.ForeignKey('airports.id'), nullable=False)
-    departure_time = db.Column(db.Date, nullable=False)
-    arrival_time = db.Column(db.Date, nullable=False)
+    departure_time = db.Column(db.DateTime, nullable=False)
+    arrival_time = db.Column(db.DateTime, nullable=False)
     status = db.Column(db.String(11), nullable=True)
     price = db.Column(db.Numeric(10, 2), nullable=False)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)  # ETags
 
     # Define relationships if needed
     airplane = db.relationship("Airplane", backref="flights")
     departure_airport = db.relationship("Airport", foreign_keys=[departure_airport_id])
     arrival_airport = db.relationship("Airport", foreign_keys=[arrival_airport_id])
+    bookings = db.relationship("Booking", back_populates="flight")
 
     def serialize(self):
         return {
@@ -0,0 +1,15 @@
+# backend/models/job_lease.py
+
+from extensions import db
+
+
+class JobLease(db.Model):
+    """Time-limited ownership of a scheduled job, so only one node runs it at a time (see utils/leases.py)."""
+    __tablename__ = 'job_leases'
+
+    name = db.Column(db.String(100), primary_key=True)
+    holder = db.Column(db.String(255), nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<JobLease {self.name} held by {self.holder} until {self.expires_at}>"
@@ -2,7 +2,7 @@ from datetime import datetime
 from sqlalchemy import Column, Integer, String, ForeignKey, Enum, DateTime, CHAR, Sequence
 from sqlalchemy.orm import relationship
 from extensions import db
-from models.enums import PassengerStatusEnum
+from models.enums import PassengerStatusEnum, FlightClass
 
 class Passenger(db.Model):
     __tablename__ = "passengers"
@@ -17,6 +17,7 @@ class Passenger(db.Model):
     last_name = Column(String(100), nullable=False)
     gender = Column(CHAR(1), nullable=False)
     age = Column(Integer, nullable=False)
+    flight_class = Column(Enum(FlightClass), nullable=False, default=FlightClass.ECONOMY)
     status = Column(Enum(PassengerStatusEnum), default=PassengerStatusEnum.BOOKED)
     cancellation_time = Column(DateTime, default=None, nullable=True)
 
@@ -0,0 +1,67 @@
+# backend/models/review.py
+
+from datetime import datetime
+from extensions import db
+from sqlalchemy import Sequence, CheckConstraint, UniqueConstraint, Index
+
+RATINGS = (1, 2, 3, 4, 5)
+
+
+class Review(db.Model):
+    __tablename__ = 'reviews'
+    __table_args__ = (
+        UniqueConstraint('user_id', 'flight_id', name='uq_reviews_user_flight'),  # one review per flight
+        CheckConstraint('rating BETWEEN 1 AND 5', name='ck_reviews_rating_range'),
+        Index('ix_reviews_flight_time_id', 'flight_id', 'created_at', 'id'),
+        Index('ix_reviews_user_time_id', 'user_id', 'created_at', 'id'),
+    )
+
+    id = db.Column(
+        db.Integer,
+        Sequence('reviews_id_seq', start=1, increment=1),
+        primary_key=True
+    )
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    flight_id = db.Column(db.Integer, db.ForeignKey('flights.id'), nullable=False)
+    rating = db.Column(db.Integer, nullable=False)
+    comment = db.Column(db.String(2000), nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<Review {self.rating}/5 flight={self.flight_id} user={self.user_id}>"
+
+
+class RatingTotals:
+    """Running totals of the reviews in one scope (count, sum and one counter per star rating).
+
+    Adjusted by services/review_service.py in the same transaction as every review
+    insert, update and delete, so reading a rating never scans the reviews.
+    """
+    review_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+    rating_1 = db.Column(db.Integer, nullable=False, default=0)
+    rating_2 = db.Column(db.Integer, nullable=False, default=0)
+    rating_3 = db.Column(db.Integer, nullable=False, default=0)
+    rating_4 = db.Column(db.Integer, nullable=False, default=0)
+    rating_5 = db.Column(db.Integer, nullable=False, default=0)
+
+
+class FlightRating(RatingTotals, db.Model):
+    __tablename__ = 'flight_ratings'
+
+    flight_id = db.Column(db.Integer, db.ForeignKey('flights.id'), primary_key=True)
+
+    def __repr__(self):
+        return f"<FlightRating flight={self.flight_id} {self.rating_sum}/{self.review_count}>"
+
+
+class RouteRating(RatingTotals, db.Model):
+    __tablename__ = 'route_ratings'
+
+    departure_airport_id = db.Column(db.Integer, db.ForeignKey('airports.id'), primary_key=True)
+    arrival_airport_id = db.Column(db.Integer, db.ForeignKey('airports.id'), primary_key=True)
+
+    def __repr__(self):
+        return (f"<RouteRating {self.departure_airport_id}->{self.arrival_airport_id} "
+                f"{self.rating_sum}/{self.review_count}>")
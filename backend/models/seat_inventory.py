@@ -0,0 +1,45 @@
+# backend/models/seat_inventory.py
+
+from extensions import db
+from sqlalchemy import Sequence, Enum as SqlEnum, UniqueConstraint, CheckConstraint
+from models.enums import FlightClass
+
+
+class SeatInventory(db.Model):
+    """Remaining seats for one class on one flight.
+
+    Rows are decremented with a conditional UPDATE when a booking is made, so
+    capacity checks never have to count passengers.
+    """
+    __tablename__ = 'seat_inventory'
+    __table_args__ = (
+        UniqueConstraint('flight_id', 'flight_class', name='uq_seat_inventory_flight_class'),
+        CheckConstraint('seats_remaining >= 0', name='ck_seat_inventory_non_negative'),
+        CheckConstraint('seats_remaining <= total_seats', name='ck_seat_inventory_capacity'),
+    )
+
+    id = db.Column(
+        db.Integer,
+        Sequence('seat_inventory_id_seq', start=1, increment=1),
+        primary_key=True
+    )
+    flight_id = db.Column(db.Integer, db.ForeignKey('flights.id'), nullable=False, index=True)
+    flight_class = db.Column(SqlEnum(FlightClass), nullable=False)
+    total_seats = db.Column(db.Integer, nullable=False)
+    seats_remaining = db.Column(db.Integer, nullable=False)
+
+    flight = db.relationship(
+        "Flight",
+        backref=db.backref("seat_inventory", cascade="all, delete-orphan")
+    )
+
+    def serialize(self):
+        return {
+            "flight_id": self.flight_id,
+            "flight_class": self.flight_class.value,
+            "total_seats": self.total_seats,
+            "seats_remaining": self.seats_remaining
+        }
+
+    def __repr__(self):
+        return f"<SeatInventory flight={self.flight_id} {self.flight_class.value}: {self.seats_remaining}>"
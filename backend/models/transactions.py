@@ -0,0 +1,35 @@
+# backend/models/transactions.py
+
+from datetime import datetime
+from extensions import db
+from sqlalchemy import Sequence, CheckConstraint, Index, Enum as SqlEnum
+from models.enums import TransactionType
+
+
+class WalletTransaction(db.Model):
+    """One entry of a wallet's append-only ledger.
+
+    Rows are only ever inserted, in the same transaction as the matching change to
+    Wallet.balance; ``balance_after`` is the wallet balance right after this entry.
+    """
+    __tablename__ = 'wallet_transactions'
+    __table_args__ = (
+        CheckConstraint('amount > 0', name='ck_wallet_transactions_amount_positive'),
+        Index('ix_wallet_transactions_wallet_time_id', 'wallet_id', 'created_at', 'id'),
+    )
+
+    id = db.Column(
+        db.Integer,
+        Sequence('wallet_transactions_id_seq', start=1, increment=1),
+        primary_key=True
+    )
+    wallet_id = db.Column(db.Integer, db.ForeignKey('wallets.id'), nullable=False)
+    type = db.Column(SqlEnum(TransactionType), nullable=False)
+    amount = db.Column(db.Numeric(12, 2), nullable=False)  # always positive; type gives the direction
+    balance_after = db.Column(db.Numeric(12, 2), nullable=False)
+    booking_id = db.Column(db.Integer, db.ForeignKey('bookings.id'), nullable=True, index=True)
+    description = db.Column(db.String(255), nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<WalletTransaction {self.type.value} {self.amount} wallet={self.wallet_id}>"
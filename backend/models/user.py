@@ -23,6 +23,8 @@ class User(db.Model):
     mobile_number = db.Column(db.String(10), nullable=False, unique=True)
     created_at = db.Column(db.Date, default=db.func.current_date())
 
+    bookings = db.relationship("Booking", back_populates="user")
+
     def __repr__(self):
         return f"<User {self.email}>"
     
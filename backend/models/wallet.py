@@ -0,0 +1,29 @@
+# backend/models/wallet.py
+
+from datetime import datetime
+from extensions import db
+from sqlalchemy import Sequence, CheckConstraint
+
+
+class Wallet(db.Model):
+    """A user's wallet. ``balance`` is a snapshot maintained alongside every ledger entry
+    (see models/transactions.py), so reading it never sums the transaction history."""
+    __tablename__ = 'wallets'
+    __table_args__ = (
+        CheckConstraint('balance >= 0', name='ck_wallets_balance_non_negative'),
+    )
+
+    id = db.Column(
+        db.Integer,
+        Sequence('wallets_id_seq', start=1, increment=1),
+        primary_key=True
+    )
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, unique=True)
+    balance = db.Column(db.Numeric(12, 2), nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    user = db.relationship("User", backref=db.backref("wallet", uselist=False))
+
+    def __repr__(self):
+        return f"<Wallet user={self.user_id} balance={self.balance}>"
@@ -6,3 +6,7 @@ from routes.auth_routes import auth_bp
 from routes.airplane_routes import airplane_bp
 from routes.airport_routes import airport_bp
 from routes.flight_routes import flight_bp
+from routes.booking_routes import booking_bp
+from routes.wallet_routes import wallet_bp
+from routes.review_routes import review_bp
+from routes.metrics_routes import metrics_bp
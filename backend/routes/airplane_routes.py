@@ -1,13 +1,15 @@
 # backend/routes/airplane_routes.py
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from services.airplane_service import (
-    create_airplane, get_all_airplanes, get_airplane_by_id,
-    update_airplane, delete_airplane
+    create_airplane, list_airplane_data, get_airplane_data,
+    update_airplane, delete_airplane, bulk_upsert_airplanes, airplanes_validator
 )
-from schemas.airplane_schemas import AirplaneResponseSchema
 from exceptions.custom_exceptions import BadRequestError
+from utils.pagination import get_page_args, page_response
+from utils.bulk_import import rows_from_request
+from utils.conditional import conditional
 
 airplane_bp = Blueprint("airplanes", __name__, url_prefix="/api/airplanes")
 
@@ -31,12 +33,38 @@ def create():
         raise e
 
 
+@airplane_bp.route("/import", methods=["POST"])
+@jwt_required()
+def bulk_import():
+    """Insert or update airplanes (by airplane_number) from a CSV or JSONL upload."""
+    try:
+        claims = get_jwt()
+        if claims.get("role") != "ADMIN":
+            raise BadRequestError("Unauthorized: Only admins can import airplanes.")
+
+        chunk_size = request.args.get(
+            "chunk_size", current_app.config["REFERENCE_IMPORT_CHUNK_SIZE"], type=int)
+        report = bulk_upsert_airplanes(
+            rows_from_request(),
+            chunk_size=chunk_size,
+            max_reported_errors=current_app.config["IMPORT_MAX_REPORTED_ERRORS"]
+        )
+        return jsonify(report), 200
+    except BadRequestError as bre:
+        return jsonify({"error": str(bre)}), 400
+    except Exception as e:
+        raise e
+
+
 @airplane_bp.route("/", methods=["GET"])
+@conditional(airplanes_validator)
 def list_airplanes():
     try:
-        airplanes = get_all_airplanes()
-        response = AirplaneResponseSchema(many=True).dump(airplanes)
-        return jsonify(response), 200
+        limit, cursor = get_page_args()
+        page = list_airplane_data(limit, cursor)
+        return jsonify(page_response(page["items"], page["next_cursor"])), 200
+    except BadRequestError as bre:
+        return jsonify({"error": str(bre)}), 400
     except Exception as e:
         raise e
 
@@ -44,8 +72,8 @@ def list_airplanes():
 @airplane_bp.route("/<int:airplane_id>", methods=["GET"])
 def get_by_id(airplane_id):
     try:
-        airplane = get_airplane_by_id(airplane_id)
-        return jsonify(airplane.serialize()), 200
+        airplane = get_airplane_data(airplane_id)
+        return jsonify(airplane), 200
     except Exception as e:
         raise e
 
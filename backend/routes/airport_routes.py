@@ -1,16 +1,21 @@
 # backend/routes/airport_routes.py
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
 from services.airport_service import (
     create_airport,
-    get_airport_by_id,
-    get_airport_by_code,
+    list_airport_data,
+    get_airport_data,
+    get_airport_data_by_code,
     update_airport,
-    delete_airport
+    delete_airport,
+    bulk_upsert_airports,
+    airports_validator
 )
-from models.airport import Airport
 from exceptions.custom_exceptions import BadRequestError
+from utils.pagination import get_page_args, page_response
+from utils.bulk_import import rows_from_request
+from utils.conditional import conditional
 import logging
 
 airport_bp = Blueprint("airports", __name__, url_prefix="/api/airports")
@@ -41,12 +46,35 @@ def create():
         raise e
 
 
+@airport_bp.route("/import", methods=["POST"])
+@jwt_required()
+def bulk_import():
+    """Insert or update airports (by airport_code) from a CSV or JSONL upload."""
+    try:
+        is_admin()
+        chunk_size = request.args.get(
+            "chunk_size", current_app.config["REFERENCE_IMPORT_CHUNK_SIZE"], type=int)
+        report = bulk_upsert_airports(
+            rows_from_request(),
+            chunk_size=chunk_size,
+            max_reported_errors=current_app.config["IMPORT_MAX_REPORTED_ERRORS"]
+        )
+        return jsonify(report), 200
+    except BadRequestError as bre:
+        return jsonify({"error": str(bre)}), 400
+    except Exception as e:
+        raise e
+
+
 @airport_bp.route("/", methods=["GET"])
+@conditional(airports_validator)
 def list_airports():
     try:
-        airports = Airport.query.all()
-        response = [airport.serialize() for airport in airports]
-        return jsonify(response), 200
+        limit, cursor = get_page_args()
+        page = list_airport_data(limit, cursor)
+        return jsonify(page_response(page["items"], page["next_cursor"])), 200
+    except BadRequestError as bre:
+        return jsonify({"error": str(bre)}), 400
     except Exception as e:
         logger.exception("Unexpected error while fetching airports.")
         raise e
@@ -55,10 +83,10 @@ def list_airports():
 @airport_bp.route("/<int:id>", methods=["GET"])
 def get_by_id(id):
     try:
-        airport = get_airport_by_id(id)
+        airport = get_airport_data(id)
         if not airport:
             return jsonify({"error": "Airport not found"}), 404
-        return jsonify(airport.serialize()), 200
+        return jsonify(airport), 200
     except Exception as e:
         raise e
 
@@ -66,10 +94,10 @@ def get_by_id(id):
 @airport_bp.route("/code/<string:code>", methods=["GET"])
 def get_by_code(code):
     try:
-        airport = get_airport_by_code(code.upper())
+        airport = get_airport_data_by_code(code.upper())
         if not airport:
             return jsonify({"error": "Airport not found"}), 404
-        return jsonify(airport.serialize()), 200
+        return jsonify(airport), 200
     except Exception as e:
         raise e
 
@@ -3,6 +3,8 @@ from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
 from services.auth_service import register_user, login_user
 from schemas.auth_schemas import RegisterSchema, LoginSchema, AuthResponseSchema
+from schemas.serializers import schema
+from exceptions.custom_exceptions import ServiceOverloadedError
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 
@@ -16,7 +18,7 @@ def register():
         logger.info(f"Registration attempt for email: {json_data.get('email')}")
 
         # Validate input
-        data = RegisterSchema().load(json_data)
+        data = schema(RegisterSchema).load(json_data)
 
         # Process
         user = register_user(data)
@@ -24,7 +26,7 @@ def register():
         # Return serialized output
         return jsonify({
             "message": "Registration successful",
-            "user": AuthResponseSchema().dump(user)
+            "user": schema(AuthResponseSchema).dump(user)
         }), 201
 
     except ValidationError as ve:
@@ -35,6 +37,9 @@ def register():
         logger.warning(f"Registration failed: {ve}")
         return jsonify({"error": str(ve)}), 400
 
+    except ServiceOverloadedError as so:
+        raise so  # Already logged when shed; global handler returns 503
+
     except Exception as e:
         logger.exception("Unexpected error during registration")
         raise e  # Global handler catches this
@@ -46,7 +51,7 @@ def login():
         logger.info(f"Login attempt for email: {json_data.get('email')}")
 
         # Validate input
-        data = LoginSchema().load(json_data)
+        data = schema(LoginSchema).load(json_data)
 
         # Process
         user = login_user(data)
@@ -54,7 +59,7 @@ def login():
         # Return serialized output
         return jsonify({
             "message": "Login successful",
-            "user": AuthResponseSchema().dump(user)
+            "user": schema(AuthResponseSchema).dump(user)
         }), 200
 
     except ValidationError as ve:
@@ -65,6 +70,9 @@ def login():
         logger.warning(f"Login failed: {ve}")
         return jsonify({"error": str(ve)}), 401
 
+    except ServiceOverloadedError as so:
+        raise so  # Already logged when shed; global handler returns 503
+
     except Exception as e:
         logger.exception("Unexpected error during login")
         raise e  # Global handler catches this
@@ -4,44 +4,64 @@ import logging
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from schemas.booking_schemas import BookingSchema
+from schemas.serializers import schema, dumper
 from services.booking_service import BookingService
 from utils.roles_required import role_required  # <-- Add this import
+from utils.pagination import get_page_args, page_response
+from utils.streaming import wants_stream, stream_query
+from utils.idempotency import idempotent
 
 booking_bp = Blueprint("booking_bp", __name__, url_prefix="/api/bookings")
-booking_schema = BookingSchema()
+booking_schema = schema(BookingSchema)
+dump_booking = dumper(BookingSchema)
+dump_bookings = dumper(BookingSchema, many=True)
 logger = logging.getLogger(__name__)
 
 @booking_bp.route("/", methods=["POST"])
 @jwt_required()
 @role_required("USER")
+@idempotent
 def create_booking():
     user_id = get_jwt_identity()
     data = request.get_json()
     data["user_id"] = user_id
     validated_data = booking_schema.load(data)
     booking = BookingService.create_booking(validated_data)
-    return booking_schema.dump(booking), 201
+    return dump_booking(booking), 201
 
 @booking_bp.route("/", methods=["GET"])
 @jwt_required()
 @role_required("ADMIN")
 def get_all_bookings():
-    bookings = BookingService.get_all_bookings()
-    return jsonify(booking_schema.dump(bookings, many=True)), 200
+    if wants_stream():
+        return stream_query(BookingService.get_all_bookings_query(), dump_booking)
+
+    limit, cursor = get_page_args()
+    page = BookingService.get_all_bookings(limit, cursor)
+    return jsonify(page_response(dump_bookings(page.items), page.next_cursor)), 200
 
 @booking_bp.route("/user", methods=["GET"])
 @jwt_required()
 @role_required("USER")
 def get_user_bookings():
     user_id = get_jwt_identity()
-    bookings = BookingService.get_bookings_by_user(user_id)
-    return jsonify(booking_schema.dump(bookings, many=True)), 200
+    limit, cursor = get_page_args()
+    page = BookingService.get_bookings_by_user(user_id, limit, cursor)
+    return jsonify(page_response(dump_bookings(page.items), page.next_cursor)), 200
 
 @booking_bp.route("/<int:booking_id>", methods=["GET"])
 @jwt_required()
 def get_booking(booking_id):
     booking = BookingService.get_booking_by_id(booking_id)
-    return booking_schema.dump(booking), 200
+    return dump_booking(booking), 200
+
+@booking_bp.route("/<int:booking_id>/confirm", methods=["POST"])
+@jwt_required()
+@role_required("USER")
+def confirm_booking(booking_id):
+    user_id = get_jwt_identity()
+    booking = BookingService.confirm_booking(booking_id, user_id)
+    return dump_booking(booking), 200
 
 @booking_bp.route("/<int:booking_id>", methods=["DELETE"])
 @jwt_required()
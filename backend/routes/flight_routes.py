@@ -1,17 +1,35 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required
+from utils.roles_required import role_required
 from services.flight_service import (
     get_all_flights,  # Ensure this import is correct
+    get_all_flights_query,
     get_flight_by_id,
     create_flight,
     update_flight,
     delete_flight,
-    search_flights
+    search_flights,
+    serialize_flight_details,
+    get_fare_calendar,
+    flights_validator,
+    flight_validator,
+    get_flight_seats,
+    get_search_index_stats,
+    configure_search_index
 )
 
+from services.itinerary_service import search_itineraries
+from services.fare_engine import quote_flights
+from services.flight_import_service import import_flights
+from utils.bulk_import import rows_from_request
+from utils.pagination import get_page_args, page_response
+from utils.streaming import wants_stream, stream_query
+from utils.idempotency import idempotent
+from utils.conditional import conditional
 from schemas.flight_schemas import (
-    FlightCreateSchema, FlightResponseSchema, FlightUpdateSchema
+    FlightCreateSchema, FlightResponseSchema, FlightUpdateSchema, FlightDetailSchema
 )
+from schemas.serializers import schema, dumper
 from exceptions.custom_exceptions import BadRequestError, NotFoundError
 import logging
 from datetime import datetime
@@ -19,17 +37,24 @@ from datetime import datetime
 flight_bp = Blueprint("flights", __name__, url_prefix="/api/flights")
 logger = logging.getLogger(__name__)
 
+
+def wants_expanded():
+    """True if the client asked for the denormalized flight view (?expand=1)."""
+    return request.args.get("expand", "").lower() in ("1", "true", "yes")
+
+
 @flight_bp.route("/", methods=["POST"])
 @jwt_required()
+@idempotent
 def create():
     """Create a new flight."""
     try:
         data = request.get_json()
-        validated_data = FlightCreateSchema().load(data)
+        validated_data = schema(FlightCreateSchema).load(data)
         flight = create_flight(validated_data)
         return jsonify({
             "message": "Flight created successfully",
-            "flight": FlightResponseSchema().dump(flight)
+            "flight": dumper(FlightResponseSchema)(flight)
         }), 201  # HTTP 201: Created
     except BadRequestError as bre:
         logger.error(f"Bad Request: {str(bre)}")
@@ -38,22 +63,56 @@ def create():
         logger.exception("Unexpected error during flight creation.")
         raise e
 
+@flight_bp.route("/import", methods=["POST"])
+@jwt_required()
+@role_required("ADMIN")
+def bulk_import():
+    """Bulk import flights from a CSV or JSONL body (or a multipart 'file' upload)."""
+    try:
+        chunk_size = request.args.get(
+            "chunk_size", current_app.config["FLIGHT_IMPORT_CHUNK_SIZE"], type=int)
+
+        report = import_flights(
+            rows_from_request(),
+            chunk_size=chunk_size,
+            max_reported_errors=current_app.config["IMPORT_MAX_REPORTED_ERRORS"]
+        )
+        return jsonify(report), 200  # HTTP 200: OK (see report for per-row failures)
+    except BadRequestError as bre:
+        logger.error(f"Bad Request: {str(bre)}")
+        return jsonify({"error": str(bre)}), 400  # HTTP 400: Bad Request
+    except Exception as e:
+        logger.exception("Unexpected error during flight import.")
+        return jsonify({"error": "Internal server error"}), 500  # HTTP 500: Internal Server Error
+
 @flight_bp.route("/", methods=["GET"])
+@conditional(lambda: flights_validator(wants_expanded()))
 def get_all():
-    """Get all flights."""
+    """Get one page of flights, ordered by departure time, or stream all of them."""
     try:
-        flights = get_all_flights()
-        return jsonify(FlightResponseSchema(many=True).dump(flights)), 200  # HTTP 200: OK
+        expand = wants_expanded()
+        schema_cls = FlightDetailSchema if expand else FlightResponseSchema
+        if wants_stream():
+            return stream_query(get_all_flights_query(expand), dumper(schema_cls))
+
+        limit, cursor = get_page_args()
+        page = get_all_flights(limit, cursor, expand)
+        return jsonify(page_response(
+            dumper(schema_cls, many=True)(page.items), page.next_cursor
+        )), 200  # HTTP 200: OK
+    except BadRequestError as bre:
+        return jsonify({"error": str(bre)}), 400  # HTTP 400: Bad Request
     except Exception as e:
         logger.exception("Failed to fetch all flights.")
         return jsonify({"error": "Internal server error"}), 500  # HTTP 500: Internal Server Error
 
 @flight_bp.route("/<int:flight_id>", methods=["GET"])
+@conditional(flight_validator)
 def get_by_id(flight_id):
     """Get a flight by its ID."""
     try:
         flight = get_flight_by_id(flight_id)
-        return jsonify(FlightResponseSchema().dump(flight)), 200  # HTTP 200: OK
+        return jsonify(dumper(FlightResponseSchema)(flight)), 200  # HTTP 200: OK
     except NotFoundError as ne:
         logger.warning(f"Flight with ID {flight_id} not found.")
         return jsonify({"error": str(ne)}), 404  # HTTP 404: Not Found
@@ -61,17 +120,30 @@ def get_by_id(flight_id):
         logger.exception(f"Unexpected error fetching flight with ID {flight_id}.")
         return jsonify({"error": "Internal server error"}), 500  # HTTP 500: Internal Server Error
 
+@flight_bp.route("/<int:flight_id>/seats", methods=["GET"])
+def get_seats(flight_id):
+    """Get remaining seats per class for a flight."""
+    try:
+        inventory = get_flight_seats(flight_id)
+        return jsonify([row.serialize() for row in inventory]), 200  # HTTP 200: OK
+    except NotFoundError as ne:
+        logger.warning(f"Flight with ID {flight_id} not found.")
+        return jsonify({"error": str(ne)}), 404  # HTTP 404: Not Found
+    except Exception as e:
+        logger.exception(f"Unexpected error fetching seats for flight with ID {flight_id}.")
+        return jsonify({"error": "Internal server error"}), 500  # HTTP 500: Internal Server Error
+
 @flight_bp.route("/<int:flight_id>", methods=["PUT"])
 @jwt_required()
 def update(flight_id):
     """Update an existing flight."""
     try:
         data = request.get_json()
-        validated_data = FlightUpdateSchema().load(data, partial=True)
+        validated_data = schema(FlightUpdateSchema).load(data, partial=True)
         flight = update_flight(flight_id, validated_data)
         return jsonify({
             "message": "Flight updated successfully",
-            "flight": FlightResponseSchema().dump(flight)
+            "flight": dumper(FlightResponseSchema)(flight)
         }), 200  # HTTP 200: OK
     except NotFoundError as ne:
         logger.warning(f"Flight with ID {flight_id} not found for update.")
@@ -113,11 +185,100 @@ def search():
             departure_time = None  # Set to None if not provided
 
         # Call the search service
-        flights = search_flights(departure_airport_id, arrival_airport_id, departure_time)
+        expand = wants_expanded()
+        flights = search_flights(departure_airport_id, arrival_airport_id, departure_time, expand)
 
-        # Serialize the flights and return the result
-        return jsonify([flight.serialize() for flight in flights]), 200
+        # Serialize the flights with their per-class fares (priced in one batch)
+        fares = quote_flights(flights)
+        serialize = serialize_flight_details if expand else (lambda flight: flight.serialize())
+        return jsonify([{**serialize(flight), "fares": fares[flight.id]} for flight in flights]), 200
 
+    except NotFoundError as ne:
+        return jsonify({"error": str(ne)}), 404
     except Exception as e:
         logger.error(f"Failed to search for flights: {e}")
         return jsonify({"error": str(e)}), 500
+
+
+@flight_bp.route('/itineraries', methods=['GET'])
+def itineraries():
+    """Direct and connecting itineraries (up to two stops) for one departure date."""
+    try:
+        config = current_app.config
+        departure_date = request.args.get('date')
+        if not departure_date:
+            raise BadRequestError("date is required (YYYY-MM-DD).")
+        try:
+            departure_date = datetime.strptime(departure_date, "%Y-%m-%d").date()
+        except ValueError:
+            raise BadRequestError("date must be in YYYY-MM-DD format.")
+
+        results = search_itineraries(
+            departure_airport_id=request.args.get('departure_airport_id', type=int),
+            arrival_airport_id=request.args.get('arrival_airport_id', type=int),
+            departure_date=departure_date,
+            max_stops=request.args.get('max_stops', 1, type=int),
+            min_layover_minutes=request.args.get(
+                'min_layover_minutes', config["ITINERARY_MIN_LAYOVER_MINUTES"], type=int),
+            max_layover_minutes=request.args.get(
+                'max_layover_minutes', config["ITINERARY_MAX_LAYOVER_MINUTES"], type=int),
+            sort_by=request.args.get('sort_by', 'duration'),
+            limit=min(request.args.get('limit', 10, type=int), config["ITINERARY_MAX_RESULTS"])
+        )
+        return jsonify(results), 200
+
+    except BadRequestError as bre:
+        return jsonify({"error": str(bre)}), 400
+    except NotFoundError as ne:
+        return jsonify({"error": str(ne)}), 404
+    except Exception as e:
+        logger.exception("Failed to search for itineraries.")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@flight_bp.route('/calendar', methods=['GET'])
+def fare_calendar():
+    """Cheapest price per day of a month for one route."""
+    try:
+        month = request.args.get('month')
+        if not month:
+            raise BadRequestError("month is required (YYYY-MM).")
+        try:
+            month = datetime.strptime(month, "%Y-%m")
+        except ValueError:
+            raise BadRequestError("month must be in YYYY-MM format.")
+
+        result = get_fare_calendar(
+            request.args.get('departure_airport_id', type=int),
+            request.args.get('arrival_airport_id', type=int),
+            month.year,
+            month.month,
+        )
+        return jsonify(result), 200
+
+    except BadRequestError as bre:
+        return jsonify({"error": str(bre)}), 400
+    except Exception as e:
+        logger.exception("Failed to build fare calendar.")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@flight_bp.route('/search/index', methods=['GET'])
+@jwt_required()
+@role_required("ADMIN")
+def search_index_stats():
+    """Hit/miss counters for the in-memory search index of this worker."""
+    return jsonify(get_search_index_stats()), 200
+
+
+@flight_bp.route('/search/index', methods=['PUT'])
+@jwt_required()
+@role_required("ADMIN")
+def configure_index():
+    """Turn the search index on/off for this worker, optionally clearing it and its counters."""
+    data = request.get_json() or {}
+    enabled = data.get("enabled")
+    if enabled is not None and not isinstance(enabled, bool):
+        return jsonify({"error": "'enabled' must be a boolean."}), 400
+    stats = configure_search_index(enabled=enabled, clear=bool(data.get("clear")))
+    return jsonify(stats), 200
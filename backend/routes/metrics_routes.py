@@ -0,0 +1,25 @@
+# backend/routes/metrics_routes.py
+
+import hmac
+
+from flask import Blueprint, Response, request, current_app, jsonify
+from utils.metrics import request_metrics
+
+metrics_bp = Blueprint("metrics", __name__)
+
+PROMETHEUS_MIMETYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics():
+    """
+    Request metrics in Prometheus text format, behind METRICS_AUTH_TOKEN. Without a token
+    they are served only where METRICS_PUBLIC is set (development); elsewhere the
+    endpoint does not exist.
+    """
+    token = current_app.config.get("METRICS_AUTH_TOKEN")
+    if not token and not current_app.config.get("METRICS_PUBLIC"):
+        return jsonify({"error": "Not Found"}), 404  # HTTP 404: Not Found
+    if token and not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return jsonify({"error": "Unauthorized"}), 401  # HTTP 401: Unauthorized
+    return Response(request_metrics.render(), content_type=PROMETHEUS_MIMETYPE)
@@ -0,0 +1,78 @@
+# routes/review_routes.py
+
+import logging
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from marshmallow import ValidationError
+from schemas.review_schemas import ReviewCreateSchema, ReviewUpdateSchema, ReviewSchema
+from schemas.serializers import schema, dumper
+from services.review_service import (
+    create_review, update_review, delete_review, get_review, get_reviews,
+    get_flight_reviews, get_flight_rating, get_route_rating
+)
+from utils.roles_required import role_required
+from utils.pagination import get_page_args, page_response
+
+review_bp = Blueprint("review_bp", __name__, url_prefix="/api/reviews")
+dump_review = dumper(ReviewSchema)
+dump_reviews = dumper(ReviewSchema, many=True)
+logger = logging.getLogger(__name__)
+
+
+def is_admin():
+    return get_jwt().get("role") == "ADMIN"
+
+
+@review_bp.route("/", methods=["GET"])
+@jwt_required()
+def list_reviews():
+    """Every review for admins, the caller's own reviews otherwise."""
+    limit, cursor = get_page_args()
+    page = get_reviews(limit, cursor, user_id=None if is_admin() else get_jwt_identity())
+    return jsonify(page_response(dump_reviews(page.items), page.next_cursor)), 200
+
+@review_bp.route("/<int:review_id>", methods=["GET"])
+@jwt_required()
+def get_one(review_id):
+    return dump_review(get_review(review_id)), 200
+
+@review_bp.route("/", methods=["POST"])
+@jwt_required()
+@role_required("USER")
+def create():
+    try:
+        data = schema(ReviewCreateSchema).load(request.get_json())
+    except ValidationError as ve:
+        logger.warning(f"Validation failed during review creation: {ve.messages}")
+        return jsonify({"errors": ve.messages}), 400
+    return dump_review(create_review(get_jwt_identity(), data)), 201
+
+@review_bp.route("/<int:review_id>", methods=["PUT"])
+@jwt_required()
+def update(review_id):
+    try:
+        data = schema(ReviewUpdateSchema).load(request.get_json(), partial=True)
+    except ValidationError as ve:
+        logger.warning(f"Validation failed during review update: {ve.messages}")
+        return jsonify({"errors": ve.messages}), 400
+    return dump_review(update_review(review_id, get_jwt_identity(), data)), 200
+
+@review_bp.route("/<int:review_id>", methods=["DELETE"])
+@jwt_required()
+def delete(review_id):
+    delete_review(review_id, get_jwt_identity(), is_admin=is_admin())
+    return jsonify({"success": True}), 200
+
+@review_bp.route("/flights/<int:flight_id>", methods=["GET"])
+def list_flight_reviews(flight_id):
+    limit, cursor = get_page_args()
+    page = get_flight_reviews(flight_id, limit, cursor)
+    return jsonify(page_response(dump_reviews(page.items), page.next_cursor)), 200
+
+@review_bp.route("/flights/<int:flight_id>/rating", methods=["GET"])
+def flight_rating(flight_id):
+    return jsonify(get_flight_rating(flight_id)), 200
+
+@review_bp.route("/routes/<int:departure_airport_id>/<int:arrival_airport_id>/rating", methods=["GET"])
+def route_rating(departure_airport_id, arrival_airport_id):
+    return jsonify(get_route_rating(departure_airport_id, arrival_airport_id)), 200
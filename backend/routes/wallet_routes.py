@@ -0,0 +1,49 @@
+# routes/wallet_routes.py
+
+import logging
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from marshmallow import ValidationError
+from schemas.wallet_schemas import WalletSchema, WalletDepositSchema
+from schemas.transaction_schemas import TransactionSchema
+from schemas.serializers import schema, dumper
+from services.wallet_service import get_wallet, deposit, get_transactions, get_all_wallets
+from utils.roles_required import role_required
+from utils.pagination import get_page_args, page_response
+from utils.idempotency import idempotent
+
+wallet_bp = Blueprint("wallet_bp", __name__, url_prefix="/api/wallets")
+dump_wallet = dumper(WalletSchema)
+logger = logging.getLogger(__name__)
+
+@wallet_bp.route("/me", methods=["GET"])
+@jwt_required()
+def get_my_wallet():
+    return dump_wallet(get_wallet(get_jwt_identity())), 200
+
+@wallet_bp.route("/add", methods=["POST"])
+@jwt_required()
+@idempotent
+def add_money():
+    try:
+        data = schema(WalletDepositSchema).load(request.get_json())
+    except ValidationError as ve:
+        logger.warning(f"Validation failed during wallet top-up: {ve.messages}")
+        return jsonify({"errors": ve.messages}), 400
+    wallet = deposit(get_jwt_identity(), data["amount"], data["description"])
+    return dump_wallet(wallet), 200
+
+@wallet_bp.route("/transactions", methods=["GET"])
+@jwt_required()
+def get_my_transactions():
+    limit, cursor = get_page_args()
+    page = get_transactions(get_jwt_identity(), limit, cursor)
+    return jsonify(page_response(dumper(TransactionSchema, many=True)(page.items), page.next_cursor)), 200
+
+@wallet_bp.route("/", methods=["GET"])
+@jwt_required()
+@role_required("ADMIN")
+def get_wallets():
+    limit, cursor = get_page_args()
+    page = get_all_wallets(limit, cursor)
+    return jsonify(page_response(dumper(WalletSchema, many=True)(page.items), page.next_cursor)), 200
@@ -1,15 +1,15 @@
 from marshmallow import Schema, fields, validate
-from marshmallow_enum import EnumField
-from models.enums import BookingStatusEnum, PassengerStatusEnum
+from models.enums import BookingStatusEnum, PassengerStatusEnum, FlightClass
 
 class PassengerSchema(Schema):
     id = fields.Int(dump_only=True)
-    booking_id = fields.Int(required=True)
+    booking_id = fields.Int(dump_only=True)
     first_name = fields.Str(required=True, validate=validate.Length(min=1))
     last_name = fields.Str(required=True, validate=validate.Length(min=1))
     gender = fields.Str(required=True, validate=validate.OneOf(["M", "F", "O"]))
     age = fields.Int(required=True, validate=validate.Range(min=0))
-    status = EnumField(PassengerStatusEnum, by_value=True, dump_default=PassengerStatusEnum.BOOKED)
+    flight_class = fields.Enum(FlightClass, by_value=True, load_default=FlightClass.ECONOMY)
+    status = fields.Enum(PassengerStatusEnum, by_value=True, dump_default=PassengerStatusEnum.BOOKED)
     cancellation_time = fields.DateTime(allow_none=True, dump_only=True)
 
 class BookingSchema(Schema):
@@ -17,6 +17,7 @@ class BookingSchema(Schema):
     user_id = fields.Int(required=True)
     flight_id = fields.Int(required=True)
     booking_time = fields.DateTime(dump_only=True)
-    status = EnumField(BookingStatusEnum, by_value=True, dump_default=BookingStatusEnum.PENDING)
-    total_price = fields.Decimal(as_string=True, required=True)
-    passengers = fields.List(fields.Nested(PassengerSchema), required=True)
+    status = fields.Enum(BookingStatusEnum, by_value=True, dump_default=BookingStatusEnum.PENDING)  # set by the service; client values are ignored
+    hold_expires_at = fields.DateTime(dump_only=True, allow_none=True)
+    total_price = fields.Decimal(as_string=True, load_default=None)  # set by the fare engine; client values are ignored
+    passengers = fields.List(fields.Nested(PassengerSchema), required=True, validate=validate.Length(min=1))
@@ -12,7 +12,7 @@ class FlightCreateSchema(Schema):
         required=True,
         validate=validate.OneOf([status.value for status in FlightStatus]),
     )
-    price = fields.Float(required=True)  # Single price for all classes
+    price = fields.Float(required=True)  # Base (economy) fare; class fares come from the fare engine
 
 class FlightUpdateSchema(FlightCreateSchema):
     pass
@@ -27,3 +27,12 @@ class FlightResponseSchema(Schema):
     arrival_time = fields.DateTime()
     status = fields.Str(validate=validate.OneOf([status.value for status in FlightStatus]))
     price = fields.Float()
+
+class FlightDetailSchema(FlightResponseSchema):
+    """FlightResponseSchema plus the denormalized fields of the expanded flight view."""
+    departure_airport_code = fields.Str()
+    departure_city = fields.Str()
+    arrival_airport_code = fields.Str()
+    arrival_city = fields.Str()
+    airplane_model = fields.Str()
+    seats_remaining = fields.Int(allow_none=True)
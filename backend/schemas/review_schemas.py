@@ -0,0 +1,19 @@
+from marshmallow import Schema, fields, validate
+
+class ReviewCreateSchema(Schema):
+    flight_id = fields.Int(required=True)
+    rating = fields.Int(required=True, validate=validate.Range(min=1, max=5))
+    comment = fields.Str(load_default=None, allow_none=True, validate=validate.Length(max=2000))
+
+class ReviewUpdateSchema(Schema):
+    rating = fields.Int(validate=validate.Range(min=1, max=5))
+    comment = fields.Str(allow_none=True, validate=validate.Length(max=2000))
+
+class ReviewSchema(Schema):
+    id = fields.Int()
+    user_id = fields.Int()
+    flight_id = fields.Int()
+    rating = fields.Int()
+    comment = fields.Str(allow_none=True)
+    created_at = fields.DateTime()
+    updated_at = fields.DateTime()
@@ -0,0 +1,117 @@
+# backend/schemas/serializers.py
+# Shared schema instances and compiled dump functions for hot response types.
+#
+#     schema(FlightCreateSchema).load(data)          # one instance per (class, options)
+#     dumper(FlightResponseSchema)(flight)           # same dict as FlightResponseSchema().dump(flight)
+#     dumper(FlightResponseSchema, many=True)(rows)  # same list as ...(many=True).dump(rows)
+#
+# Marshmallow schemas hold no per-call state once built, so routes share one instance
+# instead of building (and re-binding every field of) a new one per request.
+#
+# dumper() turns a schema's dump into a single generated function: attributes are read
+# in declared field order and each field's _serialize() is inlined for the field types
+# the response schemas use (Int, Float, Str, Email, DateTime, Enum, Nested/List of
+# Nested). Any other field calls its own serialize(), and schemas with pre/post-dump
+# hooks keep schema.dump, so the output is always what marshmallow itself would return.
+# Unlike schema.dump the compiled function needs objects with attributes (ORM instances,
+# result rows), not dicts.
+
+import logging
+from functools import lru_cache
+
+from marshmallow import fields, missing, utils
+from marshmallow.decorators import PRE_DUMP, POST_DUMP
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def schema(schema_cls, **options):
+    """The shared ``schema_cls(**options)`` instance."""
+    return schema_cls(**options)
+
+
+@lru_cache(maxsize=None)
+def dumper(schema_cls, many=False):
+    """Compiled equivalent of ``schema_cls().dump`` (``many=True``: of ``dump(objs, many=True)``)."""
+    dump = _compile(schema(schema_cls))
+    if many:
+        return lambda objs: [dump(obj) for obj in objs]
+    return dump
+
+
+def _value_expression(field, var, namespace):
+    """Python expression serializing ``var`` like ``field._serialize`` would, or None if not inlinable."""
+    field_type = type(field)
+    if field_type is fields.Integer and not field.as_string:
+        return f"None if {var} is None else int({var})"
+    if field_type is fields.Float and not field.as_string:
+        return f"None if {var} is None else float({var})"
+    if field_type in (fields.String, fields.Email):
+        # utils.ensure_text_type() decodes bytes and str()s everything else
+        return f"None if {var} is None else ({var} if {var}.__class__ is str else _text({var}))"
+    if field_type is fields.DateTime:
+        format_func = field.SERIALIZATION_FUNCS.get(field.format or field.DEFAULT_FORMAT)
+        if format_func is utils.isoformat:
+            return f"None if {var} is None else {var}.isoformat()"
+        return None
+    if field_type is fields.Enum and field.by_value and type(field.field) is fields.Raw:
+        return f"None if {var} is None else {var}.value"
+    if field_type is fields.Nested:
+        nested = _nested_dump(field, namespace)
+        if nested is None:
+            return None
+        if field.many or field.schema.many:
+            return f"None if {var} is None else [{nested}(item) for item in {var}]"
+        return f"None if {var} is None else {nested}({var})"
+    if field_type is fields.List and type(field.inner) is fields.Nested:
+        nested = _nested_dump(field.inner, namespace)
+        if nested is None or field.inner.many or field.inner.schema.many:
+            return None
+        return f"None if {var} is None else [{nested}(item) for item in {var}]"
+    return None
+
+
+def _nested_dump(field, namespace):
+    if not isinstance(field.nested, type):
+        return None  # "self", lambdas and string references stay on marshmallow
+    name = f"_nested{len(namespace)}"
+    namespace[name] = _compile(field.schema)
+    return name
+
+
+def _compile(instance):
+    """Generate the dump function of one (non-many) schema instance."""
+    if instance._hooks[PRE_DUMP] or instance._hooks[POST_DUMP] or instance.dict_class is not dict:
+        return lambda obj: instance.dump(obj, many=False)
+
+    namespace = {"_text": utils.ensure_text_type, "_missing": missing, "_get": instance.get_attribute}
+    body, items, optional = [], [], []
+    for index, (attr_name, field) in enumerate(instance.dump_fields.items()):
+        key = field.data_key if field.data_key is not None else attr_name
+        attribute = field.attribute or attr_name
+        var = f"v{index}"
+        expression = None
+        if "." not in attribute and attribute.isidentifier():
+            expression = _value_expression(field, var, namespace)
+        if expression is not None:
+            body.append(f"    {var} = obj.{attribute}")
+        else:
+            # Generic path: the field's own serialize(), which may return missing (key omitted)
+            namespace[f"_field{index}"] = field
+            expression = f"_field{index}.serialize({attr_name!r}, obj, accessor=_get)"
+            optional.append(key)
+        items.append(f"        {key!r}: {expression},")
+
+    source = "\n".join([
+        "def dump(obj):",
+        *body,
+        "    data = {",
+        *items,
+        "    }",
+        *(f"    if data[{key!r}] is _missing:\n        del data[{key!r}]" for key in optional),
+        "    return data",
+    ])
+    exec(compile(source, f"<dumper {type(instance).__name__}>", "exec"), namespace)
+    logger.debug("Compiled dumper for %s:\n%s", type(instance).__name__, source)
+    return namespace["dump"]
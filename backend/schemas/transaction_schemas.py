@@ -0,0 +1,12 @@
+from marshmallow import Schema, fields
+from models.enums import TransactionType
+
+class TransactionSchema(Schema):
+    id = fields.Int()
+    wallet_id = fields.Int()
+    type = fields.Enum(TransactionType, by_value=True)
+    amount = fields.Decimal(as_string=True)
+    balance_after = fields.Decimal(as_string=True)
+    booking_id = fields.Int(allow_none=True)
+    description = fields.Str(allow_none=True)
+    created_at = fields.DateTime()
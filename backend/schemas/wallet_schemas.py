@@ -0,0 +1,12 @@
+from decimal import Decimal
+from marshmallow import Schema, fields, validate
+
+class WalletSchema(Schema):
+    id = fields.Int()
+    user_id = fields.Int()
+    balance = fields.Decimal(as_string=True)
+    updated_at = fields.DateTime()
+
+class WalletDepositSchema(Schema):
+    amount = fields.Decimal(required=True, places=2, validate=validate.Range(min=Decimal("0.01")))
+    description = fields.Str(load_default=None, validate=validate.Length(max=255))
@@ -0,0 +1,87 @@
+# backend/security/password_utils.py
+# Password hashing off the request thread.
+#
+# Hashing is deliberately slow, so login storms used to pin every worker thread on
+# scrypt. All hashing now goes through a small bounded pool: at most
+# PASSWORD_HASH_POOL_SIZE hashes run at once, PASSWORD_HASH_QUEUE_SIZE more may wait,
+# and anything beyond that is rejected immediately with ServiceOverloadedError (503)
+# instead of piling up behind the pool.
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError as FutureTimeout
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from exceptions.custom_exceptions import ServiceOverloadedError
+
+logger = logging.getLogger(__name__)
+
+
+def _method_prefix(password_hash):
+    """'scrypt:32768:8:1$salt$hash' -> 'scrypt:32768:8:1'"""
+    return password_hash.split("$", 1)[0]
+
+
+class PasswordHasher:
+
+    def __init__(self):
+        self.method = None
+        self.timeout = None
+        self._method_prefix = None
+        self._executor = None
+        self._slots = None
+
+    def init_app(self, app):
+        pool_size = app.config.get("PASSWORD_HASH_POOL_SIZE", 4)
+        queue_size = app.config.get("PASSWORD_HASH_QUEUE_SIZE", 32)
+        executor_cls = (
+            ProcessPoolExecutor if app.config.get("PASSWORD_HASH_EXECUTOR") == "process"
+            else ThreadPoolExecutor
+        )
+
+        self.method = app.config.get("PASSWORD_HASH_METHOD", "scrypt")
+        self.timeout = app.config.get("PASSWORD_HASH_TIMEOUT", 5)
+        # werkzeug expands defaults (e.g. "scrypt" -> "scrypt:32768:8:1"); hash once to learn the full form
+        self._method_prefix = _method_prefix(generate_password_hash("", method=self.method))
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        if executor_cls is ThreadPoolExecutor:
+            self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="password-hash")
+        else:
+            self._executor = ProcessPoolExecutor(max_workers=pool_size)
+        self._slots = threading.BoundedSemaphore(pool_size + queue_size)
+        logger.info("Password hashing pool ready (%s, size=%d, queue=%d, method=%s).",
+                    executor_cls.__name__, pool_size, queue_size, self._method_prefix)
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            logger.warning("Password hashing pool saturated; shedding request.")
+            raise ServiceOverloadedError("Authentication service is busy. Please retry shortly.")
+
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            logger.warning("Password hashing timed out after %ss.", self.timeout)
+            raise ServiceOverloadedError("Authentication service is busy. Please retry shortly.")
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """True if the hash was made with a different method or cost than configured."""
+        return _method_prefix(password_hash) != self._method_prefix
+
+
+password_hasher = PasswordHasher()
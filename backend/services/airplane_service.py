@@ -2,10 +2,26 @@ import logging
 from extensions import db
 from models.airplane import Airplane
 from exceptions.custom_exceptions import BadRequestError, NotFoundError
+from sqlalchemy import insert, update
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from marshmallow import ValidationError
+from flask import current_app
+from utils.bulk_import import run_import, split_row_errors
+from utils.conditional import table_validator
+from utils.pagination import paginate
+from utils.db_routing import read_only
+from utils.versioned_cache import cached, bump_version
+from schemas.airplane_schemas import AirplaneCreateSchema, AirplaneResponseSchema
+from schemas.serializers import dumper
 
 logger = logging.getLogger(__name__)
 
+CACHE_NAMESPACE = "airplanes"
+
+
+def _cache_timeout():
+    return current_app.config.get("REFERENCE_CACHE_TIMEOUT")
+
 def create_airplane(data):
     airplane_number = data.get("airplane_number")
     model = data.get("model")
@@ -28,12 +44,14 @@ def create_airplane(data):
 
     db.session.add(airplane)
     db.session.commit()
+    bump_version(CACHE_NAMESPACE)
     return airplane
 
 
-def get_all_airplanes():
+@read_only
+def get_all_airplanes(limit, cursor=None):
     try:
-        return Airplane.query.all()
+        return paginate(Airplane.query, Airplane.airplane_number, Airplane.id, limit, cursor)
     except SQLAlchemyError as e:
         logger.exception("Failed to fetch airplanes.")
         raise RuntimeError("Database error.")
@@ -62,6 +80,7 @@ def update_airplane(airplane_id, data):
         raise BadRequestError("Total seats must equal the sum of class-specific seats.")
 
     db.session.commit()
+    bump_version(CACHE_NAMESPACE)
     return airplane
 
 
@@ -69,3 +88,87 @@ def delete_airplane(airplane_id):
     airplane = get_airplane_by_id(airplane_id)
     db.session.delete(airplane)
     db.session.commit()
+    bump_version(CACHE_NAMESPACE)
+
+
+# --- Cached reads (serialized dicts, safe to share across requests) ---
+
+def get_airplane_data(airplane_id):
+    """Serialized airplane, from the cache when possible. Raises NotFoundError."""
+    def load():
+        airplane = Airplane.query.get(airplane_id)
+        return airplane.serialize() if airplane else None
+    airplane = cached(CACHE_NAMESPACE, f"id:{airplane_id}", load, _cache_timeout())
+    if not airplane:
+        raise NotFoundError("Airplane not found.")
+    return airplane
+
+
+@read_only
+def list_airplane_data(limit, cursor=None):
+    """One page of serialized airplanes as {"items", "next_cursor"}, cached per page."""
+    def load():
+        page = get_all_airplanes(limit, cursor)
+        return {"items": dumper(AirplaneResponseSchema, many=True)(page.items), "next_cursor": page.next_cursor}
+    return cached(CACHE_NAMESPACE, f"list:{limit}:{cursor or ''}", load, _cache_timeout())
+
+
+def airplanes_validator():
+    """Conditional-GET validator for the airplane list."""
+    return table_validator(Airplane)
+
+
+# --- Bulk upsert ---
+
+def _validate_airplane_chunk(chunk):
+    """Validate rows (including the seat-sum rule) and resolve existing airplane numbers in one IN query."""
+    rows, errors = split_row_errors(chunk)
+    schema = AirplaneCreateSchema()
+    parsed = {}
+    for row_number, row in rows:
+        try:
+            data = schema.load(row, unknown="exclude")
+        except ValidationError as err:
+            errors.append((row_number, [f"{field}: {', '.join(messages)}" for field, messages in err.messages.items()]))
+            continue
+        if data["total_seats"] != data["economy_seats"] + data["business_seats"] + data["first_class_seats"]:
+            errors.append((row_number, ["Total seats must equal the sum of economy, business, and first class seats."]))
+            continue
+        if data["airplane_number"] in parsed:
+            errors.append((row_number, [f"Duplicate airplane number {data['airplane_number']} in the same batch."]))
+            continue
+        parsed[data["airplane_number"]] = (row_number, data)
+
+    if not parsed:
+        return [], errors
+
+    existing = dict(
+        db.session.query(Airplane.airplane_number, Airplane.id).filter(Airplane.airplane_number.in_(parsed))
+    )
+    valid = [(row_number, data, existing.get(number)) for number, (row_number, data) in parsed.items()]
+    return valid, errors
+
+
+def _write_airplane_chunk(valid):
+    new_rows = [data for _, data, airplane_id in valid if airplane_id is None]
+    changed_rows = [{"id": airplane_id, **data} for _, data, airplane_id in valid if airplane_id is not None]
+    if new_rows:
+        db.session.execute(insert(Airplane), new_rows)
+    if changed_rows:
+        db.session.execute(update(Airplane), changed_rows)
+    db.session.commit()
+    return {"inserted": len(new_rows), "updated": len(changed_rows)}
+
+
+def bulk_upsert_airplanes(rows, chunk_size=1000, max_reported_errors=1000):
+    """
+    Insert or update (by airplane_number) airplanes from (row_number, dict) pairs.
+    Returns an import report with inserted/updated/failed counts and throughput.
+    """
+    try:
+        return run_import(
+            rows, _validate_airplane_chunk, _write_airplane_chunk, ("inserted", "updated"),
+            chunk_size=chunk_size, max_reported_errors=max_reported_errors, label="airplanes"
+        )
+    finally:
+        bump_version(CACHE_NAMESPACE)
@@ -3,11 +3,26 @@
 import logging
 from extensions import db
 from models.airport import Airport
+from sqlalchemy import insert, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from marshmallow import ValidationError
+from flask import current_app
 from exceptions.custom_exceptions import BadRequestError
+from schemas.airport_schemas import AirportCreateSchema
+from utils.bulk_import import run_import, split_row_errors
+from utils.conditional import table_validator
+from utils.pagination import paginate
+from utils.db_routing import read_only
+from utils.versioned_cache import cached, bump_version
 
 logger = logging.getLogger(__name__)
 
+CACHE_NAMESPACE = "airports"
+
+
+def _cache_timeout():
+    return current_app.config.get("REFERENCE_CACHE_TIMEOUT")
+
 def create_airport(data):
     try:
         name = data.get('name')
@@ -24,6 +39,7 @@ def create_airport(data):
         airport = Airport(name=name, city=city, country=country, airport_code=airport_code)
         db.session.add(airport)
         db.session.commit()
+        bump_version(CACHE_NAMESPACE)
 
         return airport
     except IntegrityError as e:
@@ -38,6 +54,15 @@ def create_airport(data):
         raise e
 
 
+@read_only
+def get_all_airports(limit, cursor=None):
+    try:
+        return paginate(Airport.query, Airport.airport_code, Airport.id, limit, cursor)
+    except SQLAlchemyError:
+        logger.exception("Failed to fetch airports.")
+        raise RuntimeError("Database error.")
+
+
 def get_airport_by_id(airport_id):
     return Airport.query.get(airport_id)
 
@@ -46,6 +71,37 @@ def get_airport_by_code(code):
     return Airport.query.filter_by(airport_code=code).first()
 
 
+# --- Cached reads (serialized dicts, safe to share across requests) ---
+
+def get_airport_data(airport_id):
+    def load():
+        airport = get_airport_by_id(airport_id)
+        return airport.serialize() if airport else None
+    return cached(CACHE_NAMESPACE, f"id:{airport_id}", load, _cache_timeout())
+
+
+@read_only
+def get_airport_data_by_code(code):
+    def load():
+        airport = get_airport_by_code(code)
+        return airport.serialize() if airport else None
+    return cached(CACHE_NAMESPACE, f"code:{code}", load, _cache_timeout())
+
+
+@read_only
+def list_airport_data(limit, cursor=None):
+    """One page of serialized airports as {"items", "next_cursor"}, cached per page."""
+    def load():
+        page = get_all_airports(limit, cursor)
+        return {"items": [airport.serialize() for airport in page.items], "next_cursor": page.next_cursor}
+    return cached(CACHE_NAMESPACE, f"list:{limit}:{cursor or ''}", load, _cache_timeout())
+
+
+def airports_validator():
+    """Conditional-GET validator for the airport list."""
+    return table_validator(Airport)
+
+
 def update_airport(airport_id, data):
     airport = get_airport_by_id(airport_id)
     if not airport:
@@ -64,6 +120,7 @@ def update_airport(airport_id, data):
 
     try:
         db.session.commit()
+        bump_version(CACHE_NAMESPACE)
         return airport
     except SQLAlchemyError:
         db.session.rollback()
@@ -79,7 +136,61 @@ def delete_airport(airport_id):
     try:
         db.session.delete(airport)
         db.session.commit()
+        bump_version(CACHE_NAMESPACE)
     except SQLAlchemyError:
         db.session.rollback()
         logger.exception("Error deleting airport.")
         raise RuntimeError("Failed to delete airport.")
+
+
+# --- Bulk upsert ---
+
+def _validate_airport_chunk(chunk):
+    """Validate rows and resolve existing airport codes with a single IN query."""
+    rows, errors = split_row_errors(chunk)
+    schema = AirportCreateSchema()
+    parsed = {}
+    for row_number, row in rows:
+        try:
+            data = schema.load(row, unknown="exclude")
+        except ValidationError as err:
+            errors.append((row_number, [f"{field}: {', '.join(messages)}" for field, messages in err.messages.items()]))
+            continue
+        if data["airport_code"] in parsed:
+            errors.append((row_number, [f"Duplicate airport code {data['airport_code']} in the same batch."]))
+            continue
+        parsed[data["airport_code"]] = (row_number, data)
+
+    if not parsed:
+        return [], errors
+
+    existing = dict(
+        db.session.query(Airport.airport_code, Airport.id).filter(Airport.airport_code.in_(parsed))
+    )
+    valid = [(row_number, data, existing.get(code)) for code, (row_number, data) in parsed.items()]
+    return valid, errors
+
+
+def _write_airport_chunk(valid):
+    new_rows = [data for _, data, airport_id in valid if airport_id is None]
+    changed_rows = [{"id": airport_id, **data} for _, data, airport_id in valid if airport_id is not None]
+    if new_rows:
+        db.session.execute(insert(Airport), new_rows)
+    if changed_rows:
+        db.session.execute(update(Airport), changed_rows)
+    db.session.commit()
+    return {"inserted": len(new_rows), "updated": len(changed_rows)}
+
+
+def bulk_upsert_airports(rows, chunk_size=1000, max_reported_errors=1000):
+    """
+    Insert or update (by airport_code) airports from (row_number, dict) pairs.
+    Returns an import report with inserted/updated/failed counts and throughput.
+    """
+    try:
+        return run_import(
+            rows, _validate_airport_chunk, _write_airport_chunk, ("inserted", "updated"),
+            chunk_size=chunk_size, max_reported_errors=max_reported_errors, label="airports"
+        )
+    finally:
+        bump_version(CACHE_NAMESPACE)
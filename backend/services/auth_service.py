@@ -4,23 +4,23 @@ import logging
 from datetime import timedelta
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from werkzeug.security import generate_password_hash, check_password_hash
 from flask_jwt_extended import create_access_token
 
 from extensions import db
 from models.user import User
 from models.enums import UserRole, Gender
+from security.password_utils import password_hasher
 
 from exceptions.custom_exceptions import (
     InvalidEnumError,
     UserAlreadyExistsError,
     InvalidCredentialsError,
+    ServiceOverloadedError,
 )
 from exceptions.error_codes import INTERNAL_SERVER_ERROR
 
 
 # Configure logger
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -39,7 +39,7 @@ def register_user(data):
     user = User(
         name=data["name"],
         email=data["email"],
-        password=generate_password_hash(data["password"]),
+        password=password_hasher.hash(data["password"]),
         role=role,
         gender=gender,
         mobile_number=data["mobile_number"]
@@ -77,10 +77,13 @@ def login_user(data):
         logger.warning(f"Login failed: No user with email {email}")
         raise InvalidCredentialsError()
 
-    if not check_password_hash(user.password, password):
+    if not password_hasher.verify(user.password, password):
         logger.warning(f"Login failed: Incorrect password for {email}")
         raise InvalidCredentialsError()
 
+    if password_hasher.needs_rehash(user.password):
+        _upgrade_password_hash(user, password)
+
     token = create_access_token(identity=user.id, expires_delta=timedelta(hours=1))
     logger.info(f"Login successful for {email}")
 
@@ -93,6 +96,22 @@ def login_user(data):
     }
 
 
+def _upgrade_password_hash(user, password):
+    """
+    Re-hash a password stored with an outdated method or cost.
+    Best effort: a busy pool or a failed commit must never fail the login itself.
+    """
+    try:
+        user.password = password_hasher.hash(password)
+        db.session.commit()
+        logger.info(f"Upgraded password hash for {user.email}")
+    except ServiceOverloadedError:
+        logger.info(f"Skipped password hash upgrade for {user.email}: hashing pool busy")
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        logger.error(f"Failed to store upgraded password hash: {str(e)}")
+
+
 def authenticate_user(email: str, password: str):
     """
     Used for internal authentication (if needed separately).
@@ -100,7 +119,7 @@ def authenticate_user(email: str, password: str):
     """
     try:
         user = User.query.filter_by(email=email).first()
-        if not user or not check_password_hash(user.password, password):
+        if not user or not password_hasher.verify(user.password, password):
             raise InvalidCredentialsError()
 
         access_token = create_access_token(identity=user.id, expires_delta=timedelta(hours=1))
@@ -0,0 +1,198 @@
+# backend/services/booking_hold_service.py
+# Expiry of pending-booking holds.
+#
+# A booking starts PENDING with hold_expires_at = now + BOOKING_HOLD_TTL_SECONDS and keeps
+# its seats until confirmed. The sweeper cancels holds that ran out, batch by batch, with
+# set-based statements only: one UPDATE for the bookings, one for their passengers, one
+# grouped count of the seats to give back and one executemany UPDATE on seat_inventory.
+# Routes of flights that were sold out get their fare calendars invalidated after commit.
+# Wallet payments of the expired bookings are refunded in the same transaction.
+#
+# Confirming requires hold_expires_at > now and the sweeper requires hold_expires_at <= now,
+# so the two never both win. Where the database supports UPDATE ... RETURNING, seats are
+# only released for the rows this sweep actually flipped, so concurrent sweepers (one per
+# worker process) or a user cancelling at the same moment never release seats twice.
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import update, select, func, bindparam
+from sqlalchemy.exc import SQLAlchemyError
+
+from extensions import db
+from models.booking import Booking
+from models.passenger_model import Passenger
+from models.seat_inventory import SeatInventory
+from models.enums import BookingStatusEnum, PassengerStatusEnum
+from services.wallet_service import refund_bookings
+from services.seat_inventory_service import sold_out_routes
+from services.flight_service import invalidate_fare_calendars
+from utils.periodic import PeriodicJob
+from utils.metrics import request_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _expire_batch(batch_size, now):
+    """Cancel up to batch_size expired holds in one transaction. Returns (bookings, seats) released."""
+    candidates = (
+        select(Booking.id)
+        .where(Booking.status == BookingStatusEnum.PENDING, Booking.hold_expires_at <= now)
+        .order_by(Booking.hold_expires_at)
+        .limit(batch_size)
+    )
+    dialect = db.session.get_bind().dialect
+    statement = (
+        update(Booking)
+        .where(Booking.status == BookingStatusEnum.PENDING, Booking.hold_expires_at <= now)
+        .values(status=BookingStatusEnum.CANCELLED)
+        .execution_options(synchronize_session=False)
+    )
+    if dialect.update_returning:
+        expired_ids = db.session.scalars(
+            statement.where(Booking.id.in_(candidates.scalar_subquery())).returning(Booking.id)
+        ).all()
+    else:
+        expired_ids = db.session.scalars(candidates.with_for_update(skip_locked=True)).all()
+        if expired_ids:
+            db.session.execute(statement.where(Booking.id.in_(expired_ids)))
+    if not expired_ids:
+        db.session.rollback()
+        return 0, 0
+
+    released = db.session.execute(
+        select(Booking.flight_id, Passenger.flight_class, func.count(Passenger.id))
+        .join(Booking, Passenger.booking_id == Booking.id)
+        .where(Passenger.booking_id.in_(expired_ids), Passenger.status == PassengerStatusEnum.BOOKED)
+        .group_by(Booking.flight_id, Passenger.flight_class)
+    ).all()
+
+    db.session.execute(
+        update(Passenger)
+        .where(Passenger.booking_id.in_(expired_ids), Passenger.status == PassengerStatusEnum.BOOKED)
+        .values(status=PassengerStatusEnum.CANCELLED, cancellation_time=now)
+        .execution_options(synchronize_session=False)
+    )
+    reopened = set()
+    if released:
+        reopened = sold_out_routes({flight_id for flight_id, _, _ in released})
+        inventory = SeatInventory.__table__
+        db.session.execute(
+            inventory.update()
+            .where(inventory.c.flight_id == bindparam("b_flight_id"),
+                   inventory.c.flight_class == bindparam("b_flight_class"))
+            .values(seats_remaining=inventory.c.seats_remaining + bindparam("b_seats")),
+            [{"b_flight_id": flight_id, "b_flight_class": flight_class, "b_seats": seats}
+             for flight_id, flight_class, seats in released]
+        )
+    refund_bookings(expired_ids)
+    db.session.commit()
+    invalidate_fare_calendars(reopened)
+    return len(expired_ids), sum(seats for _, _, seats in released)
+
+
+class HoldSweeper(PeriodicJob):
+    """Periodically expires stale holds on a background thread and keeps stats for /metrics."""
+
+    thread_name = "booking-hold-sweeper"
+
+    def __init__(self):
+        super().__init__(interval=30)
+        self.batch_size = 500
+        self._lock = threading.Lock()
+        self._stats = {
+            "sweeps": 0,
+            "expired": 0,
+            "seats_released": 0,
+            "errors": 0,
+            "sweep_seconds_total": 0.0,
+            "last_sweep_seconds": 0.0,
+            "lag_seconds": 0.0,
+            "last_sweep_time": 0.0,
+        }
+
+    def init_app(self, app):
+        self.batch_size = app.config.get("BOOKING_HOLD_SWEEP_BATCH_SIZE", 500)
+        self.interval = app.config.get("BOOKING_HOLD_SWEEP_INTERVAL", 30)
+        self.enabled = app.config.get("BOOKING_HOLD_SWEEPER_ENABLED", True) and self.interval > 0
+        request_metrics.register_collector("booking_hold_sweeper", self.metrics)
+
+    def run_scheduled(self):
+        self.sweep()
+
+    def metrics(self):
+        """Stats as /metrics samples (see RequestMetrics.register_collector)."""
+        stats = self.stats()
+        return [(name, kind, help_text, [({}, stats[key])]) for name, kind, key, help_text in (
+            ("booking_hold_sweeps_total", "counter", "sweeps", "Hold sweeper runs."),
+            ("booking_holds_expired_total", "counter", "expired", "Pending bookings cancelled because their hold expired."),
+            ("booking_hold_seats_released_total", "counter", "seats_released", "Seats returned to inventory by expired holds."),
+            ("booking_hold_sweep_errors_total", "counter", "errors", "Hold sweeps that failed with a database error."),
+            ("booking_hold_sweep_seconds_total", "counter", "sweep_seconds_total", "Time spent sweeping holds."),
+            ("booking_hold_sweep_last_duration_seconds", "gauge", "last_sweep_seconds", "Duration of the last sweep."),
+            ("booking_hold_sweep_lag_seconds", "gauge", "lag_seconds",
+             "Age of the oldest expired, not yet released hold when the last sweep started."),
+            ("booking_hold_sweep_last_run_timestamp_seconds", "gauge", "last_sweep_time", "Unix time of the last sweep."),
+        )]
+
+    def sweep(self, now=None, batch_size=None):
+        """Expire every hold that ran out by ``now``. Returns a summary dict."""
+        now = now or _utcnow()
+        batch_size = batch_size or self.batch_size
+        started = time.perf_counter()
+
+        oldest = db.session.scalar(
+            select(func.min(Booking.hold_expires_at))
+            .where(Booking.status == BookingStatusEnum.PENDING, Booking.hold_expires_at <= now)
+        )
+        lag = (now - oldest).total_seconds() if oldest else 0.0
+
+        expired = seats = batches = 0
+        try:
+            while True:
+                batch_expired, batch_seats = _expire_batch(batch_size, now)
+                if not batch_expired:
+                    break
+                expired += batch_expired
+                seats += batch_seats
+                batches += 1
+        except SQLAlchemyError:
+            db.session.rollback()
+            with self._lock:
+                self._stats["errors"] += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._stats["sweeps"] += 1
+                self._stats["expired"] += expired
+                self._stats["seats_released"] += seats
+                self._stats["sweep_seconds_total"] += elapsed
+                self._stats["last_sweep_seconds"] = elapsed
+                self._stats["lag_seconds"] = lag
+                self._stats["last_sweep_time"] = time.time()
+
+        if expired:
+            logger.info("Expired %s booking holds (%s seats) in %s batches, %.3fs.",
+                        expired, seats, batches, elapsed)
+        return {
+            "expired": expired,
+            "seats_released": seats,
+            "batches": batches,
+            "lag_seconds": round(lag, 3),
+            "elapsed_seconds": round(elapsed, 3),
+            "bookings_per_second": round(expired / elapsed, 1) if elapsed else None,
+        }
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+
+hold_sweeper = HoldSweeper()
@@ -1,23 +1,64 @@
 # services/booking_service.py
 
 import logging
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import update, or_
 from models.booking import Booking
-from models.passenger import Passenger
-from models.enums import BookingStatusEnum, PassengerStatusEnum
+from models.passenger_model import Passenger
+from models.enums import BookingStatusEnum, PassengerStatusEnum, FlightClass
 from extensions import db
 from sqlalchemy.exc import SQLAlchemyError
-from exceptions.custom_exceptions import BadRequestError, NotFoundError
+from sqlalchemy.orm import selectinload
+from exceptions.custom_exceptions import (
+    BadRequestError, NotFoundError, SeatsUnavailableError, BookingHoldExpiredError, InsufficientFundsError
+)
+from services.seat_inventory_service import reserve_seats, release_seats
+from services.fare_engine import quote_booking
+from services.flight_service import invalidate_fare_calendars
+from services.wallet_service import pay_for_booking, refund_bookings
+from utils.pagination import paginate
+from utils.db_routing import read_only
+from celery_app import enqueue
+from tasks.email_tasks import send_booking_confirmation, send_booking_cancellation
 from werkzeug.exceptions import Forbidden
 
 logger = logging.getLogger(__name__)
 
+
+def _bookings_query():
+    # BookingSchema nests passengers: load them for the whole page in one extra IN query
+    return Booking.query.options(selectinload(Booking.passengers))
+
+
 class BookingService:
 
     @staticmethod
     def create_booking(data):
         try:
             passengers_data = data.pop("passengers")
+            if not passengers_data:
+                raise BadRequestError("A booking needs at least one passenger.")
+
+            # Reserve every seat up front in one statement; a sold-out class
+            # aborts the booking before anything is inserted.
+            seat_counts = Counter(
+                passenger_data.get("flight_class", FlightClass.ECONOMY)
+                for passenger_data in passengers_data
+            )
+            # Price at the load factor seen before this booking's seats are taken
+            data["total_price"] = quote_booking(data["flight_id"], seat_counts)
+            sold_out = reserve_seats(data["flight_id"], seat_counts)
+
+            # Seats stay held until the booking is confirmed or the hold sweeper expires it
+            hold_ttl = current_app.config.get("BOOKING_HOLD_TTL_SECONDS", 0)
+            if hold_ttl > 0:
+                data["status"] = BookingStatusEnum.PENDING
+                data["hold_expires_at"] = datetime.utcnow() + timedelta(seconds=hold_ttl)
+            else:
+                data["status"] = BookingStatusEnum.CONFIRMED
+
             booking = Booking(**data)
             db.session.add(booking)
             db.session.flush()  # To get booking.id
@@ -26,8 +67,27 @@ class BookingService:
                 passenger = Passenger(**passenger_data, booking_id=booking.id)
                 db.session.add(passenger)
 
+            # Paid in the same transaction: no funds, no seats
+            if current_app.config.get("WALLET_PAYMENTS_ENABLED", True):
+                pay_for_booking(booking.user_id, booking.id, booking.total_price)
+
             db.session.commit()
+            invalidate_fare_calendars(sold_out)
+            if booking.status == BookingStatusEnum.CONFIRMED:
+                enqueue(send_booking_confirmation, booking.id)
             return booking
+        except SeatsUnavailableError as e:
+            db.session.rollback()
+            logger.warning("Booking rejected for flight %s: %s", data.get("flight_id"), e)
+            raise e
+        except InsufficientFundsError as e:
+            db.session.rollback()
+            logger.info("Booking rejected for user %s: %s", data.get("user_id"), e)
+            raise e
+        except NotFoundError as e:
+            db.session.rollback()
+            logger.warning("Booking rejected: %s", e)
+            raise e
         except SQLAlchemyError as e:
             db.session.rollback()
             logger.exception("Database error while creating booking.")
@@ -38,9 +98,52 @@ class BookingService:
             raise BadRequestError(str(e))
 
     @staticmethod
-    def get_bookings_by_user(user_id):
+    def confirm_booking(booking_id, user_id):
+        """
+        Confirm a PENDING booking while its hold is still valid, with one conditional UPDATE
+        (the hold sweeper uses the opposite condition on hold_expires_at, so only one wins).
+        """
+        try:
+            now = datetime.utcnow()
+            result = db.session.execute(
+                update(Booking)
+                .where(
+                    Booking.id == booking_id,
+                    Booking.user_id == user_id,
+                    Booking.status == BookingStatusEnum.PENDING,
+                    or_(Booking.hold_expires_at.is_(None), Booking.hold_expires_at > now),
+                )
+                .values(status=BookingStatusEnum.CONFIRMED, hold_expires_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            confirmed = result.rowcount == 1
+            db.session.commit()
+
+            booking = db.session.get(Booking, booking_id, options=[selectinload(Booking.passengers)],
+                                     populate_existing=True)
+            if not booking:
+                raise NotFoundError("Booking not found.")
+            if booking.user_id != user_id:
+                raise Forbidden("You are not allowed to confirm this booking.")
+            if confirmed:
+                enqueue(send_booking_confirmation, booking.id)
+            elif booking.status != BookingStatusEnum.CONFIRMED:  # confirming twice is a no-op
+                raise BookingHoldExpiredError("The seat hold for this booking has expired.")
+            return booking
+        except SQLAlchemyError:
+            db.session.rollback()
+            logger.exception("Database error while confirming booking.")
+            raise BadRequestError("Failed to confirm booking.")
+        except Forbidden as e:
+            logger.warning("Unauthorized confirmation attempt.")
+            raise e
+
+    @staticmethod
+    @read_only
+    def get_bookings_by_user(user_id, limit, cursor=None):
         try:
-            return Booking.query.filter_by(user_id=user_id).all()
+            query = _bookings_query().filter_by(user_id=user_id)
+            return paginate(query, Booking.booking_time, Booking.id, limit, cursor, descending=True)
         except SQLAlchemyError as e:
             logger.exception("Database error while retrieving bookings.")
             raise BadRequestError("Failed to retrieve bookings.")
@@ -48,7 +151,7 @@ class BookingService:
     @staticmethod
     def get_booking_by_id(booking_id):
         try:
-            booking = Booking.query.get(booking_id)
+            booking = db.session.get(Booking, booking_id, options=[selectinload(Booking.passengers)])
             if not booking:
                 raise NotFoundError("Booking not found.")
             return booking
@@ -66,12 +169,33 @@ class BookingService:
             if booking.user_id != user_id:
                 raise Forbidden("You are not allowed to cancel this booking.")
 
+            # Claim the cancellation atomically: the hold sweeper may be expiring this
+            # booking right now, and only one of us may give the seats back
+            claimed = db.session.execute(
+                update(Booking)
+                .where(Booking.id == booking_id, Booking.status != BookingStatusEnum.CANCELLED)
+                .values(status=BookingStatusEnum.CANCELLED, hold_expires_at=None)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if not claimed:
+                db.session.rollback()
+                return
+
+            released = Counter()
             booking.status = BookingStatusEnum.CANCELLED
+            booking.hold_expires_at = None
             for passenger in booking.passengers:
+                if passenger.status == PassengerStatusEnum.BOOKED:
+                    released[passenger.flight_class] += 1
                 passenger.status = PassengerStatusEnum.CANCELLED
                 passenger.cancellation_time = datetime.utcnow()
 
+            reopened = release_seats(booking.flight_id, released)
+            refund_bookings([booking.id])
+
             db.session.commit()
+            invalidate_fare_calendars(reopened)
+            enqueue(send_booking_cancellation, booking.id)
         except SQLAlchemyError:
             db.session.rollback()
             logger.exception("Database error while cancelling booking.")
@@ -82,5 +206,15 @@ class BookingService:
         
 
     @staticmethod
-    def get_all_bookings():
-        return Booking.query.all()
+    def get_all_bookings_query():
+        """Unpaged query over every booking, newest first, for streaming responses."""
+        return _bookings_query().order_by(Booking.booking_time.desc(), Booking.id.desc())
+
+    @staticmethod
+    @read_only
+    def get_all_bookings(limit, cursor=None):
+        try:
+            return paginate(_bookings_query(), Booking.booking_time, Booking.id, limit, cursor, descending=True)
+        except SQLAlchemyError:
+            logger.exception("Database error while retrieving all bookings.")
+            raise BadRequestError("Failed to retrieve bookings.")
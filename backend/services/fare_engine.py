@@ -0,0 +1,137 @@
+# backend/services/fare_engine.py
+# Dynamic per-class fares, computed for whole batches of flights with NumPy.
+#
+# Flight.price is the base (economy) fare. For each flight and cabin class:
+#
+#   fare = base * class_multiplier
+#               * (1 + load_weight * load_factor ** load_exponent)
+#               * (1 + last_minute_weight * exp(-days_to_departure / last_minute_days))
+#
+# where load_factor is the share of that class already sold. Everything is evaluated as
+# (n_flights x n_classes) array math, so pricing a page of search results costs one
+# inventory query plus a few vector operations, not per-row Python.
+
+import logging
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+
+from extensions import db
+from models.seat_inventory import SeatInventory
+from models.flight import Flight
+from models.enums import FlightClass
+from exceptions.custom_exceptions import NotFoundError
+
+logger = logging.getLogger(__name__)
+
+CLASSES = (FlightClass.ECONOMY, FlightClass.BUSINESS, FlightClass.FIRST_CLASS)
+_CLASS_INDEX = {flight_class: index for index, flight_class in enumerate(CLASSES)}
+
+# Oracle rejects IN lists longer than 1000 expressions
+_IN_CHUNK = 1000
+
+
+def parse_class_multipliers(value):
+    """'ECONOMY=1,BUSINESS=2.5,FIRST_CLASS=4' -> array ordered like CLASSES."""
+    multipliers = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        name, _, multiplier = item.partition("=")
+        multipliers[FlightClass[name.strip().upper()]] = float(multiplier)
+    return np.array([multipliers.get(flight_class, 1.0) for flight_class in CLASSES])
+
+
+class FareEngine:
+
+    def __init__(self):
+        self.class_multipliers = np.array([1.0, 2.5, 4.0])
+        self.load_weight = 1.0
+        self.load_exponent = 2.0
+        self.last_minute_weight = 0.5
+        self.last_minute_days = 14.0
+
+    def init_app(self, app):
+        config = app.config
+        self.class_multipliers = parse_class_multipliers(
+            config.get("FARE_CLASS_MULTIPLIERS", "ECONOMY=1.0,BUSINESS=2.5,FIRST_CLASS=4.0"))
+        self.load_weight = config.get("FARE_LOAD_FACTOR_WEIGHT", 1.0)
+        self.load_exponent = config.get("FARE_LOAD_FACTOR_EXPONENT", 2.0)
+        self.last_minute_weight = config.get("FARE_LAST_MINUTE_WEIGHT", 0.5)
+        self.last_minute_days = config.get("FARE_LAST_MINUTE_DAYS", 14.0)
+
+    def price(self, base_prices, days_to_departure, seats_total, seats_remaining):
+        """
+        Fares for n flights: base_prices and days_to_departure have shape (n,), seats_total
+        and seats_remaining shape (n, len(CLASSES)). Returns an (n, len(CLASSES)) float
+        array rounded to cents.
+        """
+        base = np.asarray(base_prices, dtype=np.float64)[:, None]
+        days = np.clip(np.asarray(days_to_departure, dtype=np.float64), 0.0, None)[:, None]
+        total = np.asarray(seats_total, dtype=np.float64)
+        remaining = np.asarray(seats_remaining, dtype=np.float64)
+
+        load_factor = np.divide(total - remaining, total, out=np.zeros_like(total), where=total > 0)
+        load_multiplier = 1.0 + self.load_weight * np.clip(load_factor, 0.0, 1.0) ** self.load_exponent
+        last_minute_multiplier = 1.0 + self.last_minute_weight * np.exp(-days / self.last_minute_days)
+        return np.round(base * self.class_multipliers * load_multiplier * last_minute_multiplier, 2)
+
+
+fare_engine = FareEngine()
+
+
+def _inventory_arrays(flight_ids):
+    """(seats_total, seats_remaining) arrays of shape (n, len(CLASSES)) for flight_ids, in order."""
+    position = {flight_id: index for index, flight_id in enumerate(flight_ids)}
+    total = np.zeros((len(flight_ids), len(CLASSES)))
+    remaining = np.zeros((len(flight_ids), len(CLASSES)))
+    unique_ids = list(position)
+    for start in range(0, len(unique_ids), _IN_CHUNK):
+        rows = db.session.query(
+            SeatInventory.flight_id, SeatInventory.flight_class,
+            SeatInventory.total_seats, SeatInventory.seats_remaining
+        ).filter(SeatInventory.flight_id.in_(unique_ids[start:start + _IN_CHUNK]))
+        for flight_id, flight_class, seats_total, seats_remaining in rows:
+            index = (position[flight_id], _CLASS_INDEX[flight_class])
+            total[index] = seats_total
+            remaining[index] = seats_remaining
+    return total, remaining
+
+
+def _days_until(departure_times, now):
+    departures = np.array(departure_times, dtype="datetime64[s]")
+    return (departures - np.datetime64(now, "s")) / np.timedelta64(1, "D")
+
+
+def quote_flights(flights, now=None):
+    """
+    Fares for a batch of flights (anything with id, price and departure_time: ORM rows,
+    search-index records or flight_details_query() rows).
+
+    Returns {flight_id: {"ECONOMY": "123.45", ...}} with fares as strings, like Flight.serialize().
+    """
+    flights = list(flights)
+    if not flights:
+        return {}
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+
+    flight_ids = [flight.id for flight in flights]
+    seats_total, seats_remaining = _inventory_arrays(flight_ids)
+    fares = fare_engine.price(
+        [float(flight.price) for flight in flights],
+        _days_until([flight.departure_time for flight in flights], now),
+        seats_total,
+        seats_remaining,
+    )
+    formatted = np.char.mod("%.2f", fares).tolist()
+    names = [flight_class.value for flight_class in CLASSES]
+    return {flight_id: dict(zip(names, row)) for flight_id, row in zip(flight_ids, formatted)}
+
+
+def quote_booking(flight_id, class_counts, now=None):
+    """Total fare (Decimal) for ``class_counts`` ({FlightClass: passengers}) on one flight."""
+    flight = db.session.query(Flight.id, Flight.price, Flight.departure_time).filter(Flight.id == flight_id).first()
+    if flight is None:
+        raise NotFoundError(f"Flight with ID {flight_id} not found.")
+    fares = quote_flights([flight], now)[flight_id]
+    return sum((Decimal(fares[flight_class.value]) * count for flight_class, count in class_counts.items()),
+               Decimal("0.00"))
@@ -0,0 +1,193 @@
+# backend/services/flight_import_service.py
+# Bulk import of flight schedules from CSV or JSONL.
+#
+# Rows are processed in chunks: every chunk resolves its airplanes, airports and
+# existing flight numbers with one IN query each, validates all rows in memory and
+# inserts the valid ones (plus their seat inventory) with executemany-style bulk
+# inserts and a single commit. Invalid rows are reported back instead of aborting
+# the import.
+
+import logging
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+
+from sqlalchemy import insert
+
+from extensions import db
+from models.flight import Flight
+from models.airplane import Airplane
+from models.airport import Airport
+from models.seat_inventory import SeatInventory
+from models.enums import FlightStatus, FlightClass
+from services.flight_search_index import flight_search_index
+from services.itinerary_service import flight_graph
+from services.flight_service import invalidate_fare_calendars
+from utils.bulk_import import run_import, split_row_errors
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_FIELDS = (
+    "flight_number", "airplane_id", "departure_airport_id", "arrival_airport_id",
+    "departure_time", "arrival_time", "status", "price",
+)
+_STATUSES = {status.name for status in FlightStatus}
+
+
+def _parse_time(value):
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(str(value).strip())
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _validate_chunk(chunk, now):
+    """
+    Validate rows of one chunk with three set-based lookups.
+    Returns (valid flight dicts, [(row_number, errors)]).
+    """
+    rows, errors = split_row_errors(chunk)
+    candidates = []
+    for row_number, row in rows:
+        missing = [field for field in REQUIRED_FIELDS if row.get(field) in (None, "")]
+        if missing:
+            errors.append((row_number, [f"Missing field(s): {', '.join(missing)}"]))
+            continue
+        candidates.append((row_number, row))
+
+    parsed = []
+    for row_number, row in candidates:
+        row_errors = []
+        try:
+            airplane_id = int(row["airplane_id"])
+            departure_airport_id = int(row["departure_airport_id"])
+            arrival_airport_id = int(row["arrival_airport_id"])
+        except (TypeError, ValueError):
+            row_errors.append("airplane_id and airport ids must be integers.")
+            airplane_id = departure_airport_id = arrival_airport_id = None
+        try:
+            departure_time = _parse_time(row["departure_time"])
+            arrival_time = _parse_time(row["arrival_time"])
+        except ValueError:
+            row_errors.append("Times must be ISO 8601 (e.g. 2030-01-31 14:05:00).")
+            departure_time = arrival_time = None
+        try:
+            price = Decimal(str(row["price"]))
+            if price < 0:
+                row_errors.append("Price cannot be negative.")
+        except InvalidOperation:
+            row_errors.append("Price must be a number.")
+            price = None
+
+        status = str(row["status"]).strip().upper()
+        if status not in _STATUSES:
+            row_errors.append(f"Invalid status: {row['status']}")
+        if departure_time and arrival_time:
+            if departure_time < now:
+                row_errors.append("Departure time cannot be in the past.")
+            if arrival_time <= departure_time:
+                row_errors.append("Arrival time must be after departure time.")
+        if departure_airport_id is not None and departure_airport_id == arrival_airport_id:
+            row_errors.append("Departure and arrival airports must differ.")
+
+        if row_errors:
+            errors.append((row_number, row_errors))
+            continue
+        parsed.append((row_number, {
+            "flight_number": str(row["flight_number"]).strip(),
+            "airplane_id": airplane_id,
+            "departure_airport_id": departure_airport_id,
+            "arrival_airport_id": arrival_airport_id,
+            "departure_time": departure_time,
+            "arrival_time": arrival_time,
+            "status": status,
+            "price": price,
+        }))
+
+    if not parsed:
+        return [], errors
+
+    airplane_ids = {flight["airplane_id"] for _, flight in parsed}
+    airport_ids = {flight[key] for _, flight in parsed for key in ("departure_airport_id", "arrival_airport_id")}
+    flight_numbers = {flight["flight_number"] for _, flight in parsed}
+
+    airplanes = {
+        row.id: row for row in db.session.query(
+            Airplane.id, Airplane.economy_seats, Airplane.business_seats, Airplane.first_class_seats
+        ).filter(Airplane.id.in_(airplane_ids))
+    }
+    known_airports = {row.id for row in db.session.query(Airport.id).filter(Airport.id.in_(airport_ids))}
+    taken_numbers = {
+        row.flight_number for row in
+        db.session.query(Flight.flight_number).filter(Flight.flight_number.in_(flight_numbers))
+    }
+
+    valid = []
+    for row_number, flight in parsed:
+        row_errors = []
+        if flight["airplane_id"] not in airplanes:
+            row_errors.append(f"Airplane with ID {flight['airplane_id']} not found.")
+        if flight["departure_airport_id"] not in known_airports:
+            row_errors.append(f"Source Airport with ID {flight['departure_airport_id']} not found.")
+        if flight["arrival_airport_id"] not in known_airports:
+            row_errors.append(f"Destination Airport with ID {flight['arrival_airport_id']} not found.")
+        if flight["flight_number"] in taken_numbers:
+            row_errors.append(f"Flight number {flight['flight_number']} already exists.")
+
+        if row_errors:
+            errors.append((row_number, row_errors))
+            continue
+        taken_numbers.add(flight["flight_number"])  # duplicates later in the same file
+        valid.append((row_number, flight, airplanes[flight["airplane_id"]]))
+    return valid, errors
+
+
+def _insert_chunk(valid):
+    """Insert flights and their seat inventory in one transaction."""
+    flights = [flight for _, flight, _ in valid]
+    flight_ids = db.session.scalars(
+        insert(Flight).returning(Flight.id, sort_by_parameter_order=True),
+        flights
+    ).all()
+
+    inventory = []
+    for flight_id, (_, _, airplane) in zip(flight_ids, valid):
+        for flight_class, seats in (
+            (FlightClass.ECONOMY, airplane.economy_seats),
+            (FlightClass.BUSINESS, airplane.business_seats),
+            (FlightClass.FIRST_CLASS, airplane.first_class_seats),
+        ):
+            inventory.append({
+                "flight_id": flight_id,
+                "flight_class": flight_class,
+                "total_seats": seats,
+                "seats_remaining": seats,
+            })
+    db.session.execute(insert(SeatInventory), inventory)
+    db.session.commit()
+    invalidate_fare_calendars((flight["departure_airport_id"], flight["arrival_airport_id"]) for flight in flights)
+    return {"imported": len(valid)}
+
+
+def import_flights(rows, chunk_size=1000, max_reported_errors=1000):
+    """
+    Import (row_number, dict) pairs as flights.
+
+    Returns a report with the number of imported and failed rows, per-row
+    errors (capped at ``max_reported_errors``) and throughput.
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    report = None
+    try:
+        report = run_import(
+            rows, lambda chunk: _validate_chunk(chunk, now), _insert_chunk, ("imported",),
+            chunk_size=chunk_size, max_reported_errors=max_reported_errors, label="flights"
+        )
+        return report
+    finally:
+        if report is None or report["imported"]:
+            # Bulk inserts bypass create_flight, so drop the in-memory search structures wholesale
+            flight_search_index.clear()
+            flight_graph.invalidate()
@@ -0,0 +1,155 @@
+# backend/services/flight_lifecycle_service.py
+# Scheduled flight status transitions, driven by departure_time/arrival_time:
+#
+#   ACTIVE      -> COMPLETED    arrival_time <= now (the job was not running at departure)
+#   IN_PROGRESS -> COMPLETED    arrival_time <= now
+#   ACTIVE      -> IN_PROGRESS  departure_time <= now < arrival_time
+#
+# Every transition is one bulk UPDATE, and a tick runs in one transaction. Only the holder
+# of the "flight_lifecycle" lease (utils/leases.py) runs ticks, so several nodes can
+# schedule the job. CANCELLED flights are never touched.
+
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+from sqlalchemy import update
+
+from extensions import db
+from models.flight import Flight
+from models.enums import FlightStatus
+from services.flight_service import invalidate_flight_routes
+from services.flight_search_index import flight_search_index
+from services.itinerary_service import flight_graph
+from utils.leases import acquire_lease
+from utils.periodic import PeriodicJob
+from utils.metrics import request_metrics
+
+logger = logging.getLogger(__name__)
+
+LEASE_NAME = "flight_lifecycle"
+
+
+def _transitions(now):
+    """(from_status, to_status, extra condition) in execution order."""
+    return (
+        (FlightStatus.ACTIVE, FlightStatus.COMPLETED, Flight.arrival_time <= now),
+        (FlightStatus.IN_PROGRESS, FlightStatus.COMPLETED, Flight.arrival_time <= now),
+        (FlightStatus.ACTIVE, FlightStatus.IN_PROGRESS, Flight.departure_time <= now),
+    )
+
+
+def advance_flight_statuses(now=None):
+    """
+    Apply every due transition in one transaction.
+    Returns {"ACTIVE->COMPLETED": rows, ...} for each transition.
+    """
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    returning = db.session.get_bind().dialect.update_returning
+    counts = {}
+    changed = []  # (id, departure_airport_id, arrival_airport_id) of every flight that moved
+    try:
+        for from_status, to_status, condition in _transitions(now):
+            statement = (
+                update(Flight)
+                .where(Flight.status == from_status.value, condition)
+                .values(status=to_status.value)
+                .execution_options(synchronize_session=False)
+            )
+            if returning:
+                rows = db.session.execute(statement.returning(
+                    Flight.id, Flight.departure_airport_id, Flight.arrival_airport_id)).all()
+                changed.extend(rows)
+                touched = len(rows)
+            else:
+                touched = db.session.execute(statement).rowcount
+            counts[f"{from_status.value}->{to_status.value}"] = touched
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    if any(counts.values()):
+        # Search results carry each flight's status, so every transition stales its route
+        if returning:
+            invalidate_flight_routes(*((dep, arr) for _, dep, arr in changed))
+            for flight_id, _, _ in changed:
+                flight_graph.remove_flight(flight_id)  # no-op for flights already out of the graph
+        else:
+            flight_search_index.clear()
+            flight_graph.invalidate()
+    return counts
+
+
+class FlightLifecycleJob(PeriodicJob):
+    """Runs advance_flight_statuses() every FLIGHT_LIFECYCLE_INTERVAL seconds on the lease holder."""
+
+    thread_name = "flight-lifecycle"
+
+    def __init__(self):
+        super().__init__(interval=60)
+        self.lease_seconds = 180
+        self._lock = threading.Lock()
+        self._ticks = 0
+        self._skipped = 0
+        self._last_tick_seconds = 0.0
+        self._transitions = Counter()
+
+    def init_app(self, app):
+        self.interval = app.config.get("FLIGHT_LIFECYCLE_INTERVAL", 60)
+        self.lease_seconds = app.config.get("FLIGHT_LIFECYCLE_LEASE_SECONDS", 180)
+        self.enabled = app.config.get("FLIGHT_LIFECYCLE_ENABLED", True) and self.interval > 0
+        request_metrics.register_collector("flight_lifecycle", self.metrics)
+
+    def run_scheduled(self):
+        self.tick()
+
+    def metrics(self):
+        """Stats as /metrics samples (see RequestMetrics.register_collector)."""
+        stats = self.stats()
+        transitions = []
+        for transition, count in sorted(stats["transitions"].items()):
+            from_status, _, to_status = transition.partition("->")
+            transitions.append(({"from": from_status, "to": to_status}, count))
+        return [
+            ("flight_lifecycle_ticks_total", "counter", "Flight lifecycle runs on this node (lease held).",
+             [({}, stats["ticks"])]),
+            ("flight_lifecycle_skipped_total", "counter",
+             "Flight lifecycle runs skipped because another node holds the lease.", [({}, stats["skipped"])]),
+            ("flight_lifecycle_last_tick_seconds", "gauge", "Duration of the last flight lifecycle run.",
+             [({}, stats["last_tick_seconds"])]),
+            ("flight_status_transitions_total", "counter", "Flights moved between statuses by the lifecycle job.",
+             transitions),
+        ]
+
+    def tick(self, now=None):
+        """One run under the lease. Returns the transition counts, or None if another node holds the lease."""
+        if not acquire_lease(LEASE_NAME, self.lease_seconds):
+            with self._lock:
+                self._skipped += 1
+            return None
+
+        started = time.perf_counter()
+        counts = advance_flight_statuses(now)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._ticks += 1
+            self._last_tick_seconds = elapsed
+            self._transitions.update(counts)
+        if any(counts.values()):
+            logger.info("Flight lifecycle tick in %.3fs: %s", elapsed, counts)
+        return counts
+
+    def stats(self):
+        with self._lock:
+            return {
+                "ticks": self._ticks,
+                "skipped": self._skipped,
+                "last_tick_seconds": self._last_tick_seconds,
+                "transitions": dict(self._transitions),
+            }
+
+
+flight_lifecycle_job = FlightLifecycleJob()
@@ -0,0 +1,174 @@
+# backend/services/flight_search_index.py
+# Per-process index of flights keyed by (departure_airport_id, arrival_airport_id, departure date).
+# Routes are loaded lazily on first search and dropped whenever a flight on them is written.
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import namedtuple
+from datetime import datetime
+
+from models.flight import Flight
+from utils.db_routing import read_primary
+
+logger = logging.getLogger(__name__)
+
+_FLIGHT_COLUMNS = (
+    Flight.id,
+    Flight.flight_number,
+    Flight.airplane_id,
+    Flight.departure_airport_id,
+    Flight.arrival_airport_id,
+    Flight.departure_time,
+    Flight.arrival_time,
+    Flight.status,
+    Flight.price,
+)
+
+
+class FlightRecord(namedtuple("FlightRecord", [column.key for column in _FLIGHT_COLUMNS])):
+    """Compact, read-only copy of a Flight row."""
+    __slots__ = ()
+
+    def serialize(self):
+        return {
+            "id": self.id,
+            "flight_number": self.flight_number,
+            "airplane_id": self.airplane_id,
+            "departure_airport_id": self.departure_airport_id,
+            "arrival_airport_id": self.arrival_airport_id,
+            "departure_time": self.departure_time,
+            "arrival_time": self.arrival_time,
+            "status": self.status,
+            "price": str(self.price),
+        }
+
+
+def to_naive_datetime(value):
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    return datetime(value.year, value.month, value.day)
+
+
+def _day_of(value):
+    return value.date() if isinstance(value, datetime) else value
+
+
+class _RouteEntry:
+    __slots__ = ("loaded_at", "days", "by_day")
+
+    def __init__(self, records):
+        self.loaded_at = time.monotonic()
+        self.by_day = {}
+        for record in records:
+            self.by_day.setdefault(_day_of(record.departure_time), []).append(record)
+        for bucket in self.by_day.values():
+            bucket.sort(key=lambda record: (to_naive_datetime(record.departure_time), record.id))
+        self.days = sorted(self.by_day)
+
+
+class FlightSearchIndex:
+    """
+    Route/date index used by search_flights.
+
+    Each route is loaded with one column-only query the first time it is
+    searched. Writes through flight_service invalidate the affected routes;
+    ``ttl`` bounds how stale a route can get when another worker process
+    performs the write.
+    """
+
+    def __init__(self, enabled=True, ttl=60):
+        self.enabled = enabled
+        self.ttl = ttl
+        self._routes = {}
+        self._lock = threading.Lock()
+        self._generation = 0  # bumped on every invalidation
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def init_app(self, app):
+        self.enabled = app.config.get("FLIGHT_SEARCH_INDEX_ENABLED", True)
+        self.ttl = app.config.get("FLIGHT_SEARCH_INDEX_TTL", 60)
+
+    def _load_route(self, departure_airport_id, arrival_airport_id):
+        # From the primary: the invalidating write must be in what gets indexed
+        with read_primary():
+            rows = (
+                Flight.query
+                .with_entities(*_FLIGHT_COLUMNS)
+                .filter(
+                    Flight.departure_airport_id == departure_airport_id,
+                    Flight.arrival_airport_id == arrival_airport_id
+                )
+                .all()
+            )
+        return _RouteEntry(FlightRecord(*row) for row in rows)
+
+    def _get_route(self, departure_airport_id, arrival_airport_id):
+        key = (departure_airport_id, arrival_airport_id)
+        entry = self._routes.get(key)
+        if entry is not None and (not self.ttl or time.monotonic() - entry.loaded_at < self.ttl):
+            with self._lock:
+                self.hits += 1
+            return entry
+
+        generation = self._generation
+        entry = self._load_route(departure_airport_id, arrival_airport_id)
+        with self._lock:
+            self.misses += 1
+            # Skip caching if a write invalidated the index while we were loading
+            if generation == self._generation:
+                self._routes[key] = entry
+        logger.debug("Loaded route %s into the flight search index.", key)
+        return entry
+
+    def search(self, departure_airport_id, arrival_airport_id, departure_time=None):
+        """Flights on the route departing at or after ``departure_time``, ordered by departure."""
+        entry = self._get_route(departure_airport_id, arrival_airport_id)
+
+        if departure_time is None:
+            return [record for day in entry.days for record in entry.by_day[day]]
+
+        earliest = to_naive_datetime(departure_time)
+        start = bisect_left(entry.days, earliest.date())
+        return [
+            record
+            for day in entry.days[start:]
+            for record in entry.by_day[day]
+            if to_naive_datetime(record.departure_time) >= earliest
+        ]
+
+    def invalidate_route(self, departure_airport_id, arrival_airport_id):
+        with self._lock:
+            self._generation += 1
+            if self._routes.pop((departure_airport_id, arrival_airport_id), None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._routes)
+            self._routes = {}
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "ttl": self.ttl,
+                "routes": len(self._routes),
+                "flights": sum(len(bucket) for entry in self._routes.values() for bucket in entry.by_day.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = self.invalidations = 0
+
+
+flight_search_index = FlightSearchIndex()
@@ -1,16 +1,102 @@
+import calendar
 import logging
+from datetime import date, timedelta
+from flask import current_app
+from sqlalchemy import select, func, exists, or_, Date, cast
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy.orm import aliased
 from extensions import db
 from models.flight import Flight
 from models.airplane import Airplane
 from models.airport import Airport
+from models.seat_inventory import SeatInventory
 from exceptions.custom_exceptions import BadRequestError, NotFoundError
 from datetime import datetime, timezone
 from models.enums import FlightStatus
+from utils.pagination import paginate
+from utils.db_routing import read_only
+from utils.versioned_cache import cached, bump_version
+from utils.conditional import table_validator, row_validator
+from services.seat_inventory_service import add_inventory_for_flight, get_inventory
+from services.flight_search_index import flight_search_index
+from services.itinerary_service import flight_graph
+from services.airplane_service import get_airplane_data
+from services.airport_service import get_airport_data
+from services.review_service import move_route_ratings, delete_flight_reviews
 
 
 logger = logging.getLogger(__name__)
 
+
+def _cached_or_none(getter, *args):
+    try:
+        return getter(*args)
+    except NotFoundError:
+        return None
+
+
+def _calendar_namespace(departure_airport_id, arrival_airport_id):
+    return f"fare_calendar:{departure_airport_id}:{arrival_airport_id}"
+
+
+def invalidate_flight_routes(*routes):
+    """Drop cached search data for the given (departure_airport_id, arrival_airport_id) routes."""
+    for departure_airport_id, arrival_airport_id in set(routes):
+        flight_search_index.invalidate_route(departure_airport_id, arrival_airport_id)
+        bump_version(_calendar_namespace(departure_airport_id, arrival_airport_id))
+
+
+def invalidate_fare_calendars(routes):
+    """For bulk flight writes, and for flights selling out or reopening (see sold_out_routes)."""
+    for departure_airport_id, arrival_airport_id in set(routes):
+        bump_version(_calendar_namespace(departure_airport_id, arrival_airport_id))
+
+
+def flight_details_query():
+    """
+    Denormalized flight view: flight columns plus airport codes/cities, airplane model
+    and total seats remaining, selected as plain columns in one joined statement.
+    seats_remaining is None for flights whose inventory has not been backfilled yet.
+    """
+    departure = aliased(Airport, name="departure_airport")
+    arrival = aliased(Airport, name="arrival_airport")
+    seats_remaining = (
+        select(func.sum(SeatInventory.seats_remaining))
+        .where(SeatInventory.flight_id == Flight.id)
+        .correlate(Flight)
+        .scalar_subquery()
+    )
+    return (
+        db.session.query(
+            Flight.id,
+            Flight.flight_number,
+            Flight.airplane_id,
+            Flight.departure_airport_id,
+            Flight.arrival_airport_id,
+            Flight.departure_time,
+            Flight.arrival_time,
+            Flight.status,
+            Flight.price,
+            departure.airport_code.label("departure_airport_code"),
+            departure.city.label("departure_city"),
+            arrival.airport_code.label("arrival_airport_code"),
+            arrival.city.label("arrival_city"),
+            Airplane.model.label("airplane_model"),
+            seats_remaining.label("seats_remaining"),
+        )
+        .join(departure, Flight.departure_airport_id == departure.id)
+        .join(arrival, Flight.arrival_airport_id == arrival.id)
+        .join(Airplane, Flight.airplane_id == Airplane.id)
+    )
+
+
+def serialize_flight_details(row):
+    """Row of flight_details_query() -> dict, formatted like Flight.serialize()."""
+    flight = row._asdict()
+    flight["price"] = str(flight["price"])
+    return flight
+
+
 def create_flight(data):
     try:
         logger.info("Received flight creation request: %s", data)
@@ -29,9 +115,9 @@ def create_flight(data):
 
         logger.debug("Validating related entities...")
 
-        airplane = Airplane.query.get(airplane_id)
-        source_airport = Airport.query.get(source_airport_id)
-        destination_airport = Airport.query.get(destination_airport_id)
+        airplane = _cached_or_none(get_airplane_data, airplane_id)
+        source_airport = get_airport_data(source_airport_id)
+        destination_airport = get_airport_data(destination_airport_id)
 
         missing = []
         if not airplane:
@@ -73,7 +159,10 @@ def create_flight(data):
         )
 
         db.session.add(flight)
+        add_inventory_for_flight(flight, airplane)
         db.session.commit()
+        invalidate_flight_routes((flight.departure_airport_id, flight.arrival_airport_id))
+        flight_graph.upsert_flight(flight)
 
         logger.info("Flight successfully created with ID %s", flight.id)
         return flight
@@ -97,22 +186,21 @@ def create_flight(data):
         db.session.rollback()
         raise RuntimeError("An unexpected error occurred. Please contact support.")
 
-def get_all_flights():
+@read_only
+def get_all_flights(limit, cursor=None, expand=False):
     try:
-        logger.info("Fetching all flights...")
-
-        # Fetch all flights
-        flights = Flight.query.all()
+        logger.info("Fetching flights page (limit=%d)...", limit)
 
-        if not flights:
-            raise NotFoundError("No flights found.")
+        # Fetch one page ordered by departure time
+        query = flight_details_query() if expand else Flight.query
+        page = paginate(query, Flight.departure_time, Flight.id, limit, cursor)
 
-        logger.debug("Successfully fetched %d flights.", len(flights))
-        return flights
+        logger.debug("Successfully fetched %d flights.", len(page.items))
+        return page
 
-    except NotFoundError as e:
-        logger.exception("NotFoundError occurred: %s", e)
-        raise NotFoundError(str(e))
+    except BadRequestError as e:
+        logger.warning("BadRequestError occurred: %s", e)
+        raise BadRequestError(str(e))
     except SQLAlchemyError as e:
         logger.exception("SQLAlchemyError during fetching all flights: %s", e)
         raise RuntimeError("Database error occurred. Please try again later.")
@@ -121,6 +209,14 @@ def get_all_flights():
         raise RuntimeError("An unexpected error occurred. Please contact support.")
 
 
+def get_all_flights_query(expand=False):
+    """Unpaged query over every flight, ordered like get_all_flights, for streaming responses."""
+    logger.info("Streaming all flights...")
+    query = flight_details_query() if expand else Flight.query
+    return query.order_by(Flight.departure_time, Flight.id)
+
+
+@read_only
 def get_flight_by_id(flight_id):
     try:
         logger.info("Fetching flight with ID %d...", flight_id)
@@ -144,6 +240,32 @@ def get_flight_by_id(flight_id):
         logger.exception("Unexpected error during fetching flight by ID: %s", e)
         raise RuntimeError("An unexpected error occurred. Please contact support.")
 
+
+def flights_validator(expand=False):
+    """
+    Conditional-GET validator for the flight list. None for the expanded view: its
+    seats_remaining changes with every booking without touching the flights table.
+    """
+    return None if expand else table_validator(Flight)
+
+
+def flight_validator(flight_id):
+    return row_validator(Flight, flight_id)
+
+
+def get_flight_seats(flight_id):
+    try:
+        logger.info("Fetching seat inventory for flight ID %d...", flight_id)
+        return get_inventory(flight_id)
+
+    except NotFoundError as e:
+        logger.exception("NotFoundError occurred: %s", e)
+        raise NotFoundError(str(e))
+    except SQLAlchemyError as e:
+        logger.exception("SQLAlchemyError during fetching seat inventory: %s", e)
+        db.session.rollback()
+        raise RuntimeError("Database error occurred. Please try again later.")
+
 def update_flight(flight_id, data):
     try:
         logger.info("Updating flight with ID %d...", flight_id)
@@ -154,6 +276,8 @@ def update_flight(flight_id, data):
         if not flight:
             raise NotFoundError(f"Flight with ID {flight_id} not found.")
 
+        old_route = (flight.departure_airport_id, flight.arrival_airport_id)
+
         # Update fields
         flight.flight_number = data.get("flight_number", flight.flight_number)
         flight.departure_airport_id = data.get("departure_airport_id", flight.departure_airport_id)
@@ -162,9 +286,16 @@ def update_flight(flight_id, data):
         flight.arrival_time = data.get("arrival_time", flight.arrival_time)
         flight.status = data.get("status", flight.status)
         flight.price = data.get("price", flight.price)
+        new_route = (flight.departure_airport_id, flight.arrival_airport_id)
+
+        # Write (and lock) the flight row before moving its rating totals to the new route
+        db.session.flush()
+        move_route_ratings(flight_id, old_route, new_route)
 
         # Commit the changes
         db.session.commit()
+        invalidate_flight_routes(old_route, new_route)
+        flight_graph.upsert_flight(flight)
 
         logger.info("Successfully updated flight with ID %d.", flight.id)
         return flight
@@ -191,8 +322,11 @@ def delete_flight(flight_id):
         if not flight:
             raise NotFoundError(f"Flight with ID {flight_id} not found.")
 
+        delete_flight_reviews(flight_id, (flight.departure_airport_id, flight.arrival_airport_id))
         db.session.delete(flight)
         db.session.commit()
+        invalidate_flight_routes((flight.departure_airport_id, flight.arrival_airport_id))
+        flight_graph.remove_flight(flight_id)
 
         logger.info("Successfully deleted flight with ID %d.", flight.id)
 
@@ -211,12 +345,21 @@ def delete_flight(flight_id):
 
 
 
-def search_flights(departure_airport_id=None, arrival_airport_id=None, departure_time=None):
+@read_only
+def search_flights(departure_airport_id=None, arrival_airport_id=None, departure_time=None, expand=False):
     try:
         logger.info(f"Searching flights with filters - Departure Airport: {departure_airport_id}, Arrival Airport: {arrival_airport_id}, Departure Time: {departure_time}")
 
+        # Fully specified routes are answered from the in-memory index (ids only, so not when expanded)
+        if flight_search_index.enabled and departure_airport_id and arrival_airport_id and not expand:
+            flights = flight_search_index.search(departure_airport_id, arrival_airport_id, departure_time)
+            if not flights:
+                raise NotFoundError("No flights found matching the criteria.")
+            logger.debug(f"Found {len(flights)} flights in the search index.")
+            return flights
+
         # Construct the base query
-        query = Flight.query
+        query = flight_details_query() if expand else Flight.query
 
         # Apply filters only if the parameters are provided
         if departure_airport_id:
@@ -229,7 +372,7 @@ def search_flights(departure_airport_id=None, arrival_airport_id=None, departure
             query = query.filter(Flight.departure_time >= departure_time)
 
         # Execute the query
-        flights = query.all()
+        flights = query.order_by(Flight.departure_time, Flight.id).all()
 
         if not flights:
             raise NotFoundError("No flights found matching the criteria.")
@@ -237,9 +380,103 @@ def search_flights(departure_airport_id=None, arrival_airport_id=None, departure
         logger.debug(f"Found {len(flights)} flights.")
         return flights
 
+    except NotFoundError as e:
+        logger.info("No flights found: %s", e)
+        raise NotFoundError(str(e))
     except SQLAlchemyError as e:
         logger.exception("SQLAlchemyError during flight search: %s", e)
         raise RuntimeError("Database error occurred. Please try again later.")
     except Exception as e:
         logger.exception("Unexpected error during flight search: %s", e)
         raise RuntimeError("An unexpected error occurred. Please contact support.")
+
+
+def _day_expression(column):
+    """Calendar day of a DateTime column, per dialect (CAST AS DATE keeps the time on Oracle)."""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "sqlite":
+        return func.date(column)
+    if dialect == "oracle":
+        return func.trunc(column)
+    return cast(column, Date)
+
+
+def _load_fare_calendar(departure_airport_id, arrival_airport_id, year, month):
+    first_day = date(year, month, 1)
+    days_in_month = calendar.monthrange(year, month)[1]
+    month_start = datetime(year, month, 1)
+    month_end = month_start + timedelta(days=days_in_month)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    # Bookable: seats left in some class, or no inventory yet (backfilled on first booking)
+    has_seats = exists().where(SeatInventory.flight_id == Flight.id, SeatInventory.seats_remaining > 0)
+    has_inventory = exists().where(SeatInventory.flight_id == Flight.id)
+
+    day = _day_expression(Flight.departure_time).label("day")
+    rows = (
+        db.session.query(day, func.min(Flight.price).label("min_price"), func.count(Flight.id).label("flights"))
+        .filter(
+            Flight.departure_airport_id == departure_airport_id,
+            Flight.arrival_airport_id == arrival_airport_id,
+            Flight.departure_time >= max(month_start, now),
+            Flight.departure_time < month_end,
+            Flight.status == FlightStatus.ACTIVE.value,
+            or_(has_seats, ~has_inventory),
+        )
+        .group_by(day)
+        .all()
+    )
+    by_day = {str(row.day)[:10]: row for row in rows}
+
+    days = []
+    for offset in range(days_in_month):
+        key = (first_day + timedelta(days=offset)).isoformat()
+        row = by_day.get(key)
+        days.append({
+            "date": key,
+            "min_price": str(row.min_price) if row else None,
+            "flights": row.flights if row else 0,
+        })
+    return {
+        "departure_airport_id": departure_airport_id,
+        "arrival_airport_id": arrival_airport_id,
+        "month": f"{year:04d}-{month:02d}",
+        "days": days,
+    }
+
+
+@read_only
+def get_fare_calendar(departure_airport_id, arrival_airport_id, year, month):
+    """
+    Cheapest bookable base price per day of the month for a route, from one grouped
+    query. Cached per route and month; flight writes on the route, and a flight selling
+    out or getting seats back, invalidate it.
+    """
+    if not departure_airport_id or not arrival_airport_id:
+        raise BadRequestError("departure_airport_id and arrival_airport_id are required.")
+    if departure_airport_id == arrival_airport_id:
+        raise BadRequestError("Departure and arrival airports must differ.")
+    try:
+        return cached(
+            _calendar_namespace(departure_airport_id, arrival_airport_id),
+            f"{year:04d}-{month:02d}",
+            lambda: _load_fare_calendar(departure_airport_id, arrival_airport_id, year, month),
+            current_app.config.get("FARE_CALENDAR_CACHE_TIMEOUT"),
+        )
+    except SQLAlchemyError as e:
+        logger.exception("SQLAlchemyError while building fare calendar: %s", e)
+        raise RuntimeError("Database error occurred. Please try again later.")
+
+
+def get_search_index_stats():
+    return flight_search_index.stats()
+
+
+def configure_search_index(enabled=None, clear=False):
+    if enabled is not None:
+        flight_search_index.enabled = enabled
+        logger.info("Flight search index %s.", "enabled" if enabled else "disabled")
+    if clear:
+        flight_search_index.clear()
+        flight_search_index.reset_stats()
+    return flight_search_index.stats()
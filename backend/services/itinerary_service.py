@@ -0,0 +1,260 @@
+# backend/services/itinerary_service.py
+# Connecting-itinerary search over a time-expanded flight graph.
+# Airports are nodes and flights are edges; every airport keeps its outgoing
+# flights sorted by departure time so valid connections are found with bisect.
+
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+
+from models.flight import Flight
+from models.enums import FlightStatus
+from services.flight_search_index import FlightRecord, to_naive_datetime
+from exceptions.custom_exceptions import BadRequestError, NotFoundError
+from utils.db_routing import read_primary
+
+logger = logging.getLogger(__name__)
+
+SORT_KEYS = ("duration", "price")
+MAX_STOPS = 2
+_BOOKABLE_STATUSES = {FlightStatus.ACTIVE.value}
+
+
+class _Departures:
+    """Outgoing flights of one airport, sorted by departure time. Never mutated in place."""
+    __slots__ = ("times", "flights")
+
+    def __init__(self, flights):
+        self.flights = sorted(flights, key=lambda record: (record.departure_time, record.id))
+        self.times = [record.departure_time for record in self.flights]
+
+    def between(self, earliest, latest):
+        return self.flights[bisect_left(self.times, earliest):bisect_right(self.times, latest)]
+
+
+def _normalize(record):
+    return record._replace(
+        departure_time=to_naive_datetime(record.departure_time),
+        arrival_time=to_naive_datetime(record.arrival_time),
+        status=getattr(record.status, "value", record.status)
+    )
+
+
+class FlightGraph:
+    """
+    Precomputed flight graph shared by all requests of a worker.
+
+    The graph is built once from a column-only query and then kept current by
+    flight_service, which calls ``upsert_flight``/``remove_flight`` on every
+    write. Mutations copy the affected airport's departure list, so readers
+    never see a half-updated list. ``ttl`` forces a periodic rebuild to pick
+    up writes made by other worker processes.
+    """
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._by_origin = None
+        self._flight_origin = {}
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    def init_app(self, app):
+        self.ttl = app.config.get("ITINERARY_GRAPH_TTL", 300)
+
+    def _build(self):
+        started = time.perf_counter()
+        with read_primary():  # a shared graph must not be built from a lagging replica
+            rows = (
+                Flight.query
+                .with_entities(*(getattr(Flight, field) for field in FlightRecord._fields))
+                .filter(Flight.status.in_(_BOOKABLE_STATUSES))
+                .all()
+            )
+        grouped = {}
+        for row in rows:
+            record = _normalize(FlightRecord(*row))
+            grouped.setdefault(record.departure_airport_id, []).append(record)
+
+        by_origin = {airport_id: _Departures(flights) for airport_id, flights in grouped.items()}
+        flight_origin = {record.id: airport_id
+                         for airport_id, departures in by_origin.items()
+                         for record in departures.flights}
+        with self._lock:
+            self._by_origin = by_origin
+            self._flight_origin = flight_origin
+            self._built_at = time.monotonic()
+        logger.info("Built flight graph with %d flights across %d airports in %.1f ms.",
+                    len(flight_origin), len(by_origin), (time.perf_counter() - started) * 1000)
+
+    def _is_stale(self):
+        return self._by_origin is None or (self.ttl and time.monotonic() - self._built_at >= self.ttl)
+
+    def _graph(self):
+        if self._is_stale():
+            with self._build_lock:
+                # Another request may have rebuilt the graph while we waited
+                if self._is_stale():
+                    self._build()
+        return self._by_origin
+
+    def _remove_locked(self, flight_id):
+        origin = self._flight_origin.pop(flight_id, None)
+        if origin is None:
+            return
+        remaining = [record for record in self._by_origin[origin].flights if record.id != flight_id]
+        if remaining:
+            self._by_origin[origin] = _Departures(remaining)
+        else:
+            del self._by_origin[origin]
+
+    def upsert_flight(self, flight):
+        """Apply a created or updated flight to the graph, if it has been built."""
+        with self._lock:
+            if self._by_origin is None:
+                return
+            self._remove_locked(flight.id)
+            record = _normalize(FlightRecord(*(getattr(flight, field) for field in FlightRecord._fields)))
+            if record.status not in _BOOKABLE_STATUSES:
+                return
+            origin = record.departure_airport_id
+            existing = self._by_origin.get(origin)
+            self._by_origin[origin] = _Departures((existing.flights if existing else []) + [record])
+            self._flight_origin[record.id] = origin
+
+    def remove_flight(self, flight_id):
+        with self._lock:
+            if self._by_origin is not None:
+                self._remove_locked(flight_id)
+
+    def invalidate(self):
+        with self._lock:
+            self._by_origin = None
+            self._flight_origin = {}
+
+    def search(self, origin, destination, earliest, latest, max_stops, min_layover, max_layover,
+               sort_by, limit):
+        """
+        Best ``limit`` itineraries from ``origin`` to ``destination`` whose first
+        flight departs within [earliest, latest].
+
+        Depth-first over connections with branch-and-bound: once ``limit``
+        itineraries are known, any partial path already costlier than the worst
+        of them is dropped.
+        """
+        graph = self._graph()
+        best = []  # heap of (-cost, sequence, flights): best[0] is the worst kept itinerary
+        counter = 0
+
+        def cost_of(path):
+            if sort_by == "price":
+                return sum(record.price for record in path)
+            return (path[-1].arrival_time - path[0].departure_time).total_seconds()
+
+        def explore(path, visited):
+            nonlocal counter
+            current = path[-1]
+            cost = cost_of(path)
+            if len(best) >= limit and cost >= -best[0][0]:
+                return
+
+            if current.arrival_airport_id == destination:
+                counter += 1
+                heapq.heappush(best, (-cost, counter, list(path)))
+                if len(best) > limit:
+                    heapq.heappop(best)
+                return
+
+            if len(path) > max_stops:
+                return
+            departures = graph.get(current.arrival_airport_id)
+            if departures is None:
+                return
+
+            for record in departures.between(current.arrival_time + min_layover,
+                                             current.arrival_time + max_layover):
+                if record.arrival_airport_id in visited:
+                    continue
+                path.append(record)
+                visited.add(record.arrival_airport_id)
+                explore(path, visited)
+                visited.discard(record.arrival_airport_id)
+                path.pop()
+
+        first_legs = graph.get(origin)
+        if first_legs is not None:
+            for record in first_legs.between(earliest, latest):
+                if record.arrival_airport_id == origin:
+                    continue
+                explore([record], {origin, record.arrival_airport_id})
+
+        return [flights for _, _, flights in sorted(best, key=lambda item: (-item[0], item[1]))]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "built": self._by_origin is not None,
+                "airports": len(self._by_origin or {}),
+                "flights": len(self._flight_origin),
+            }
+
+
+flight_graph = FlightGraph()
+
+
+def _serialize_itinerary(flights):
+    departure = flights[0].departure_time
+    arrival = flights[-1].arrival_time
+    layovers = [
+        int((nxt.departure_time - prev.arrival_time).total_seconds() // 60)
+        for prev, nxt in zip(flights, flights[1:])
+    ]
+    return {
+        "stops": len(flights) - 1,
+        "departure_time": departure,
+        "arrival_time": arrival,
+        "total_duration_minutes": int((arrival - departure).total_seconds() // 60),
+        "layover_minutes": layovers,
+        "total_price": str(sum(record.price for record in flights)),
+        "flights": [record.serialize() for record in flights],
+    }
+
+
+def search_itineraries(departure_airport_id, arrival_airport_id, departure_date, max_stops=1,
+                       min_layover_minutes=45, max_layover_minutes=360, sort_by="duration", limit=10):
+    """Direct and connecting itineraries for one departure date, ranked by ``sort_by``."""
+    if not departure_airport_id or not arrival_airport_id:
+        raise BadRequestError("departure_airport_id and arrival_airport_id are required.")
+    if departure_airport_id == arrival_airport_id:
+        raise BadRequestError("Departure and arrival airports must differ.")
+    if sort_by not in SORT_KEYS:
+        raise BadRequestError(f"sort_by must be one of: {', '.join(SORT_KEYS)}.")
+    if not 0 <= max_stops <= MAX_STOPS:
+        raise BadRequestError(f"max_stops must be between 0 and {MAX_STOPS}.")
+    if min_layover_minutes < 0 or max_layover_minutes < min_layover_minutes:
+        raise BadRequestError("Layover window is invalid.")
+    if limit < 1:
+        raise BadRequestError("limit must be positive.")
+
+    logger.info("Searching itineraries %s -> %s on %s (max_stops=%s, sort_by=%s)",
+                departure_airport_id, arrival_airport_id, departure_date, max_stops, sort_by)
+
+    earliest = datetime(departure_date.year, departure_date.month, departure_date.day)
+    itineraries = flight_graph.search(
+        departure_airport_id,
+        arrival_airport_id,
+        earliest=earliest,
+        latest=earliest + timedelta(days=1) - timedelta(microseconds=1),
+        max_stops=max_stops,
+        min_layover=timedelta(minutes=min_layover_minutes),
+        max_layover=timedelta(minutes=max_layover_minutes),
+        sort_by=sort_by,
+        limit=limit
+    )
+    if not itineraries:
+        raise NotFoundError("No itineraries found matching the criteria.")
+
+    return [_serialize_itinerary(flights) for flights in itineraries]
@@ -0,0 +1,256 @@
+# backend/services/review_service.py
+# Flight reviews with incrementally maintained rating aggregates.
+#
+# Every review insert, rating change and delete adjusts two RatingTotals rows in the same
+# transaction: the flight's (flight_ratings) and its route's (route_ratings). Each
+# adjustment is one relative UPDATE (count + 1, sum + rating, rating_N + 1, ...), so
+# concurrent reviews never lose each other's increments, and a rating read is a single
+# primary-key lookup no matter how many reviews a flight has.
+#
+# Rating changes and deletes are compare-and-swap on the review's current rating, so two
+# concurrent edits of one review cannot both subtract the same old rating.
+#
+# Route totals follow a flight's current airports: update_flight moves the flight's totals
+# to the new route row (move_route_ratings) and delete_flight subtracts them and removes
+# the flight's reviews (delete_flight_reviews), both in the flight's transaction. Review
+# writes lock the flight row before reading its route, so they serialize with those.
+
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+
+from sqlalchemy import update, delete
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from werkzeug.exceptions import Forbidden, Conflict
+
+from extensions import db
+from models.review import Review, FlightRating, RouteRating, RATINGS
+from models.flight import Flight
+from models.booking import Booking
+from models.enums import BookingStatusEnum
+from exceptions.custom_exceptions import BadRequestError, NotFoundError, ReviewAlreadyExistsError
+from utils.pagination import paginate
+from utils.db_routing import read_only
+
+logger = logging.getLogger(__name__)
+
+# Retries of a rating change or delete that lost a race with another edit of the same review
+_CAS_ATTEMPTS = 5
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _deltas(added=None, removed=None):
+    """RatingTotals column -> change for adding and/or removing one rating."""
+    deltas = Counter()
+    if added is not None:
+        deltas.update({"review_count": 1, "rating_sum": added, f"rating_{added}": 1})
+    if removed is not None:
+        deltas.subtract({"review_count": 1, "rating_sum": removed, f"rating_{removed}": 1})
+    return {column: delta for column, delta in deltas.items() if delta}
+
+
+def _adjust(model, key, deltas):
+    """Apply ``deltas`` to the aggregate row of ``model`` identified by ``key``, creating it at zero first."""
+    table = model.__table__
+    statement = (
+        table.update()
+        .where(*(table.c[column] == value for column, value in key.items()))
+        .values({column: table.c[column] + delta for column, delta in deltas.items()})
+    )
+    if db.session.execute(statement).rowcount:
+        return
+    try:
+        # First review in this scope; a concurrent first review may insert the row too
+        with db.session.begin_nested():
+            db.session.execute(table.insert().values(**key))
+    except IntegrityError:
+        logger.debug("Rating row %s %s was created concurrently.", table.name, key)
+    db.session.execute(statement)
+
+
+def _update_aggregates(flight_id, added=None, removed=None):
+    deltas = _deltas(added, removed)
+    if not deltas:
+        return
+    # Locking the flight keeps its route (and so the route row to adjust) fixed until commit
+    route = db.session.query(Flight.departure_airport_id, Flight.arrival_airport_id).filter(
+        Flight.id == flight_id).with_for_update().one()
+    # Always flight row first, then route row, so concurrent reviews lock in the same order
+    _adjust(FlightRating, {"flight_id": flight_id}, deltas)
+    _adjust(RouteRating, {"departure_airport_id": route.departure_airport_id,
+                          "arrival_airport_id": route.arrival_airport_id}, deltas)
+
+
+def _totals_deltas(totals, sign=1):
+    """RatingTotals column -> ``sign`` times the value in ``totals`` (a FlightRating row)."""
+    columns = ["review_count", "rating_sum", *(f"rating_{rating}" for rating in RATINGS)]
+    return {column: sign * getattr(totals, column) for column in columns if getattr(totals, column)}
+
+
+def move_route_ratings(flight_id, old_route, new_route):
+    """
+    Move flight_id's totals from the ``old_route`` to the ``new_route`` route row, in the
+    caller's transaction. The caller must already have written (and so locked) the flight
+    row with its new airports.
+    """
+    if old_route == new_route:
+        return
+    totals = db.session.get(FlightRating, flight_id, populate_existing=True)
+    if not totals or not totals.review_count:
+        return
+    for route, sign in ((old_route, -1), (new_route, 1)):
+        _adjust(RouteRating, {"departure_airport_id": route[0], "arrival_airport_id": route[1]},
+                _totals_deltas(totals, sign))
+
+
+def delete_flight_reviews(flight_id, route):
+    """
+    Remove flight_id's reviews and rating row and subtract its totals from its ``route``
+    row, in the caller's transaction (before the flight itself is deleted).
+    """
+    # Wait out review writes in flight, and keep new ones out until the flight is gone
+    db.session.query(Flight.id).filter(Flight.id == flight_id).with_for_update().one()
+    totals = db.session.get(FlightRating, flight_id, populate_existing=True)
+    if totals and totals.review_count:
+        _adjust(RouteRating, {"departure_airport_id": route[0], "arrival_airport_id": route[1]},
+                _totals_deltas(totals, -1))
+    db.session.execute(delete(Review).where(Review.flight_id == flight_id)
+                       .execution_options(synchronize_session=False))
+    db.session.execute(delete(FlightRating).where(FlightRating.flight_id == flight_id)
+                       .execution_options(synchronize_session=False))
+
+
+def _summary(totals):
+    """Rating summary of a RatingTotals row (or None: no reviews yet)."""
+    count = totals.review_count if totals else 0
+    return {
+        "review_count": count,
+        "average_rating": round(totals.rating_sum / count, 2) if count else None,
+        "histogram": {str(rating): getattr(totals, f"rating_{rating}") if totals else 0 for rating in RATINGS},
+    }
+
+
+def _get_for_change(review_id, user_id, is_admin=False):
+    review = db.session.get(Review, review_id, populate_existing=True)
+    if not review:
+        raise NotFoundError("Review not found.")
+    if review.user_id != user_id and not is_admin:
+        raise Forbidden("You are not allowed to change this review.")
+    return review
+
+
+def create_review(user_id, data):
+    flight_id = data["flight_id"]
+    try:
+        if not db.session.query(Flight.id).filter(Flight.id == flight_id).first():
+            raise NotFoundError(f"Flight with ID {flight_id} not found.")
+        has_booking = db.session.query(Booking.id).filter(
+            Booking.user_id == user_id,
+            Booking.flight_id == flight_id,
+            Booking.status == BookingStatusEnum.CONFIRMED,
+        ).first()
+        if not has_booking:
+            raise BadRequestError("Only passengers with a confirmed booking on this flight can review it.")
+
+        review = Review(user_id=user_id, flight_id=flight_id, rating=data["rating"], comment=data.get("comment"))
+        db.session.add(review)
+        db.session.flush()
+        _update_aggregates(flight_id, added=review.rating)
+        db.session.commit()
+        return review
+    except IntegrityError:
+        db.session.rollback()
+        raise ReviewAlreadyExistsError("You have already reviewed this flight.")
+    except SQLAlchemyError:
+        db.session.rollback()
+        logger.exception("Database error while creating review.")
+        raise BadRequestError("Failed to create review.")
+
+
+def update_review(review_id, user_id, data):
+    try:
+        for _ in range(_CAS_ATTEMPTS):
+            review = _get_for_change(review_id, user_id)
+            old_rating = review.rating
+            new_rating = data.get("rating", old_rating)
+            values = {"rating": new_rating, "updated_at": _utcnow()}
+            if "comment" in data:
+                values["comment"] = data["comment"]
+
+            changed = db.session.execute(
+                update(Review)
+                .where(Review.id == review_id, Review.rating == old_rating)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if changed:
+                if new_rating != old_rating:
+                    _update_aggregates(review.flight_id, added=new_rating, removed=old_rating)
+                db.session.commit()
+                return db.session.get(Review, review_id, populate_existing=True)
+            db.session.rollback()  # rating changed under us: re-read and retry
+        raise Conflict("The review was changed concurrently, please retry.")
+    except SQLAlchemyError:
+        db.session.rollback()
+        logger.exception("Database error while updating review %s.", review_id)
+        raise BadRequestError("Failed to update review.")
+
+
+def delete_review(review_id, user_id, is_admin=False):
+    try:
+        for _ in range(_CAS_ATTEMPTS):
+            review = _get_for_change(review_id, user_id, is_admin)
+            deleted = db.session.execute(
+                delete(Review)
+                .where(Review.id == review_id, Review.rating == review.rating)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if deleted:
+                _update_aggregates(review.flight_id, removed=review.rating)
+                db.session.commit()
+                return
+            db.session.rollback()
+        raise Conflict("The review was changed concurrently, please retry.")
+    except SQLAlchemyError:
+        db.session.rollback()
+        logger.exception("Database error while deleting review %s.", review_id)
+        raise BadRequestError("Failed to delete review.")
+
+
+def get_review(review_id):
+    review = db.session.get(Review, review_id)
+    if not review:
+        raise NotFoundError("Review not found.")
+    return review
+
+
+@read_only
+def get_reviews(limit, cursor=None, user_id=None):
+    """One page of reviews, newest first; only user_id's when given."""
+    query = Review.query
+    if user_id is not None:
+        query = query.filter(Review.user_id == user_id)
+    return paginate(query, Review.created_at, Review.id, limit, cursor, descending=True)
+
+
+@read_only
+def get_flight_reviews(flight_id, limit, cursor=None):
+    query = Review.query.filter(Review.flight_id == flight_id)
+    return paginate(query, Review.created_at, Review.id, limit, cursor, descending=True)
+
+
+@read_only
+def get_flight_rating(flight_id):
+    """Rating summary of one flight: a primary-key lookup of its aggregate row."""
+    return {"flight_id": flight_id, **_summary(db.session.get(FlightRating, flight_id))}
+
+
+@read_only
+def get_route_rating(departure_airport_id, arrival_airport_id):
+    """Rating summary of every flight on a route: a primary-key lookup of its aggregate row."""
+    totals = db.session.get(RouteRating, (departure_airport_id, arrival_airport_id))
+    return {"departure_airport_id": departure_airport_id, "arrival_airport_id": arrival_airport_id,
+            **_summary(totals)}
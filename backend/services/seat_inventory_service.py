@@ -0,0 +1,194 @@
+# backend/services/seat_inventory_service.py
+
+import logging
+from sqlalchemy import update, case, func
+from sqlalchemy.exc import IntegrityError
+from extensions import db
+from models.flight import Flight
+from models.airplane import Airplane
+from models.booking import Booking
+from models.passenger_model import Passenger
+from models.seat_inventory import SeatInventory
+from models.enums import FlightClass, PassengerStatusEnum
+from exceptions.custom_exceptions import NotFoundError, SeatsUnavailableError
+
+logger = logging.getLogger(__name__)
+
+
+def _airplane_capacity(airplane):
+    """Seats per class from a serialized airplane (see Airplane.serialize)."""
+    return {
+        FlightClass.ECONOMY: airplane["economy_seats"],
+        FlightClass.BUSINESS: airplane["business_seats"],
+        FlightClass.FIRST_CLASS: airplane["first_class_seats"],
+    }
+
+
+def add_inventory_for_flight(flight, airplane):
+    """
+    Add one inventory row per class for a newly created flight.
+    ``airplane`` is a serialized airplane; the caller owns the transaction and
+    commits it together with the flight.
+    """
+    for flight_class, seats in _airplane_capacity(airplane).items():
+        db.session.add(SeatInventory(
+            flight=flight,
+            flight_class=flight_class,
+            total_seats=seats,
+            seats_remaining=seats
+        ))
+
+
+def _derived_inventory(flight_id):
+    """
+    Unsaved inventory rows for a flight created before seat inventory existed:
+    airplane capacity less the passengers already booked on the flight.
+    """
+    flight = db.session.get(Flight, flight_id)
+    if not flight:
+        raise NotFoundError(f"Flight with ID {flight_id} not found.")
+    airplane = db.session.get(Airplane, flight.airplane_id).serialize()
+
+    booked = dict(
+        db.session.query(Passenger.flight_class, func.count(Passenger.id))
+        .join(Booking, Passenger.booking_id == Booking.id)
+        .filter(Booking.flight_id == flight_id, Passenger.status == PassengerStatusEnum.BOOKED)
+        .group_by(Passenger.flight_class)
+        .all()
+    )
+    return [
+        SeatInventory(
+            flight_id=flight_id,
+            flight_class=flight_class,
+            total_seats=seats,
+            seats_remaining=max(seats - booked.get(flight_class, 0), 0)
+        )
+        for flight_class, seats in _airplane_capacity(airplane).items()
+    ]
+
+
+def ensure_inventory(flight_id):
+    """
+    Backfill inventory rows for a flight created before seat inventory existed.
+    Passengers already booked on the flight are counted once here, so later
+    bookings never need to scan the passengers table. Only the booking path
+    calls this; it runs inside the caller's write transaction.
+    Returns True if rows were added.
+    """
+    if db.session.query(SeatInventory.id).filter_by(flight_id=flight_id).first():
+        return False
+
+    rows = _derived_inventory(flight_id)
+    try:
+        # A concurrent booking may backfill the same flight; the unique
+        # constraint makes the loser roll back to this savepoint only.
+        with db.session.begin_nested():
+            db.session.add_all(rows)
+        logger.info("Backfilled seat inventory for flight %s", flight_id)
+    except IntegrityError:
+        logger.debug("Seat inventory for flight %s was backfilled concurrently.", flight_id)
+    return True
+
+
+def sold_out_routes(flight_ids):
+    """
+    (departure_airport_id, arrival_airport_id) of the given flights that have inventory
+    and no seat left in any class. Fare calendars only list bookable flights, so a
+    flight entering or leaving this state must invalidate its route's calendar.
+    """
+    if not flight_ids:
+        return set()
+    rows = (
+        db.session.query(Flight.departure_airport_id, Flight.arrival_airport_id)
+        .join(SeatInventory, SeatInventory.flight_id == Flight.id)
+        .filter(Flight.id.in_(list(flight_ids)))
+        .group_by(Flight.id, Flight.departure_airport_id, Flight.arrival_airport_id)
+        .having(func.sum(SeatInventory.seats_remaining) == 0)
+        .all()
+    )
+    return {tuple(row) for row in rows}
+
+
+def _reserve_statement(flight_id, seat_counts):
+    seats_requested = case(
+        {flight_class: count for flight_class, count in seat_counts.items()},
+        value=SeatInventory.flight_class
+    )
+    return (
+        update(SeatInventory)
+        .where(
+            SeatInventory.flight_id == flight_id,
+            SeatInventory.flight_class.in_(list(seat_counts)),
+            SeatInventory.seats_remaining >= seats_requested
+        )
+        .values(seats_remaining=SeatInventory.seats_remaining - seats_requested)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def reserve_seats(flight_id, seat_counts):
+    """
+    Reserve seats for every class in ``seat_counts`` ({FlightClass: count})
+    with a single conditional UPDATE.
+
+    Each class row is only decremented if it still has enough seats, so the
+    statement touches exactly one row per requested class on success. Anything
+    less means at least one class is sold out: SeatsUnavailableError is raised
+    and the caller must roll back its transaction to undo the partial update.
+
+    Returns the flight's route if this took its last seat (see sold_out_routes), as a
+    set the caller passes to invalidate_fare_calendars once it has committed.
+    """
+    seat_counts = {flight_class: count for flight_class, count in seat_counts.items() if count > 0}
+    if not seat_counts:
+        return set()
+
+    result = db.session.execute(_reserve_statement(flight_id, seat_counts))
+    if result.rowcount == 0 and ensure_inventory(flight_id):
+        # The flight predates seat inventory; retry against the backfilled rows.
+        result = db.session.execute(_reserve_statement(flight_id, seat_counts))
+
+    if result.rowcount != len(seat_counts):
+        logger.info("Seat reservation failed for flight %s: %s", flight_id,
+                    {flight_class.value: count for flight_class, count in seat_counts.items()})
+        raise SeatsUnavailableError("Not enough seats available on this flight.")
+    return sold_out_routes([flight_id])
+
+
+def release_seats(flight_id, seat_counts):
+    """
+    Return seats to the inventory, e.g. when passengers are cancelled.
+    Returns the flight's route if it was sold out, for invalidate_fare_calendars after commit.
+    """
+    seat_counts = {flight_class: count for flight_class, count in seat_counts.items() if count > 0}
+    if not seat_counts:
+        return set()
+
+    reopened = sold_out_routes([flight_id])
+
+    seats_released = case(
+        {flight_class: count for flight_class, count in seat_counts.items()},
+        value=SeatInventory.flight_class
+    )
+    db.session.execute(
+        update(SeatInventory)
+        .where(
+            SeatInventory.flight_id == flight_id,
+            SeatInventory.flight_class.in_(list(seat_counts))
+        )
+        .values(seats_remaining=SeatInventory.seats_remaining + seats_released)
+        .execution_options(synchronize_session=False)
+    )
+    return reopened
+
+
+def get_inventory(flight_id):
+    """
+    Inventory rows for a flight, ordered by class. Flights that have not been
+    backfilled yet get the same figures computed on the fly, without writing;
+    their rows are stored by the first booking (see ensure_inventory).
+    """
+    rows = SeatInventory.query.filter_by(flight_id=flight_id).order_by(SeatInventory.flight_class).all()
+    if rows:
+        return rows
+    return sorted(_derived_inventory(flight_id), key=lambda row: row.flight_class.name)
@@ -0,0 +1,199 @@
+# backend/services/wallet_service.py
+# Wallets: an append-only ledger (WalletTransaction) plus a balance snapshot (Wallet.balance).
+#
+# Every balance change is one conditional UPDATE of the wallet row and one ledger INSERT,
+# in the caller's transaction. A payment only matches while balance >= amount, so
+# concurrent bookings can never overdraw a wallet, and the row lock taken by the UPDATE
+# serializes changes to one wallet, so the balance_after values form a consistent chain.
+# Reading a balance is a single-row lookup; the history is only read for statements.
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from flask import current_app
+from sqlalchemy import select, update, insert, bindparam
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from extensions import db
+from models.wallet import Wallet
+from models.transactions import WalletTransaction
+from models.enums import TransactionType
+from exceptions.custom_exceptions import BadRequestError, InsufficientFundsError, WalletNotFoundError
+from utils.pagination import paginate, Page
+from utils.db_routing import read_only
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _ensure_wallet(user_id):
+    """Id of user_id's wallet, creating an empty one on first use."""
+    wallet_id = db.session.scalar(select(Wallet.id).where(Wallet.user_id == user_id))
+    if wallet_id is not None:
+        return wallet_id
+    try:
+        # Two first requests may race; the unique user_id makes the loser roll back to here
+        with db.session.begin_nested():
+            wallet = Wallet(user_id=user_id, balance=Decimal("0.00"))
+            db.session.add(wallet)
+        return wallet.id
+    except IntegrityError:
+        return db.session.scalar(select(Wallet.id).where(Wallet.user_id == user_id))
+
+
+def _apply(user_id, transaction_type, amount, booking_id=None, description=None):
+    """
+    Move ``amount`` into (DEPOSIT, REFUND) or out of (PAYMENT) user_id's wallet and append
+    the ledger entry. The caller owns the transaction. Returns the WalletTransaction, or
+    None if the wallet does not exist or a payment is not covered by the balance.
+    """
+    now = _utcnow()
+    delta = -amount if transaction_type == TransactionType.PAYMENT else amount
+    statement = (
+        update(Wallet)
+        .where(Wallet.user_id == user_id)
+        .values(balance=Wallet.balance + delta, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    if transaction_type == TransactionType.PAYMENT:
+        statement = statement.where(Wallet.balance >= amount)
+
+    if db.session.get_bind().dialect.update_returning:
+        row = db.session.execute(statement.returning(Wallet.id, Wallet.balance)).first()
+    else:
+        row = None
+        if db.session.execute(statement).rowcount:
+            # Our UPDATE holds the row lock, so this reads our own balance
+            row = db.session.execute(select(Wallet.id, Wallet.balance).where(Wallet.user_id == user_id)).first()
+    if row is None:
+        return None
+
+    entry = WalletTransaction(
+        wallet_id=row.id,
+        type=transaction_type,
+        amount=amount,
+        balance_after=row.balance,
+        booking_id=booking_id,
+        description=description,
+        created_at=now,
+    )
+    db.session.add(entry)
+    return entry
+
+
+def get_wallet(user_id):
+    """
+    user_id's wallet. A user without one gets an unsaved empty wallet: reading never
+    writes, the row is created by the first deposit.
+    """
+    wallet = Wallet.query.filter_by(user_id=user_id).first()
+    if wallet is None:
+        wallet = Wallet(user_id=user_id, balance=Decimal("0.00"))
+    return wallet
+
+
+def deposit(user_id, amount, description=None):
+    """Add ``amount`` (Decimal) to user_id's wallet. Returns the updated wallet."""
+    max_deposit = current_app.config.get("WALLET_MAX_DEPOSIT", 100000)
+    if amount <= 0:
+        raise BadRequestError("Amount must be positive.")
+    if amount > max_deposit:
+        raise BadRequestError(f"A single deposit cannot exceed {max_deposit}.")
+    try:
+        wallet_id = _ensure_wallet(user_id)
+        _apply(user_id, TransactionType.DEPOSIT, amount, description=description or "Wallet top-up")
+        db.session.commit()
+    except SQLAlchemyError:
+        db.session.rollback()
+        logger.exception("Database error while adding money to wallet of user %s.", user_id)
+        raise BadRequestError("Failed to add money to wallet.")
+    return db.session.get(Wallet, wallet_id, populate_existing=True)
+
+
+def pay_for_booking(user_id, booking_id, amount):
+    """
+    Debit a booking's total from user_id's wallet inside the booking's transaction.
+    Raises InsufficientFundsError, or WalletNotFoundError if the user has no wallet yet
+    (the caller rolls back, releasing the seats too).
+    """
+    if amount <= 0:
+        return None
+    entry = _apply(user_id, TransactionType.PAYMENT, amount, booking_id=booking_id,
+                   description=f"Payment for booking {booking_id}")
+    if entry is None:
+        if db.session.scalar(select(Wallet.id).where(Wallet.user_id == user_id)) is None:
+            raise WalletNotFoundError(f"No wallet found; add money to your wallet to pay the booking total of {amount}.")
+        raise InsufficientFundsError(f"Wallet balance does not cover the booking total of {amount}.")
+    return entry
+
+
+def refund_bookings(booking_ids):
+    """
+    Refund the wallet payments of cancelled or expired bookings, in the caller's transaction:
+    one query for the payments, one executemany UPDATE of the wallets and one bulk ledger
+    INSERT. Callers must have claimed the cancellation (status UPDATE), so each booking is
+    refunded once. Returns the total refunded.
+    """
+    if not booking_ids:
+        return Decimal("0.00")
+    payments = db.session.execute(
+        select(WalletTransaction.wallet_id, WalletTransaction.booking_id, WalletTransaction.amount)
+        .where(WalletTransaction.booking_id.in_(booking_ids),
+               WalletTransaction.type == TransactionType.PAYMENT)
+        .order_by(WalletTransaction.wallet_id, WalletTransaction.booking_id)
+    ).all()
+    if not payments:
+        return Decimal("0.00")
+
+    now = _utcnow()
+    totals = defaultdict(Decimal)
+    for wallet_id, _, amount in payments:
+        totals[wallet_id] += amount
+
+    wallets = Wallet.__table__
+    db.session.execute(
+        wallets.update()
+        .where(wallets.c.id == bindparam("b_wallet_id"))
+        .values(balance=wallets.c.balance + bindparam("b_amount"), updated_at=now),
+        [{"b_wallet_id": wallet_id, "b_amount": total} for wallet_id, total in totals.items()]
+    )
+    balances = dict(db.session.execute(
+        select(Wallet.id, Wallet.balance).where(Wallet.id.in_(list(totals)))
+    ).all())
+
+    # Chain balance_after through each wallet's refunds, ending at its new balance
+    running = {wallet_id: balances[wallet_id] - total for wallet_id, total in totals.items()}
+    entries = []
+    for wallet_id, booking_id, amount in payments:
+        running[wallet_id] += amount
+        entries.append({
+            "wallet_id": wallet_id,
+            "type": TransactionType.REFUND,
+            "amount": amount,
+            "balance_after": running[wallet_id],
+            "booking_id": booking_id,
+            "description": f"Refund for booking {booking_id}",
+            "created_at": now,
+        })
+    db.session.execute(insert(WalletTransaction), entries)
+    return sum(totals.values(), Decimal("0.00"))
+
+
+@read_only
+def get_transactions(user_id, limit, cursor=None):
+    """One page of user_id's ledger, newest first."""
+    wallet_id = db.session.scalar(select(Wallet.id).where(Wallet.user_id == user_id))
+    if wallet_id is None:
+        return Page([], None)
+    query = WalletTransaction.query.filter_by(wallet_id=wallet_id)
+    return paginate(query, WalletTransaction.created_at, WalletTransaction.id, limit, cursor, descending=True)
+
+
+@read_only
+def get_all_wallets(limit, cursor=None):
+    return paginate(Wallet.query, Wallet.id, Wallet.id, limit, cursor)
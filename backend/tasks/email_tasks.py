@@ -0,0 +1,65 @@
+# backend/tasks/email_tasks.py
+# Booking emails, sent from Celery so SMTP latency stays out of the request.
+# SMTP and connection errors are retried with exponential backoff and jitter; the retry
+# settings come from the Flask app config, applied by init_celery() through configure().
+
+import logging
+from smtplib import SMTPException
+
+from celery.utils.time import get_exponential_backoff_interval
+from sqlalchemy.orm import joinedload, selectinload
+
+from celery_app import celery
+from extensions import db
+from models.booking import Booking
+from models.flight import Flight
+from utils.email_utils import send_email
+
+logger = logging.getLogger(__name__)
+
+_RETRYABLE = (SMTPException, OSError)
+
+
+def _load_booking(booking_id):
+    return db.session.get(Booking, booking_id, options=[
+        joinedload(Booking.user),
+        joinedload(Booking.flight).joinedload(Flight.departure_airport),
+        joinedload(Booking.flight).joinedload(Flight.arrival_airport),
+        selectinload(Booking.passengers),
+    ])
+
+
+def _send_booking_email(task, booking_id, subject, template):
+    booking = _load_booking(booking_id)
+    if booking is None:
+        logger.warning("Booking %s no longer exists; %s email not sent.", booking_id, template)
+        return
+    try:
+        send_email(subject.format(booking=booking), [booking.user.email], template, booking=booking)
+    except _RETRYABLE as exc:
+        countdown = get_exponential_backoff_interval(
+            factor=task.retry_backoff,  # seconds, doubled on every attempt
+            retries=task.request.retries,
+            maximum=task.retry_backoff_max,
+            full_jitter=True,
+        )
+        raise task.retry(exc=exc, countdown=countdown)
+    logger.info("Sent %s email for booking %s.", template, booking_id)
+
+
+@celery.task(name="email.booking_confirmation", bind=True)
+def send_booking_confirmation(self, booking_id):
+    _send_booking_email(self, booking_id, "Booking #{booking.id} confirmed", "booking_confirmation")
+
+
+@celery.task(name="email.booking_cancellation", bind=True)
+def send_booking_cancellation(self, booking_id):
+    _send_booking_email(self, booking_id, "Booking #{booking.id} cancelled", "booking_cancellation")
+
+
+def configure(app):
+    """Apply the app's EMAIL_TASK_* retry settings to the email tasks."""
+    for task in (send_booking_confirmation, send_booking_cancellation):
+        task.max_retries = app.config.get("EMAIL_TASK_MAX_RETRIES", 5)
+        task.retry_backoff = app.config.get("EMAIL_TASK_RETRY_BACKOFF", 10)
+        task.retry_backoff_max = app.config.get("EMAIL_TASK_RETRY_BACKOFF_MAX", 600)
@@ -0,0 +1,122 @@
+# backend/tests/conftest.py
+# App, database and data fixtures. Tests run create_app("testing") against a throwaway
+# SQLite file (a file, not :memory:, so concurrent requests on several threads share it).
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    from app import create_app
+    from config.config import engine_options
+
+    url = f"sqlite:///{tmp_path_factory.mktemp('db') / 'test.db'}?timeout=30"
+    return create_app("testing", {
+        "SQLALCHEMY_DATABASE_URI": url,
+        "SQLALCHEMY_ENGINE_OPTIONS": engine_options(url),
+        "SQLALCHEMY_BINDS": {},
+        "LOG_TO_FILE": False,
+    })
+
+
+@pytest.fixture(autouse=True)
+def database(app):
+    from extensions import db, cache
+    from services.flight_search_index import flight_search_index
+    from services.itinerary_service import flight_graph
+    with app.app_context():
+        db.create_all()
+    yield db
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+        cache.clear()
+    # Ids restart with the next test's tables, so per-process indexes must not outlive them
+    flight_search_index.clear()
+    flight_graph.invalidate()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_user(app):
+    """make_user(role="USER", balance=None) -> (user_id, auth headers); a balance also creates a wallet."""
+    from flask_jwt_extended import create_access_token
+    from extensions import db
+    from models import User, Wallet
+    from models.enums import UserRole, Gender
+
+    created = []
+
+    def make(role="USER", balance=None):
+        n = len(created)
+        with app.app_context():
+            user = User(name=f"User {n}", email=f"user{n}@test.example", password="x",
+                        role=UserRole(role), gender=Gender.O, mobile_number=f"9{n:09d}")
+            db.session.add(user)
+            db.session.flush()
+            if balance is not None:
+                db.session.add(Wallet(user_id=user.id, balance=Decimal(balance)))
+            db.session.commit()
+            created.append(user.id)
+            return user.id, {"Authorization": f"Bearer {create_access_token(identity=user.id)}"}
+
+    return make
+
+
+@pytest.fixture
+def make_flight(app):
+    """make_flight(economy=100, business=0, first_class=0) -> flight id, with seat inventory."""
+    from extensions import db
+    from models import Airport, Airplane
+    from services.flight_service import create_flight
+
+    def make(economy=100, business=0, first_class=0, departure_airport_id=None, arrival_airport_id=None):
+        with app.app_context():
+            if departure_airport_id is None:
+                airports = [Airport(name=f"Airport {code}", city=code, country="Testland", airport_code=code)
+                            for code in ("TSA", "TSB")]
+                db.session.add_all(airports)
+                db.session.flush()
+                departure_airport_id, arrival_airport_id = (airport.id for airport in airports)
+            count = Airplane.query.count()
+            airplane = Airplane(airplane_number=f"TS{count:04d}", model="A320",
+                                total_seats=economy + business + first_class, economy_seats=economy,
+                                business_seats=business, first_class_seats=first_class)
+            db.session.add(airplane)
+            db.session.commit()
+
+            departure = datetime.utcnow() + timedelta(days=30)
+            flight = create_flight({
+                "flight_number": f"TS{count:04d}",
+                "airplane_id": airplane.id,
+                "departure_airport_id": departure_airport_id,
+                "arrival_airport_id": arrival_airport_id,
+                "departure_time": departure,
+                "arrival_time": departure + timedelta(hours=2),
+                "status": "ACTIVE",
+                "price": 100.0,
+            })
+            return flight.id
+
+    return make
+
+
+@pytest.fixture
+def book(app):
+    """book(headers, flight_id, passengers=1, **extra) -> response of POST /api/bookings/ (own client, thread-safe)."""
+    def make(headers, flight_id, passengers=1, **extra):
+        return app.test_client().post("/api/bookings/", headers=headers, json={
+            "flight_id": flight_id,
+            "passengers": [{"first_name": "Test", "last_name": f"Passenger{index}", "gender": "O", "age": 30}
+                           for index in range(passengers)],
+            **extra,
+        })
+
+    return make
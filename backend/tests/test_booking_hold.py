@@ -0,0 +1,143 @@
+# backend/tests/test_booking_hold.py
+# Expiry of pending-booking holds by the sweeper (TestingConfig keeps the sweeper thread
+# off, so these call hold_sweeper.sweep() directly).
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import update
+
+from extensions import db
+from models import Booking, Passenger, SeatInventory, Wallet
+from models.enums import FlightClass
+from models.transactions import WalletTransaction
+from services.booking_hold_service import hold_sweeper
+
+CAPACITY = 20
+
+
+def seats_remaining(app, flight_id):
+    with app.app_context():
+        return db.session.query(SeatInventory.seats_remaining).filter_by(
+            flight_id=flight_id, flight_class=FlightClass.ECONOMY).scalar()
+
+
+def set_hold_expiry(app, booking_ids, expires_at):
+    with app.app_context():
+        db.session.execute(update(Booking).where(Booking.id.in_(booking_ids)).values(hold_expires_at=expires_at))
+        db.session.commit()
+
+
+def wallet_state(app, user_id):
+    """(balance, number of REFUND entries) of user_id's wallet."""
+    with app.app_context():
+        wallet = Wallet.query.filter_by(user_id=user_id).one()
+        refunds = WalletTransaction.query.filter_by(wallet_id=wallet.id, type="REFUND").count()
+        return wallet.balance, refunds
+
+
+def test_sweep_releases_seats_cancels_passengers_and_refunds(app, make_user, make_flight, book):
+    flight_id = make_flight(economy=CAPACITY)
+    user_id, headers = make_user(balance="5000.00")
+    bookings = [book(headers, flight_id, passengers=2).get_json() for _ in range(3)]
+    assert {booking["status"] for booking in bookings} == {"PENDING"}
+    assert seats_remaining(app, flight_id) == CAPACITY - 6
+
+    before = hold_sweeper.stats()
+    with app.app_context():
+        expires_at = max(db.session.get(Booking, booking["id"]).hold_expires_at for booking in bookings)
+        summary = hold_sweeper.sweep(now=expires_at + timedelta(seconds=1), batch_size=2)
+    assert (summary["expired"], summary["seats_released"], summary["batches"]) == (3, 6, 2)
+    assert seats_remaining(app, flight_id) == CAPACITY
+
+    ids = [booking["id"] for booking in bookings]
+    with app.app_context():
+        assert {status.value for (status,) in db.session.query(Booking.status).filter(Booking.id.in_(ids))} == {"CANCELLED"}
+        assert {status.value for (status,) in db.session.query(Passenger.status).filter(Passenger.booking_id.in_(ids))} \
+            == {"CANCELLED"}
+    assert wallet_state(app, user_id) == (Decimal("5000.00"), 3)
+
+    after = hold_sweeper.stats()
+    assert after["sweeps"] == before["sweeps"] + 1
+    assert after["expired"] == before["expired"] + 3
+    assert after["seats_released"] == before["seats_released"] + 6
+    assert after["lag_seconds"] > 0
+
+    # Nothing left to expire: a second sweep is a no-op
+    with app.app_context():
+        assert hold_sweeper.sweep(now=expires_at + timedelta(seconds=2))["expired"] == 0
+
+
+def test_sweep_keeps_holds_that_have_not_expired(app, make_user, make_flight, book):
+    flight_id = make_flight(economy=CAPACITY)
+    _, headers = make_user(balance="5000.00")
+    book(headers, flight_id)
+    with app.app_context():
+        assert hold_sweeper.sweep()["expired"] == 0
+    assert seats_remaining(app, flight_id) == CAPACITY - 1
+
+
+def test_confirm_and_sweep_race_has_one_winner(app, make_user, make_flight, book):
+    flight_id = make_flight(economy=CAPACITY)
+    user_id, headers = make_user(balance="50000.00")
+    ids = [book(headers, flight_id).get_json()["id"] for _ in range(CAPACITY)]
+    set_hold_expiry(app, ids, datetime.utcnow() + timedelta(seconds=0.3))
+
+    done = threading.Event()
+
+    def confirm(booking_id):
+        time.sleep(random.uniform(0, 0.6))
+        return app.test_client().post(f"/api/bookings/{booking_id}/confirm", headers=headers).status_code
+
+    def sweep_until_done():
+        while not done.is_set():
+            with app.app_context():
+                hold_sweeper.sweep()
+            time.sleep(0.02)
+
+    sweeper = threading.Thread(target=sweep_until_done)
+    sweeper.start()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = dict(zip(ids, executor.map(confirm, ids)))
+    with app.app_context():
+        hold_sweeper.sweep(now=datetime.utcnow() + timedelta(seconds=1))
+    done.set()
+    sweeper.join()
+
+    with app.app_context():
+        final = {booking_id: status.value for booking_id, status in
+                 db.session.query(Booking.id, Booking.status).filter(Booking.id.in_(ids))}
+    for booking_id, status_code in statuses.items():
+        # A 200 confirm means the sweeper lost; a 409 means it won
+        assert final[booking_id] == {200: "CONFIRMED", 409: "CANCELLED"}[status_code]
+    confirmed = sum(status == "CONFIRMED" for status in final.values())
+    assert seats_remaining(app, flight_id) == CAPACITY - confirmed
+    assert wallet_state(app, user_id)[1] == CAPACITY - confirmed
+
+
+def test_cancel_and_sweep_race_release_seats_once(app, make_user, make_flight, book):
+    flight_id = make_flight(economy=CAPACITY)
+    user_id, headers = make_user(balance="50000.00")
+    balance = wallet_state(app, user_id)[0]
+    ids = [book(headers, flight_id).get_json()["id"] for _ in range(CAPACITY)]
+    set_hold_expiry(app, ids, datetime.utcnow() - timedelta(seconds=1))
+
+    def cancel(booking_id):
+        time.sleep(random.uniform(0, 0.05))
+        return app.test_client().delete(f"/api/bookings/{booking_id}", headers=headers).status_code
+
+    def sweep():
+        with app.app_context():
+            return hold_sweeper.sweep(batch_size=3)["expired"]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sweeps = [executor.submit(sweep) for _ in range(3)]
+        assert set(executor.map(cancel, ids)) == {200}
+        assert sum(future.result() for future in sweeps) <= CAPACITY
+
+    assert seats_remaining(app, flight_id) == CAPACITY
+    assert wallet_state(app, user_id) == (balance, CAPACITY)  # each payment refunded exactly once
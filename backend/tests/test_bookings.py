@@ -0,0 +1,36 @@
+# backend/tests/test_bookings.py
+
+import pytest
+
+from utils.query_counter import count_queries
+
+BOOKINGS = 25
+
+
+@pytest.fixture
+def booked_user(client, make_user, make_flight):
+    """A user with BOOKINGS two-passenger bookings; returns their auth headers."""
+    flight_id = make_flight(economy=2 * BOOKINGS)
+    _, headers = make_user(balance="100000.00")
+    for index in range(BOOKINGS):
+        response = client.post("/api/bookings/", headers=headers, json={
+            "flight_id": flight_id,
+            "passengers": [{"first_name": "Budget", "last_name": f"Test{index}{suffix}", "gender": "O", "age": 30}
+                           for suffix in "AB"],
+        })
+        assert response.status_code == 201
+    return headers
+
+
+@pytest.mark.parametrize("path, role", [("/api/bookings/user?limit=50", "USER"), ("/api/bookings/?limit=50", "ADMIN")])
+def test_list_bookings_with_passengers_within_query_budget(app, client, make_user, booked_user, path, role):
+    headers = booked_user if role == "USER" else make_user(role="ADMIN")[1]
+    with count_queries() as counter:
+        response = client.get(path, headers=headers)
+
+    assert response.status_code == 200
+    bookings = response.get_json()["items"]
+    assert len(bookings) == BOOKINGS
+    assert all(len(booking["passengers"]) == 2 for booking in bookings)
+    # Passengers are batch-loaded: one query per booking would blow well past the budget
+    assert counter.count <= app.config["SQL_QUERY_BUDGET"] < BOOKINGS, counter.statements
@@ -0,0 +1,99 @@
+# backend/tests/test_conditional.py
+# Conditional GETs (utils/conditional.py): ETags on lists, Last-Modified on single flights.
+
+import json
+from datetime import datetime, timedelta
+
+from extensions import db
+from models import Flight
+from services.flight_service import update_flight
+
+
+def jsonl(*rows):
+    return "\n".join(json.dumps(row) for row in rows)
+
+
+def airport(code, name=None):
+    return {"name": name or f"Airport {code}", "city": code, "country": "Testland", "airport_code": code}
+
+
+def test_airport_list_etag(client, make_user):
+    _, admin = make_user(role="ADMIN")
+    etags = []
+
+    def current_etag():
+        response = client.get("/api/airports/")
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-cache"
+        etag = response.headers["ETag"]
+        assert etag not in etags  # every write below produces a new tag
+        etags.append(etag)
+        return etag
+
+    etag = current_etag()
+    not_modified = client.get("/api/airports/", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304 and not_modified.data == b""
+    assert not_modified.headers["ETag"] == etag
+
+    created = client.post("/api/airports/", headers=admin, json=airport("ETA"))
+    airport_id = created.get_json()["airport"]["id"]
+    etag = current_etag()
+    assert client.get("/api/airports/", headers={"If-None-Match": etags[0]}).status_code == 200
+
+    assert client.put(f"/api/airports/{airport_id}", headers=admin, json={"name": "Renamed"}).status_code == 200
+    current_etag()
+
+    # Bulk import: an update of an existing code, then an insert
+    for row in (airport("ETA", "Imported"), airport("ETB")):
+        report = client.post("/api/airports/import", headers=admin, data=jsonl(row),
+                             content_type="application/x-ndjson")
+        assert report.status_code == 200
+        current_etag()
+
+    assert client.delete(f"/api/airports/{airport_id}", headers=admin).status_code == 200
+    etag = current_etag()
+    assert client.get("/api/airports/", headers={"If-None-Match": etag}).status_code == 304
+
+    # Every page (query string) gets its own tag
+    assert client.get("/api/airports/?limit=1").headers["ETag"] != etag
+
+
+def test_flight_list_etag_changes_after_import(app, client, make_user, make_flight):
+    _, admin = make_user(role="ADMIN")
+    flight_id = make_flight()
+    etag = client.get("/api/flights/").headers["ETag"]
+    assert client.get("/api/flights/", headers={"If-None-Match": etag}).status_code == 304
+
+    with app.app_context():
+        flight = db.session.get(Flight, flight_id)
+        departure = datetime.utcnow() + timedelta(days=40)
+        row = {"flight_number": "ETAG1", "airplane_id": flight.airplane_id,
+               "departure_airport_id": flight.departure_airport_id, "arrival_airport_id": flight.arrival_airport_id,
+               "departure_time": departure.isoformat(), "arrival_time": (departure + timedelta(hours=2)).isoformat(),
+               "status": "ACTIVE", "price": "120.00"}
+    report = client.post("/api/flights/import", headers=admin, data=jsonl(row), content_type="application/x-ndjson")
+    assert report.get_json()["imported"] == 1
+
+    response = client.get("/api/flights/", headers={"If-None-Match": etag})
+    assert response.status_code == 200 and response.headers["ETag"] != etag
+
+
+def test_flight_if_modified_since(app, client, make_flight):
+    flight_id = make_flight()
+    response = client.get(f"/api/flights/{flight_id}")
+    last_modified = response.headers["Last-Modified"]
+    assert response.headers["ETag"]
+
+    assert client.get(f"/api/flights/{flight_id}", headers={"If-Modified-Since": last_modified}).status_code == 304
+    earlier = (response.last_modified - timedelta(minutes=1)).strftime("%a, %d %b %Y %H:%M:%S GMT")
+    assert client.get(f"/api/flights/{flight_id}", headers={"If-Modified-Since": earlier}).status_code == 200
+
+    # An update changes the ETag (Last-Modified has one-second resolution, the ETag does not)
+    with app.app_context():
+        update_flight(flight_id, {"price": 150.0})
+    updated = client.get(f"/api/flights/{flight_id}", headers={"If-None-Match": response.headers["ETag"]})
+    assert updated.status_code == 200
+    assert float(updated.get_json()["price"]) == 150.0
+    assert updated.last_modified >= response.last_modified
+
+    assert client.get("/api/flights/999999", headers={"If-Modified-Since": last_modified}).status_code == 404
@@ -0,0 +1,67 @@
+# backend/tests/test_db_routing.py
+# Primary/replica routing against two SQLite files. The replica file never receives the
+# primary's writes, so it plays a replica that has not caught up yet.
+
+import pytest
+from sqlalchemy import create_engine, func, select
+
+from extensions import db
+from models import Airport, Flight
+from services.airport_service import create_airport, get_all_airports
+from utils.db_routing import REPLICA_BIND_KEY, read_replica
+
+
+@pytest.fixture
+def replica(app, tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    db.metadata.create_all(engine)
+    with app.app_context():
+        monkeypatch.setitem(db.engines, REPLICA_BIND_KEY, engine)
+    yield engine
+    engine.dispose()
+
+
+def airport_count(engine):
+    with engine.connect() as connection:
+        return connection.scalar(select(func.count()).select_from(Airport.__table__))
+
+
+def new_airport(code):
+    return {"name": f"Airport {code}", "city": code, "country": "Testland", "airport_code": code}
+
+
+def test_writes_go_to_primary_and_reads_to_replica(app, replica):
+    with app.app_context():
+        with read_replica():
+            create_airport(new_airport("PRI"))
+        assert airport_count(db.engine) == 1
+        assert airport_count(replica) == 0
+
+        # A plain read-only service read sees the (lagging) replica
+        assert get_all_airports(10).items == []
+
+
+def test_dirty_session_reads_from_primary(app, replica):
+    with app.app_context(), read_replica():
+        db.session.add(Airport(**new_airport("DRT")))
+        assert Airport.query.filter_by(airport_code="DRT").count() == 1  # pending -> primary
+        assert db.session.scalar(select(func.count()).select_from(Airport)) == 1  # flushed -> primary
+        db.session.rollback()
+
+
+def test_cache_and_index_fills_read_from_primary(app, client, replica, make_user, make_flight):
+    _, headers = make_user(role="ADMIN")
+    assert client.get("/api/airports/").get_json()["items"] == []  # cached empty page
+
+    assert client.post("/api/airports/", headers=headers, json=new_airport("FIL")).status_code == 201
+    codes = [airport["airport_code"] for airport in client.get("/api/airports/").get_json()["items"]]
+    assert codes == ["FIL"]
+
+    flight_id = make_flight()
+    assert client.get(f"/api/flights/{flight_id}").status_code == 404  # plain reads: replica
+    with app.app_context():
+        flight = db.session.get(Flight, flight_id)
+        route = {"departure_airport_id": flight.departure_airport_id, "arrival_airport_id": flight.arrival_airport_id}
+    search = client.get("/api/flights/search", query_string=route)
+    assert search.status_code == 200
+    assert [found["id"] for found in search.get_json()] == [flight_id]
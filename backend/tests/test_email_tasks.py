@@ -0,0 +1,29 @@
+# backend/tests/test_email_tasks.py
+
+from smtplib import SMTPException
+
+from tasks import email_tasks
+
+
+def test_email_retries_follow_app_config(app, client, make_user, make_flight, monkeypatch):
+    assert email_tasks.send_booking_confirmation.max_retries == app.config["EMAIL_TASK_MAX_RETRIES"]
+    assert email_tasks.send_booking_confirmation.retry_backoff == app.config["EMAIL_TASK_RETRY_BACKOFF"]
+
+    _, headers = make_user(balance="1000.00")
+    booking = client.post("/api/bookings/", headers=headers, json={
+        "flight_id": make_flight(),
+        "passengers": [{"first_name": "Mail", "last_name": "Test", "gender": "O", "age": 30}],
+    })
+    assert booking.status_code == 201
+
+    attempts = []
+
+    def failing_send(*args, **kwargs):
+        attempts.append(args)
+        raise SMTPException("mail server down")
+
+    monkeypatch.setattr(email_tasks, "send_email", failing_send)
+    monkeypatch.setattr(email_tasks.send_booking_confirmation, "max_retries", 2)
+    with app.app_context():
+        result = email_tasks.send_booking_confirmation.apply(args=[booking.get_json()["id"]])
+    assert attempts and len(attempts) == 3, result.traceback
@@ -0,0 +1,83 @@
+# backend/tests/test_fare_engine.py
+
+import math
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+
+from exceptions.custom_exceptions import NotFoundError
+from extensions import db
+from models import Flight, SeatInventory
+from models.enums import FlightClass
+from services.fare_engine import FareEngine, parse_class_multipliers, quote_booking, quote_flights
+
+FAR_OUT = 10_000  # days to departure at which the last-minute term has vanished
+
+
+def price(base=100.0, days=FAR_OUT, total=(10, 10, 10), remaining=(10, 10, 10), engine=None):
+    """Fares of one flight with the default engine settings, as a list ordered like CLASSES."""
+    return (engine or FareEngine()).price([base], [days], [list(total)], [list(remaining)])[0].tolist()
+
+
+def test_class_multipliers():
+    assert price() == [100.0, 250.0, 400.0]
+    assert parse_class_multipliers("business=3, FIRST_CLASS=5").tolist() == [1.0, 3.0, 5.0]
+
+
+def test_load_factor_term():
+    # ECONOMY half sold, BUSINESS full, FIRST_CLASS empty: 1 + 1.0 * load ** 2
+    assert price(remaining=(5, 0, 10)) == [125.0, 500.0, 400.0]
+
+
+def test_last_minute_term():
+    assert price(days=0)[0] == 150.0
+    assert price(days=14)[0] == round(100 * (1 + 0.5 * math.exp(-1)), 2)
+    assert price(days=-3) == price(days=0)  # departed flights are priced as departing now
+
+
+def test_classes_without_seats_have_no_load_surcharge():
+    assert price(total=(10, 0, 0), remaining=(10, 0, 0)) == [100.0, 250.0, 400.0]
+
+
+def test_settings_come_from_config(app, monkeypatch):
+    for key, value in (("FARE_CLASS_MULTIPLIERS", "ECONOMY=1,BUSINESS=2,FIRST_CLASS=3"),
+                       ("FARE_LOAD_FACTOR_WEIGHT", 0.0), ("FARE_LAST_MINUTE_WEIGHT", 0.0)):
+        monkeypatch.setitem(app.config, key, value)
+    engine = FareEngine()
+    engine.init_app(app)
+    assert price(days=0, remaining=(0, 0, 0), engine=engine) == [100.0, 200.0, 300.0]
+
+
+def test_flight_without_inventory_is_priced_at_the_base_fare(app, make_flight):
+    flight_id = make_flight(economy=4)
+    with app.app_context():
+        SeatInventory.query.filter_by(flight_id=flight_id).delete()
+        db.session.commit()
+        flight = db.session.get(Flight, flight_id)
+        fares = quote_flights([flight], now=flight.departure_time - timedelta(days=14))[flight_id]
+    last_minute = 1 + 0.5 * math.exp(-1)
+    assert fares == {name: f"{100 * multiplier * last_minute:.2f}"
+                     for name, multiplier in (("ECONOMY", 1.0), ("BUSINESS", 2.5), ("FIRST_CLASS", 4.0))}
+
+
+def test_booking_is_charged_the_quote_not_the_client_price(app, make_user, make_flight, book):
+    flight_id = make_flight(economy=4, business=2)
+    _, headers = make_user(balance="100000.00")
+    seat_counts = {FlightClass.ECONOMY: 1, FlightClass.BUSINESS: 1}
+    with app.app_context():
+        quote = quote_booking(flight_id, seat_counts)
+
+    response = app.test_client().post("/api/bookings/", headers=headers, json={
+        "flight_id": flight_id,
+        "total_price": "0.01",
+        "passengers": [{"first_name": "Fare", "last_name": "Test", "gender": "O", "age": 30,
+                        "flight_class": flight_class.value} for flight_class in seat_counts],
+    })
+    assert response.status_code == 201
+    assert Decimal(response.get_json()["total_price"]) == quote > Decimal("0.01")
+
+
+def test_unknown_flight_cannot_be_quoted(app):
+    with app.app_context(), pytest.raises(NotFoundError):
+        quote_booking(999999, {FlightClass.ECONOMY: 1})
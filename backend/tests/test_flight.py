@@ -0,0 +1,111 @@
+# backend/tests/test_flight.py
+
+import json
+from datetime import timedelta
+
+from extensions import db
+from models import Airport
+from services.flight_service import get_flight_by_id
+from services.flight_search_index import flight_search_index
+from services.flight_lifecycle_service import advance_flight_statuses
+from services.booking_hold_service import hold_sweeper
+
+
+def test_lifecycle_transitions_refresh_route_search(app, client, make_flight):
+    flight_id = make_flight()
+    with app.app_context():
+        flight = get_flight_by_id(flight_id)
+        route = {"departure_airport_id": flight.departure_airport_id, "arrival_airport_id": flight.arrival_airport_id}
+        departure_time, arrival_time = flight.departure_time, flight.arrival_time
+
+    def searched_status():
+        response = client.get("/api/flights/search", query_string=route)
+        assert response.status_code == 200
+        return [found["status"] for found in response.get_json() if found["id"] == flight_id]
+
+    assert searched_status() == ["ACTIVE"]
+    for now, status in ((departure_time + timedelta(minutes=1), "IN_PROGRESS"),
+                        (arrival_time + timedelta(minutes=1), "COMPLETED")):
+        with app.app_context():
+            assert sum(advance_flight_statuses(now).values()) == 1
+        assert searched_status() == [status]
+
+
+def test_fare_calendar_follows_sell_out_and_reopening(app, client, make_user, make_flight, book):
+    flight_id = make_flight(economy=1)
+    _, headers = make_user(balance="100000.00")
+    with app.app_context():
+        flight = get_flight_by_id(flight_id)
+        query = {"departure_airport_id": flight.departure_airport_id,
+                 "arrival_airport_id": flight.arrival_airport_id,
+                 "month": flight.departure_time.strftime("%Y-%m")}
+        day = flight.departure_time.date().isoformat()
+
+    def flights_listed():
+        response = client.get("/api/flights/calendar", query_string=query)
+        assert response.status_code == 200
+        return next(entry["flights"] for entry in response.get_json()["days"] if entry["date"] == day)
+
+    assert flights_listed() == 1
+    response = book(headers, flight_id)
+    assert response.status_code == 201
+    assert flights_listed() == 0  # the last seat is gone
+
+    assert client.delete(f"/api/bookings/{response.get_json()['id']}", headers=headers).status_code == 200
+    assert flights_listed() == 1  # cancelling reopened it
+
+    response = book(headers, flight_id)
+    assert flights_listed() == 0
+    with app.app_context():
+        hold_sweeper.sweep(now=flight.departure_time)  # well past the hold
+    assert flights_listed() == 1  # so did the expired hold
+
+
+def test_search_index_is_invalidated_by_flight_writes(app, client, make_user, make_flight):
+    flight_id = make_flight()
+    _, headers = make_user(role="ADMIN")
+    with app.app_context():
+        flight = get_flight_by_id(flight_id)
+        route = (flight.departure_airport_id, flight.arrival_airport_id)
+        airport = Airport(name="Airport TSC", city="TSC", country="Testland", airport_code="TSC")
+        db.session.add(airport)
+        db.session.commit()
+        other_route = (flight.departure_airport_id, airport.id)
+        departure_time, airplane_id = flight.departure_time, flight.airplane_id
+
+    def search(route):
+        response = client.get("/api/flights/search", query_string={
+            "departure_airport_id": route[0], "arrival_airport_id": route[1]})
+        if response.status_code == 404:  # nothing on the route
+            return {}
+        assert response.status_code == 200
+        return {found["id"]: found["price"] for found in response.get_json()}
+
+    assert search(route) == {flight_id: "100.00"}
+    misses = flight_search_index.stats()["misses"]
+    assert search(route) == {flight_id: "100.00"}
+    assert flight_search_index.stats()["misses"] == misses  # served from the index
+
+    assert client.put(f"/api/flights/{flight_id}", headers=headers, json={"price": 150.0}).status_code == 200
+    assert search(route) == {flight_id: "150.00"}
+    assert flight_search_index.stats()["misses"] == misses + 1
+
+    # Moving the flight drops both the old and the new route
+    assert search(other_route) == {}
+    assert client.put(f"/api/flights/{flight_id}", headers=headers,
+                      json={"arrival_airport_id": other_route[1]}).status_code == 200
+    assert search(route) == {}
+    assert search(other_route) == {flight_id: "150.00"}
+
+    imported = {"flight_number": "TS-IMPORT", "airplane_id": airplane_id,
+                "departure_airport_id": other_route[0], "arrival_airport_id": other_route[1],
+                "departure_time": (departure_time + timedelta(days=1)).isoformat(),
+                "arrival_time": (departure_time + timedelta(days=1, hours=2)).isoformat(),
+                "status": "ACTIVE", "price": "80.00"}
+    response = client.post("/api/flights/import", headers=headers, data=json.dumps(imported) + "\n",
+                           content_type="application/x-ndjson")
+    assert response.get_json()["imported"] == 1
+    assert sorted(search(other_route).values()) == ["150.00", "80.00"]
+
+    assert client.delete(f"/api/flights/{flight_id}", headers=headers).status_code == 204
+    assert list(search(other_route).values()) == ["80.00"]
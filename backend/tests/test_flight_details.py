@@ -0,0 +1,58 @@
+# backend/tests/test_flight_details.py
+
+from extensions import db
+from models import Flight, SeatInventory
+from utils.query_counter import count_queries
+
+DETAIL_FIELDS = {
+    "id", "flight_number", "airplane_id", "departure_airport_id", "arrival_airport_id", "departure_time",
+    "arrival_time", "status", "price", "departure_airport_code", "departure_city", "arrival_airport_code",
+    "arrival_city", "airplane_model", "seats_remaining",
+}
+
+
+def make_flights(app, make_flight, count):
+    first = make_flight(economy=10, business=2)
+    with app.app_context():
+        flight = db.session.get(Flight, first)
+        route = {"departure_airport_id": flight.departure_airport_id, "arrival_airport_id": flight.arrival_airport_id}
+    return [first] + [make_flight(economy=10, business=2, **route) for _ in range(count - 1)]
+
+
+def test_expanded_flight_list_shape(app, client, make_user, make_flight, book):
+    flight_ids = make_flights(app, make_flight, 3)
+    _, headers = make_user(balance="100000.00")
+    assert book(headers, flight_ids[0], passengers=3).status_code == 201
+    with app.app_context():
+        # A flight without inventory rows yet reports unknown availability, not zero
+        SeatInventory.query.filter_by(flight_id=flight_ids[2]).delete()
+        db.session.commit()
+
+    plain = client.get("/api/flights/").get_json()["items"]
+    expanded = client.get("/api/flights/?expand=1").get_json()["items"]
+    assert [flight["id"] for flight in expanded] == flight_ids
+    for flight, detail in zip(plain, expanded):
+        assert set(detail) == DETAIL_FIELDS
+        assert {key: detail[key] for key in flight} == flight  # a superset of the plain view
+        assert (detail["departure_airport_code"], detail["departure_city"]) == ("TSA", "TSA")
+        assert (detail["arrival_airport_code"], detail["arrival_city"]) == ("TSB", "TSB")
+        assert detail["airplane_model"] == "A320"
+    assert [detail["seats_remaining"] for detail in expanded] == [9, 12, None]
+
+
+def test_expanded_views_are_one_query(app, client, make_flight):
+    flight_ids = make_flights(app, make_flight, 5)
+    with app.app_context():
+        flight = db.session.get(Flight, flight_ids[0])
+        route = f"departure_airport_id={flight.departure_airport_id}&arrival_airport_id={flight.arrival_airport_id}"
+
+    for path in ("/api/flights/?expand=1", f"/api/flights/search?expand=1&{route}"):
+        with count_queries() as counter:
+            response = client.get(path)
+        assert response.status_code == 200
+        body = response.get_json()
+        items = body["items"] if isinstance(body, dict) else body
+        assert len(items) == 5 and all(item["airplane_model"] == "A320" for item in items)
+        # Search also prices the results, which takes one inventory query for the whole page
+        expected = 1 if "search" not in path else 2
+        assert counter.count == expected, (path, counter.statements)
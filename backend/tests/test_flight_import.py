@@ -0,0 +1,103 @@
+# backend/tests/test_flight_import.py
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from extensions import db
+from models import Flight, SeatInventory
+
+DEPARTURE = (datetime.utcnow() + timedelta(days=60)).replace(microsecond=0)
+
+
+@pytest.fixture
+def template(app, make_flight):
+    """A valid import row (airplane and airports of an existing flight, flight number TS0000 taken)."""
+    flight_id = make_flight(economy=5, business=2)
+    with app.app_context():
+        flight = db.session.get(Flight, flight_id)
+        return {"flight_number": "IMP-0", "airplane_id": flight.airplane_id,
+                "departure_airport_id": flight.departure_airport_id,
+                "arrival_airport_id": flight.arrival_airport_id,
+                "departure_time": DEPARTURE.isoformat(),
+                "arrival_time": (DEPARTURE + timedelta(hours=2)).isoformat(),
+                "status": "ACTIVE", "price": "120.00"}
+
+
+def post_jsonl(client, headers, lines, **params):
+    body = "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines) + "\n"
+    return client.post("/api/flights/import", headers=headers, query_string=params, data=body,
+                       content_type="application/x-ndjson")
+
+
+def test_valid_rows_are_imported_and_bad_rows_reported(app, client, make_user, template):
+    _, headers = make_user(role="ADMIN")
+    lines = [
+        {**template, "flight_number": "IMP-1"},
+        {**template, "flight_number": "IMP-2", "price": "-1"},
+        "{not json",
+        {**template, "flight_number": "IMP-3", "airplane_id": 999999},
+        {key: value for key, value in template.items() if key not in ("status", "price")},
+        {**template, "flight_number": "TS0000"},  # already in the database
+        {**template, "flight_number": "IMP-1"},  # earlier in the same file
+        {**template, "flight_number": "IMP-4", "departure_time": "2001-01-01T00:00:00"},
+        {**template, "flight_number": "IMP-5", "arrival_time": template["departure_time"]},
+        {**template, "flight_number": "IMP-6", "arrival_airport_id": template["departure_airport_id"]},
+        {**template, "flight_number": "IMP-7", "departure_time": "next tuesday"},
+        {**template, "flight_number": "IMP-8", "status": "BOARDING"},
+        {**template, "flight_number": "IMP-9"},
+    ]
+    response = post_jsonl(client, headers, lines, chunk_size=4)  # errors in every chunk
+    assert response.status_code == 200
+    report = response.get_json()
+
+    assert (report["total_rows"], report["imported"], report["failed"]) == (13, 2, 11)
+    errors = {error["row"]: " ".join(error["errors"]) for error in report["errors"]}
+    assert sorted(errors) == list(range(2, 13))
+    for row, message in {2: "negative", 3: "Invalid JSON", 4: "Airplane with ID 999999 not found",
+                         5: "Missing field(s): status, price", 6: "TS0000 already exists",
+                         7: "IMP-1 already exists", 8: "in the past", 9: "after departure",
+                         10: "must differ", 11: "ISO 8601", 12: "Invalid status"}.items():
+        assert message in errors[row], (row, errors[row])
+    assert report["errors_truncated"] is False and report["rows_per_second"] is not None
+
+    with app.app_context():
+        imported = Flight.query.filter(Flight.flight_number.in_(["IMP-1", "IMP-9"])).all()
+        assert len(imported) == 2
+        inventory = SeatInventory.query.filter(SeatInventory.flight_id.in_([f.id for f in imported])).all()
+        assert sorted((row.flight_class.value, row.seats_remaining) for row in inventory) == \
+            [("BUSINESS", 2)] * 2 + [("ECONOMY", 5)] * 2 + [("FIRST_CLASS", 0)] * 2
+
+
+def test_csv_import_and_error_cap(app, client, make_user, template, monkeypatch):
+    _, headers = make_user(role="ADMIN")
+    monkeypatch.setitem(app.config, "IMPORT_MAX_REPORTED_ERRORS", 2)
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(template))
+    writer.writeheader()
+    writer.writerow({**template, "flight_number": "CSV-1"})
+    for index in range(3):
+        writer.writerow({**template, "flight_number": f"CSV-BAD-{index}", "price": "free"})
+
+    response = client.post("/api/flights/import", headers=headers, data=out.getvalue(), content_type="text/csv")
+    report = response.get_json()
+    assert (report["imported"], report["failed"]) == (1, 3)
+    # CSV data rows are numbered from 2, after the header; only the first two errors are listed
+    assert [error["row"] for error in report["errors"]] == [3, 4] and report["errors_truncated"] is True
+
+
+def test_import_requires_admin(client, make_user, template):
+    _, headers = make_user()
+    assert post_jsonl(client, headers, [template]).status_code == 403
+
+
+def test_cli_import(app, template, tmp_path):
+    path = tmp_path / "schedule.jsonl"
+    path.write_text(json.dumps({**template, "flight_number": "CLI-1"}) + "\n" + json.dumps(template) + "\n")
+    result = app.test_cli_runner().invoke(args=["flights", "import", str(path), "--chunk-size", "1"])
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert (report["imported"], report["failed"]) == (2, 0)
@@ -0,0 +1,124 @@
+# backend/tests/test_idempotency.py
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask import jsonify
+from flask_jwt_extended import verify_jwt_in_request
+
+from utils.cache_backends import LocalRedis
+from utils.idempotency import Idempotency, MemoryIdempotencyStore, RedisIdempotencyStore, PENDING
+
+STORES = {
+    "memory": MemoryIdempotencyStore,
+    "local-redis": lambda: RedisIdempotencyStore(LocalRedis()),
+}
+
+
+@pytest.fixture(params=sorted(STORES))
+def idempotency(request):
+    handler = Idempotency()
+    handler.store = STORES[request.param]()
+    handler.wait_seconds = 2
+    return handler
+
+
+@pytest.fixture
+def call(app, idempotency, make_user):
+    """call(view, key="k1", body=...) runs ``view`` behind idempotency.handle in its own request."""
+    _, auth = make_user()
+
+    def run(view, key="k1", body=None):
+        data = json.dumps(body or {"amount": 1})
+        headers = {"Idempotency-Key": key, **auth}
+        with app.test_request_context("/api/things", method="POST", data=data,
+                                      content_type="application/json", headers=headers):
+            verify_jwt_in_request()
+            return idempotency.handle(view, (), {})
+
+    return run
+
+
+class CountingView:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            number = self.calls
+        time.sleep(self.delay)
+        return jsonify({"created": number}), 201
+
+
+def test_retry_replays_the_stored_response(call):
+    view = CountingView()
+    first, second = call(view), call(view)
+    assert view.calls == 1
+    assert (second.status_code, second.get_json()) == (201, first.get_json())
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+
+
+def test_key_reused_for_a_different_body_is_rejected(call):
+    view = CountingView()
+    call(view, body={"amount": 1})
+    assert call(view, body={"amount": 2}).status_code == 422
+    assert view.calls == 1
+
+
+def test_concurrent_duplicate_waits_for_the_first(call):
+    view = CountingView(delay=0.3)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(call, view)
+        time.sleep(0.05)
+        second = executor.submit(call, view)
+        responses = [first.result(), second.result()]
+    assert view.calls == 1
+    assert [response.status_code for response in responses] == [201, 201]
+    assert responses[1].get_json() == responses[0].get_json()
+    assert responses[1].headers["Idempotent-Replayed"] == "true"
+
+
+def test_duplicate_gets_409_when_the_wait_times_out(call, idempotency):
+    idempotency.wait_seconds = 0.1
+    view = CountingView(delay=0.5)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        first = executor.submit(call, view)
+        time.sleep(0.05)
+        duplicate = call(view)
+        assert first.result().status_code == 201
+    assert duplicate.status_code == 409
+    assert duplicate.headers["Retry-After"] == "1"
+    assert view.calls == 1
+
+
+def test_slow_request_keeps_its_claim_past_the_lock_time(call, idempotency):
+    idempotency.lock_seconds = 0.15
+    view = CountingView(delay=0.6)  # four lock periods
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(call, view)
+        time.sleep(0.3)
+        duplicate = executor.submit(call, view)
+        assert first.result().status_code == duplicate.result().status_code == 201
+    assert view.calls == 1
+    assert duplicate.result().headers["Idempotent-Replayed"] == "true"
+
+
+def test_owner_whose_lock_lapsed_cannot_overwrite_the_next_owner(idempotency):
+    store = idempotency.store
+    assert store.claim("k", {"state": PENDING, "fingerprint": "f", "token": "a"}, 0.05) is None
+    time.sleep(0.1)
+    assert store.claim("k", {"state": PENDING, "fingerprint": "f", "token": "b"}, 5) is None
+
+    assert not store.extend("k", "a", 5)
+    assert not store.complete("k", "a", {"state": "done", "fingerprint": "f", "token": "a"}, 60)
+    store.release("k", "a")
+    assert store.wait("k", 0)["token"] == "b"
+    assert store.complete("k", "b", {"state": "done", "fingerprint": "f", "token": "b"}, 60)
+    assert store.wait("k", 0)["state"] == "done"
@@ -0,0 +1,72 @@
+# backend/tests/test_itinerary.py
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from extensions import db
+from models import Airplane, Airport
+from services.flight_service import create_flight
+
+# Departure date of the first leg: far enough out that every flight is in the future
+DAY = (datetime.utcnow() + timedelta(days=30)).replace(hour=8, minute=0, second=0, microsecond=0)
+FIRST_ARRIVAL = DAY + timedelta(hours=2)
+# Connections out of the hub, by layover after the first leg lands
+LAYOVERS = {"TOO-SHORT": 30, "MIN": 45, "MAX": 360, "TOO-LONG": 361}
+
+
+@pytest.fixture
+def network(app):
+    """Origin -> hub on DAY, plus hub -> destination connections with the LAYOVERS layovers."""
+    with app.app_context():
+        airplane = Airplane(airplane_number="IT0001", model="A320", total_seats=10, economy_seats=10,
+                            business_seats=0, first_class_seats=0)
+        origin, hub, destination = airports = [
+            Airport(name=f"Airport {code}", city=code, country="Testland", airport_code=code)
+            for code in ("ITA", "ITH", "ITZ")]
+        db.session.add_all([airplane, *airports])
+        db.session.commit()
+
+        def add(flight_number, departure_airport, arrival_airport, departure, arrival):
+            create_flight({"flight_number": flight_number, "airplane_id": airplane.id,
+                           "departure_airport_id": departure_airport.id, "arrival_airport_id": arrival_airport.id,
+                           "departure_time": departure, "arrival_time": arrival, "status": "ACTIVE",
+                           "price": 100.0})
+
+        add("LEG-1", origin, hub, DAY, FIRST_ARRIVAL)
+        for flight_number, minutes in LAYOVERS.items():
+            departure = FIRST_ARRIVAL + timedelta(minutes=minutes)
+            add(flight_number, hub, destination, departure, departure + timedelta(hours=1))
+        return origin.id, destination.id
+
+
+def search(client, route, **params):
+    return client.get("/api/flights/itineraries", query_string={
+        "departure_airport_id": route[0], "arrival_airport_id": route[1],
+        "date": DAY.date().isoformat(), **params})
+
+
+def connections(response):
+    assert response.status_code == 200
+    return sorted(itinerary["flights"][1]["flight_number"] for itinerary in response.get_json())
+
+
+def test_default_layover_bounds_are_inclusive(client, network):
+    response = search(client, network)
+    assert connections(response) == ["MAX", "MIN"]
+    assert sorted(itinerary["layover_minutes"][0] for itinerary in response.get_json()) == [45, 360]
+
+
+def test_layover_bounds_from_the_query(client, network):
+    assert connections(search(client, network, min_layover_minutes=30, max_layover_minutes=45)) == ["MIN", "TOO-SHORT"]
+    assert connections(search(client, network, min_layover_minutes=46, max_layover_minutes=361)) == ["MAX", "TOO-LONG"]
+    assert search(client, network, min_layover_minutes=31, max_layover_minutes=44).status_code == 404
+
+
+@pytest.mark.parametrize("params", [{"min_layover_minutes": -1}, {"min_layover_minutes": 60, "max_layover_minutes": 59}])
+def test_invalid_layover_window_is_rejected(client, network, params):
+    assert search(client, network, **params).status_code == 400
+
+
+def test_direct_only_finds_no_connections(client, network):
+    assert search(client, network, max_stops=0).status_code == 404
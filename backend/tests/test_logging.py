@@ -0,0 +1,71 @@
+# backend/tests/test_logging.py
+
+import json
+import logging
+import queue
+import sys
+
+from utils import logging_config
+from utils.logging_config import JsonFormatter, NonBlockingQueueHandler, SamplingFilter, parse_sampling
+
+
+def record(name="services.flight_service", level=logging.INFO, msg="hello %s", args=("world",), **extra):
+    log_record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    log_record.__dict__.update(extra)
+    return log_record
+
+
+def test_parse_sampling():
+    assert parse_sampling(" services=0.1, werkzeug = 2 ,noisy=-1,") == {"services": 0.1, "werkzeug": 1.0, "noisy": 0.0}
+    assert parse_sampling(None) == {}
+
+
+def test_sampling_drops_only_debug_and_info_of_matching_loggers():
+    sampler = SamplingFilter({"services": 0.0, "services.flight_service": 1.0})
+    assert not sampler.filter(record("services.booking_service"))
+    assert not sampler.filter(record("services", level=logging.DEBUG))
+    assert sampler.filter(record("services.flight_service.sub"))  # longest prefix wins
+    assert sampler.filter(record("services.booking_service", level=logging.WARNING))
+    assert sampler.filter(record("servicesX"))  # a prefix only matches whole name segments
+    assert sampler.filter(record("werkzeug"))
+
+
+def test_sampling_keeps_the_configured_fraction(monkeypatch):
+    sampler = SamplingFilter({"werkzeug": 0.25})
+    monkeypatch.setattr(logging_config.random, "random", lambda: 0.2)
+    assert sampler.filter(record("werkzeug"))
+    monkeypatch.setattr(logging_config.random, "random", lambda: 0.3)
+    assert not sampler.filter(record("werkzeug"))
+
+
+def test_full_queue_drops_and_counts_instead_of_blocking(app, client, monkeypatch):
+    monkeypatch.setitem(app.config, "METRICS_PUBLIC", True)
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=2))
+    for index in range(5):
+        handler.handle(record(args=(index,)))
+    assert handler.queue.qsize() == 2 and handler.dropped == 3
+    # The first records are kept, already formatted, with their arguments resolved
+    assert [handler.queue.get_nowait().msg for _ in range(2)] == ["hello 0", "hello 1"]
+
+    monkeypatch.setattr(logging_config, "_queue_handler", handler)
+    assert "\nlog_records_dropped_total 3\n" in client.get("/metrics").get_data(as_text=True)
+
+
+def test_queued_records_carry_the_traceback_as_text():
+    handler = NonBlockingQueueHandler(queue.Queue())
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        failing = record(level=logging.ERROR, msg="failed", args=None, exc_info=sys.exc_info())
+    handler.handle(failing)
+    queued = handler.queue.get_nowait()
+    assert queued.exc_info is None and "ValueError: boom" in queued.exc_text
+    assert failing.exc_info is not None  # the caller's record is left alone
+
+
+def test_json_formatter_emits_extra_fields_and_tracebacks():
+    formatted = json.loads(JsonFormatter().format(record(booking_id=7, exc_text="Traceback ...")))
+    assert formatted["message"] == "hello world"
+    assert (formatted["level"], formatted["logger"], formatted["booking_id"]) == ("INFO", "services.flight_service", 7)
+    assert formatted["exc_info"] == "Traceback ..."
+    assert formatted["ts"].endswith("+00:00")
@@ -0,0 +1,33 @@
+# backend/tests/test_metrics.py
+
+import pytest
+
+from services.booking_hold_service import hold_sweeper
+
+
+@pytest.mark.parametrize("public", [False, True])
+def test_metrics_without_a_token_are_only_served_when_public(app, client, monkeypatch, public):
+    monkeypatch.setitem(app.config, "METRICS_AUTH_TOKEN", None)
+    monkeypatch.setitem(app.config, "METRICS_PUBLIC", public)
+    assert client.get("/metrics").status_code == (200 if public else 404)
+
+
+def test_metrics_require_the_token(app, client, monkeypatch):
+    monkeypatch.setitem(app.config, "METRICS_AUTH_TOKEN", "scrape-me")
+    monkeypatch.setitem(app.config, "METRICS_PUBLIC", True)  # a token always applies
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-me"}).status_code == 200
+
+
+def test_jobs_report_through_their_collectors(app, client, monkeypatch):
+    monkeypatch.setitem(app.config, "METRICS_PUBLIC", True)
+    with app.app_context():
+        hold_sweeper.sweep()
+    sweeps = hold_sweeper.stats()["sweeps"]
+
+    body = client.get("/metrics").get_data(as_text=True)
+    assert "# TYPE booking_hold_sweeps_total counter" in body
+    assert f"booking_hold_sweeps_total {sweeps}\n" in body
+    assert "# TYPE flight_lifecycle_ticks_total counter" in body
+    assert "# TYPE flight_status_transitions_total counter" in body
@@ -0,0 +1,93 @@
+# backend/tests/test_pagination.py
+
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from exceptions.custom_exceptions import BadRequestError
+from extensions import db
+from models import Flight
+from models.enums import FlightClass
+from utils.pagination import decode_cursor, encode_cursor, paginate
+
+
+@pytest.mark.parametrize("value", [
+    datetime(2030, 1, 31, 14, 5, 0, 123456), date(2030, 1, 31), Decimal("100.50"), "LHR", 7, None,
+])
+def test_cursor_round_trip(value):
+    cursor = encode_cursor("sort", value, 42)
+    assert "=" not in cursor  # padding is stripped, the cursor is URL-safe as is
+    assert decode_cursor(cursor, "sort") == (value, 42)
+
+
+def test_enum_values_are_encoded_by_value():
+    assert decode_cursor(encode_cursor("flight_class", FlightClass.BUSINESS, 1), "flight_class") == ("BUSINESS", 1)
+
+
+def make_flights(app, make_flight, count):
+    """``count`` flights on one route, in creation (= departure and id) order."""
+    first = make_flight()
+    with app.app_context():
+        flight = db.session.get(Flight, first)
+        route = {"departure_airport_id": flight.departure_airport_id, "arrival_airport_id": flight.arrival_airport_id}
+    return [first] + [make_flight(**route) for _ in range(count - 1)]
+
+
+def _raw(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor!",
+    base64.urlsafe_b64encode(b"not json").decode(),
+    _raw(["sort", "x"]),  # wrong shape
+    _raw(["sort", "x", "42"]),  # id must be an integer
+    _raw(["other", "x", 42]),  # issued for another listing
+])
+def test_invalid_cursors_are_rejected(cursor):
+    with pytest.raises(BadRequestError, match="Invalid cursor"):
+        decode_cursor(cursor, "sort")
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_paging_through_ties(app, make_flight, descending):
+    """Every flight has the same price, so only the id tie-break separates the pages."""
+    expected = make_flights(app, make_flight, 5)
+    if descending:
+        expected.reverse()
+    seen, cursor = [], None
+    with app.app_context():
+        while True:
+            page = paginate(Flight.query, Flight.price, Flight.id, 2, cursor, descending=descending)
+            seen.extend(flight.id for flight in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+            assert decode_cursor(cursor, "price")[0] == Decimal("100.00")
+    assert seen == expected
+
+
+def test_flight_list_pages_over_http(app, client, make_flight):
+    expected = make_flights(app, make_flight, 5)
+    seen, cursor, pages = [], None, 0
+    while True:
+        response = client.get("/api/flights/", query_string={"limit": 2, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        body = response.get_json()
+        seen.extend(flight["id"] for flight in body["items"])
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected and pages == 3
+
+
+def test_bad_page_arguments_are_400s(client, make_flight):
+    make_flight()
+    airports_cursor = encode_cursor("airport_code", "TSA", 1)
+    for query in ({"cursor": "garbage"}, {"cursor": airports_cursor}, {"limit": 0}):
+        response = client.get("/api/flights/", query_string=query)
+        assert response.status_code == 400, query
@@ -0,0 +1,91 @@
+# backend/tests/test_reference_import.py
+
+import json
+
+from extensions import db
+from models import Airplane, Airport
+
+
+def post_jsonl(client, path, headers, rows, **params):
+    body = "".join((row if isinstance(row, str) else json.dumps(row)) + "\n" for row in rows)
+    return client.post(path, headers=headers, query_string=params, data=body, content_type="application/x-ndjson")
+
+
+def airport(code, name=None):
+    return {"name": name or f"Airport {code}", "city": code.title(), "country": "Testland", "airport_code": code}
+
+
+def airplane(number, economy=100, business=10, first_class=2, total=None):
+    return {"airplane_number": number, "model": "A320", "economy_seats": economy, "business_seats": business,
+            "first_class_seats": first_class, "total_seats": economy + business + first_class if total is None else total}
+
+
+def test_airport_upsert_counts_inserts_and_updates(app, client, make_user):
+    _, headers = make_user(role="ADMIN")
+    with app.app_context():
+        db.session.add(Airport(**airport("LHR", "Old name")))
+        db.session.commit()
+
+    response = post_jsonl(client, "/api/airports/import", headers, [
+        airport("LHR", "Heathrow"),          # existing: updated
+        airport("CDG"),                      # inserted
+        airport("CDG", "Twice"),             # same chunk: rejected
+        airport("TOOLONG"),                  # invalid code
+        {"airport_code": "AMS"},             # missing fields
+        airport("JFK"),                      # second chunk: inserted
+        airport("CDG", "Charles de Gaulle"), # second chunk: updates the row inserted by the first
+    ], chunk_size=5)
+    assert response.status_code == 200
+    report = response.get_json()
+    assert {key: report[key] for key in ("total_rows", "inserted", "updated", "failed")} == \
+        {"total_rows": 7, "inserted": 2, "updated": 2, "failed": 3}
+    errors = {error["row"]: " ".join(error["errors"]) for error in report["errors"]}
+    assert "Duplicate airport code CDG" in errors[3]
+    assert errors[4].startswith("airport_code:")
+    assert "name:" in errors[5] and "city:" in errors[5]
+    assert report["rows_per_second"] is not None
+
+    with app.app_context():
+        names = dict(db.session.query(Airport.airport_code, Airport.name))
+    assert names == {"LHR": "Heathrow", "CDG": "Charles de Gaulle", "JFK": "Airport JFK"}
+
+
+def test_airplane_upsert_enforces_the_seat_sum(app, client, make_user):
+    _, headers = make_user(role="ADMIN")
+    response = post_jsonl(client, "/api/airplanes/import", headers, [
+        airplane("AB0001"),
+        airplane("AB0002", total=1),  # seats do not add up
+        airplane("AB0003"),
+    ])
+    report = response.get_json()
+    assert (report["inserted"], report["updated"], report["failed"]) == (2, 0, 1)
+    assert report["errors"] == [{"row": 2, "errors": [
+        "Total seats must equal the sum of economy, business, and first class seats."]}]
+
+    response = post_jsonl(client, "/api/airplanes/import", headers, [airplane("AB0001", economy=150), airplane("AB0004")])
+    report = response.get_json()
+    assert (report["inserted"], report["updated"], report["failed"]) == (1, 1, 0)
+    with app.app_context():
+        updated = Airplane.query.filter_by(airplane_number="AB0001").one()
+        assert (updated.economy_seats, updated.total_seats) == (150, 162)
+        assert Airplane.query.count() == 3
+
+
+def test_reference_imports_require_admin(app, client, make_user):
+    _, headers = make_user()
+    assert post_jsonl(client, "/api/airports/import", headers, [airport("LHR")]).status_code == 400
+    assert post_jsonl(client, "/api/airplanes/import", headers, [airplane("AB0001")]).status_code == 400
+    with app.app_context():
+        assert Airport.query.count() == Airplane.query.count() == 0
+
+
+def test_cli_import(app, tmp_path):
+    path = tmp_path / "fleet.csv"
+    path.write_text("airplane_number,model,total_seats,economy_seats,business_seats,first_class_seats\n"
+                    "CL0001,A321,200,180,20,0\n"
+                    "CL0002,A321,1,180,20,0\n")
+    result = app.test_cli_runner().invoke(args=["airplanes", "import", str(path)])
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert (report["inserted"], report["failed"]) == (1, 1)
+    assert report["errors"][0]["row"] == 3
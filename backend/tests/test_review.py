@@ -0,0 +1,72 @@
+# backend/tests/test_review.py
+
+import pytest
+
+from extensions import db
+from models import Airport, Booking, Passenger
+from models.review import Review, FlightRating
+from services.flight_service import update_flight, delete_flight, get_flight_by_id
+from exceptions.custom_exceptions import NotFoundError
+
+
+@pytest.fixture
+def reviewed_flight(app, client, make_user, make_flight):
+    """A TSA -> TSB flight with one 4-star review; returns (flight id, review id, airport ids)."""
+    flight_id = make_flight()
+    with app.app_context():
+        route = get_flight_by_id(flight_id)
+        airports = (route.departure_airport_id, route.arrival_airport_id)
+
+    _, headers = make_user(balance="1000.00")
+    booking = client.post("/api/bookings/", headers=headers, json={
+        "flight_id": flight_id,
+        "passengers": [{"first_name": "Review", "last_name": "Test", "gender": "O", "age": 30}],
+    })
+    assert booking.status_code == 201
+    if booking.get_json()["status"] == "PENDING":
+        assert client.post(f"/api/bookings/{booking.get_json()['id']}/confirm", headers=headers).status_code == 200
+
+    review = client.post("/api/reviews/", headers=headers, json={"flight_id": flight_id, "rating": 4})
+    assert review.status_code == 201
+    return flight_id, review.get_json()["id"], airports, headers
+
+
+def route_count(client, departure_airport_id, arrival_airport_id):
+    response = client.get(f"/api/reviews/routes/{departure_airport_id}/{arrival_airport_id}/rating")
+    return response.get_json()["review_count"]
+
+
+def test_route_change_moves_rating_totals(app, client, reviewed_flight):
+    flight_id, review_id, (departure_id, arrival_id), headers = reviewed_flight
+    with app.app_context():
+        airport = Airport(name="Airport TSC", city="TSC", country="Testland", airport_code="TSC")
+        db.session.add(airport)
+        db.session.commit()
+        new_arrival_id = airport.id
+        update_flight(flight_id, {"arrival_airport_id": new_arrival_id})
+
+    assert route_count(client, departure_id, arrival_id) == 0
+    assert route_count(client, departure_id, new_arrival_id) == 1
+
+    # Deleting the review after the move subtracts it from the new route, not the old one
+    assert client.delete(f"/api/reviews/{review_id}", headers=headers).status_code == 200
+    assert route_count(client, departure_id, arrival_id) == 0
+    assert route_count(client, departure_id, new_arrival_id) == 0
+
+
+def test_delete_flight_with_reviews(app, client, reviewed_flight):
+    flight_id, _, (departure_id, arrival_id), _ = reviewed_flight
+    with app.app_context():
+        # Bookings still block deleting a flight; only the reviews are under test here
+        booking_ids = [booking_id for (booking_id,) in db.session.query(Booking.id).filter_by(flight_id=flight_id)]
+        Passenger.query.filter(Passenger.booking_id.in_(booking_ids)).delete(synchronize_session=False)
+        Booking.query.filter_by(flight_id=flight_id).delete(synchronize_session=False)
+        db.session.commit()
+
+        delete_flight(flight_id)
+        with pytest.raises(NotFoundError):
+            get_flight_by_id(flight_id)
+        assert Review.query.filter_by(flight_id=flight_id).count() == 0
+        assert db.session.get(FlightRating, flight_id) is None
+
+    assert route_count(client, departure_id, arrival_id) == 0
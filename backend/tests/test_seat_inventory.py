@@ -0,0 +1,58 @@
+# backend/tests/test_seat_inventory.py
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from extensions import db
+from models import SeatInventory
+from models.enums import FlightClass
+
+CAPACITY = 10
+ATTEMPTS = 300
+CONCURRENCY = 32
+
+
+def test_concurrent_bookings_never_oversell(app, make_user, make_flight):
+    flight_id = make_flight(economy=CAPACITY)
+    users = [make_user(balance="100000.00") for _ in range(20)]
+
+    def book(index):
+        _, headers = users[index % len(users)]
+        response = app.test_client().post("/api/bookings/", headers=headers, json={
+            "flight_id": flight_id,
+            "passengers": [{"first_name": "Load", "last_name": f"Test{index}", "gender": "O", "age": 30}],
+        })
+        return response.status_code
+
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+        statuses = Counter(executor.map(book, range(ATTEMPTS)))
+
+    assert statuses == {201: CAPACITY, 409: ATTEMPTS - CAPACITY}
+    with app.app_context():
+        inventory = db.session.query(SeatInventory).filter_by(
+            flight_id=flight_id, flight_class=FlightClass.ECONOMY).one()
+        assert inventory.seats_remaining == 0
+
+
+def test_seats_of_a_flight_without_inventory_are_derived_without_writing(app, client, make_user, make_flight, book):
+    flight_id = make_flight(economy=5, business=2)
+    _, headers = make_user(balance="100000.00")
+    assert book(headers, flight_id).status_code == 201
+    with app.app_context():
+        # A flight from before seat inventory existed: no rows, one booked passenger
+        SeatInventory.query.filter_by(flight_id=flight_id).delete()
+        db.session.commit()
+
+    response = client.get(f"/api/flights/{flight_id}/seats")
+    assert response.status_code == 200
+    seats = {row["flight_class"]: row["seats_remaining"] for row in response.get_json()}
+    assert seats == {"BUSINESS": 2, "ECONOMY": 4, "FIRST_CLASS": 0}
+    with app.app_context():
+        assert SeatInventory.query.filter_by(flight_id=flight_id).count() == 0
+
+    # The next booking stores the rows
+    assert book(headers, flight_id).status_code == 201
+    with app.app_context():
+        economy = SeatInventory.query.filter_by(flight_id=flight_id, flight_class=FlightClass.ECONOMY).one()
+        assert economy.seats_remaining == 3
+    assert client.get("/api/flights/999999/seats").status_code == 404
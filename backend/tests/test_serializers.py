@@ -0,0 +1,98 @@
+# backend/tests/test_serializers.py
+
+import pytest
+from marshmallow import Schema, fields, post_dump
+from sqlalchemy.orm import selectinload
+
+from extensions import db
+from models import Airplane, Booking, Flight, Review, SeatInventory, Wallet, WalletTransaction
+from schemas.airplane_schemas import AirplaneResponseSchema
+from schemas.booking_schemas import BookingSchema
+from schemas.flight_schemas import FlightDetailSchema, FlightResponseSchema
+from schemas.review_schemas import ReviewSchema
+from schemas.serializers import dumper, schema
+from schemas.transaction_schemas import TransactionSchema
+from schemas.wallet_schemas import WalletSchema
+from services.flight_service import flight_details_query
+
+
+def assert_identical(app, schema_cls, objects):
+    """dumper() output serializes to exactly the bytes of marshmallow's own dump, per object and per page."""
+    assert objects
+    expected = app.json.dumps(schema_cls(many=True).dump(objects))
+    assert app.json.dumps(dumper(schema_cls, many=True)(objects)) == expected
+    for obj in objects:
+        assert app.json.dumps(dumper(schema_cls)(obj)) == app.json.dumps(schema_cls().dump(obj))
+
+
+@pytest.fixture
+def dataset(app, client, make_user, make_flight, book):
+    """Flights (one without inventory), bookings with cancelled passengers, a review and wallet history."""
+    first = make_flight(economy=10, business=2)
+    with app.app_context():
+        flight = db.session.get(Flight, first)
+        route = {"departure_airport_id": flight.departure_airport_id, "arrival_airport_id": flight.arrival_airport_id}
+    bare = make_flight(**route)
+    _, headers = make_user(balance="5000.00")
+    kept = book(headers, first, passengers=2).get_json()
+    assert client.post(f"/api/bookings/{kept['id']}/confirm", headers=headers).status_code == 200
+    cancelled = book(headers, first).get_json()
+    assert client.delete(f"/api/bookings/{cancelled['id']}", headers=headers).status_code == 200
+    assert client.post("/api/reviews/", headers=headers, json={
+        "flight_id": first, "rating": 5, "comment": "Ünïcode \"quotes\" and\nnewlines"}).status_code == 201
+    with app.app_context():
+        SeatInventory.query.filter_by(flight_id=bare).delete()
+        db.session.commit()
+
+
+LOADERS = {
+    FlightResponseSchema: lambda: Flight.query.order_by(Flight.id).all(),
+    FlightDetailSchema: lambda: flight_details_query().order_by(Flight.id).all(),
+    BookingSchema: lambda: Booking.query.options(selectinload(Booking.passengers)).order_by(Booking.id).all(),
+    AirplaneResponseSchema: lambda: Airplane.query.order_by(Airplane.id).all(),
+    ReviewSchema: lambda: Review.query.order_by(Review.id).all(),
+    TransactionSchema: lambda: WalletTransaction.query.order_by(WalletTransaction.id).all(),
+    WalletSchema: lambda: Wallet.query.order_by(Wallet.id).all(),
+}
+
+
+@pytest.mark.parametrize("schema_cls", LOADERS, ids=lambda schema_cls: schema_cls.__name__)
+def test_response_dumpers_match_marshmallow(app, dataset, schema_cls):
+    with app.app_context():
+        assert_identical(app, schema_cls, LOADERS[schema_cls]())
+
+
+class _Thing:
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+class _EdgeSchema(Schema):
+    renamed = fields.Int(data_key="renamedKey")
+    aliased = fields.Str(attribute="source")
+    computed = fields.Method("compute")  # not inlined: falls back to the field's serialize()
+    nothing = fields.DateTime(allow_none=True)
+    raw_bytes = fields.Str()
+
+    def compute(self, obj):
+        return obj.renamed * 2
+
+
+class _HookedSchema(Schema):
+    value = fields.Int()
+
+    @post_dump
+    def wrap(self, data, **kwargs):
+        return {"wrapped": data}
+
+
+def test_edge_cases_match_marshmallow(app):
+    things = [_Thing(renamed=1, source="a", nothing=None, raw_bytes=b"bytes"),
+              _Thing(renamed=2, source=None, nothing=None, raw_bytes=7)]
+    assert_identical(app, _EdgeSchema, things)
+    assert_identical(app, _HookedSchema, [_Thing(value=3)])
+
+
+def test_schema_instances_are_shared():
+    assert schema(BookingSchema) is schema(BookingSchema)
+    assert schema(BookingSchema, many=True) is not schema(BookingSchema)
@@ -0,0 +1,23 @@
+# backend/tests/test_versioned_cache.py
+
+import time
+from types import SimpleNamespace
+
+from extensions import cache
+from utils import versioned_cache
+from utils.versioned_cache import VersionStore, cached
+
+
+def test_shared_version_store_invalidates_local_entries(app, monkeypatch):
+    shared = VersionStore()
+    shared.init_app(SimpleNamespace(config={"CACHE_VERSION_BACKEND": "local-redis", "CACHE_KEY_PREFIX": "test:"}))
+    monkeypatch.setattr(versioned_cache, "cache_versions", shared)
+
+    with app.app_context():
+        assert cached("airports", "1", lambda: "old") == "old"
+        assert cached("airports", "1", lambda: "unused") == "old"
+        assert cache.get("airports:version") is None  # the version is not in the local cache
+
+        # Another worker's write: bumps the shared version, never touches this process's cache
+        shared.set("airports:version", time.time_ns())
+        assert cached("airports", "1", lambda: "new") == "new"
@@ -0,0 +1,87 @@
+# backend/tests/test_wallet.py
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from extensions import db
+from models import Wallet, Booking
+from models.transactions import WalletTransaction
+
+
+def ledger(app, user_id):
+    """user_id's ledger entries, oldest first, and the wallet's balance snapshot."""
+    with app.app_context():
+        wallet = Wallet.query.filter_by(user_id=user_id).one()
+        entries = WalletTransaction.query.filter_by(wallet_id=wallet.id).order_by(WalletTransaction.id).all()
+        return [(entry.type.value, entry.amount, entry.balance_after) for entry in entries], wallet.balance
+
+
+def assert_chained(entries, opening, balance):
+    """Every balance_after is the previous one plus (or minus, for payments) the amount."""
+    running = opening
+    for transaction_type, amount, balance_after in entries:
+        running += -amount if transaction_type == "PAYMENT" else amount
+        assert balance_after == running
+    assert running == balance
+
+
+def test_concurrent_bookings_never_overdraw(app, make_user, make_flight, book):
+    flight_id = make_flight(economy=100)
+    user_id, headers = make_user(balance="250.00")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(executor.map(lambda _: book(headers, flight_id), range(20)))
+    statuses = Counter(response.status_code for response in responses)
+    assert set(statuses) == {201, 402} and 1 <= statuses[201] <= 2
+
+    paid = sum(Decimal(response.get_json()["total_price"]) for response in responses if response.status_code == 201)
+    entries, balance = ledger(app, user_id)
+    assert balance == Decimal("250.00") - paid >= 0
+    assert [entry[0] for entry in entries] == ["PAYMENT"] * statuses[201]
+    assert_chained(entries, Decimal("250.00"), balance)
+
+
+def test_cancel_refunds_the_payment(app, client, make_user, make_flight, book):
+    user_id, headers = make_user(balance="1000.00")
+    booking = book(headers, make_flight())
+    assert booking.status_code == 201
+
+    assert client.delete(f"/api/bookings/{booking.get_json()['id']}", headers=headers).status_code == 200
+    entries, balance = ledger(app, user_id)
+    assert balance == Decimal("1000.00")
+    assert [entry[0] for entry in entries] == ["PAYMENT", "REFUND"]
+    assert entries[0][1] == entries[1][1] == Decimal(booking.get_json()["total_price"])
+    assert_chained(entries, Decimal("1000.00"), balance)
+
+
+def test_transactions_cursor_paging(client, make_user):
+    _, headers = make_user()
+    for amount in range(1, 6):
+        assert client.post("/api/wallets/add", headers=headers, json={"amount": f"{amount}.00"}).status_code == 200
+
+    amounts, cursor = [], None
+    while True:
+        page = client.get("/api/wallets/transactions", headers=headers,
+                          query_string={"limit": 2, **({"cursor": cursor} if cursor else {})}).get_json()
+        assert len(page["items"]) <= 2
+        amounts += [item["amount"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert amounts == ["5.00", "4.00", "3.00", "2.00", "1.00"]  # newest first, each entry once
+
+
+def test_booking_without_wallet_is_a_clear_error(app, client, make_user, make_flight, book):
+    user_id, headers = make_user()
+
+    wallet = client.get("/api/wallets/me", headers=headers)
+    assert wallet.status_code == 200 and wallet.get_json()["balance"] == "0.00"
+
+    response = book(headers, make_flight())
+    assert response.status_code == 402
+    assert "No wallet" in response.get_json()["message"]
+    with app.app_context():
+        # Neither the GET nor the failed booking left rows behind
+        assert db.session.query(Wallet).filter_by(user_id=user_id).count() == 0
+        assert db.session.query(Booking).filter_by(user_id=user_id).count() == 0
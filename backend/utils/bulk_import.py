@@ -0,0 +1,136 @@
+# backend/utils/bulk_import.py
+# Shared plumbing for chunked CSV/JSONL imports.
+#
+# An import is a stream of (row_number, dict) pairs cut into chunks. For each chunk a
+# `validate` callback returns the rows that can be written plus per-row errors, and a
+# `write` callback persists the valid rows in one transaction. A chunk the database
+# rejects is rolled back and reported row by row; the rest of the import carries on.
+
+import csv
+import io
+import json
+import logging
+import os
+import time
+
+from flask import request
+from sqlalchemy.exc import SQLAlchemyError
+
+from extensions import db
+from exceptions.custom_exceptions import BadRequestError
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("csv", "jsonl")
+
+
+def format_from_path(path):
+    extension = os.path.splitext(path)[1].lstrip(".").lower()
+    return "jsonl" if extension == "ndjson" else extension
+
+
+def rows_from_request():
+    """
+    Rows of the current request: a multipart 'file' upload or the raw body.
+    The format comes from ?format= or else the content type (CSV or JSONL).
+    """
+    upload = request.files.get("file")
+    stream = upload.stream if upload else request.stream
+    content_type = (upload.mimetype if upload else request.mimetype) or ""
+    fmt = request.args.get("format") or ("csv" if "csv" in content_type else "jsonl")
+    return read_rows(stream, fmt)
+
+
+def read_rows(stream, fmt):
+    """Yield (row_number, dict) from a binary or text stream in CSV or JSONL format."""
+    if fmt not in FORMATS:
+        raise BadRequestError(f"Unsupported import format: {fmt}. Use one of: {', '.join(FORMATS)}.")
+    if not isinstance(stream, io.TextIOBase):
+        stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+
+    if fmt == "csv":
+        # Data rows start on line 2, after the header
+        for row_number, row in enumerate(csv.DictReader(stream), start=2):
+            yield row_number, row
+        return
+
+    for row_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row_number, {"__error__": f"Invalid JSON: {e.msg}"}
+            continue
+        yield row_number, row if isinstance(row, dict) else {"__error__": "Each line must be a JSON object."}
+
+
+def split_row_errors(chunk):
+    """Separate rows that failed to parse from the rest: returns (rows, errors)."""
+    rows, errors = [], []
+    for row_number, row in chunk:
+        if "__error__" in row:
+            errors.append((row_number, [row["__error__"]]))
+        else:
+            rows.append((row_number, row))
+    return rows, errors
+
+
+def run_import(rows, validate, write, counters, chunk_size=1000, max_reported_errors=1000, label="rows"):
+    """
+    Drive a chunked import.
+
+    ``validate(chunk)`` returns ``(valid, errors)`` where every valid item starts with
+    its row number and ``errors`` is a list of ``(row_number, [messages])``.
+    ``write(valid)`` persists and commits the chunk and returns increments for
+    ``counters`` (e.g. ``{"inserted": 10}``).
+
+    Returns a report with ``total_rows``, the counters, ``failed``, per-row ``errors``
+    (capped at ``max_reported_errors``), ``elapsed_seconds`` and ``rows_per_second``.
+    """
+    if chunk_size < 1:
+        raise BadRequestError("chunk_size must be positive.")
+
+    started = time.perf_counter()
+    report = {"total_rows": 0, **{name: 0 for name in counters},
+              "failed": 0, "errors": [], "errors_truncated": False}
+
+    def record_errors(row_errors):
+        report["failed"] += len(row_errors)
+        for row_number, messages in row_errors:
+            if len(report["errors"]) < max_reported_errors:
+                report["errors"].append({"row": row_number, "errors": messages})
+            else:
+                report["errors_truncated"] = True
+
+    def flush(chunk):
+        valid, row_errors = validate(chunk)
+        record_errors(row_errors)
+        if not valid:
+            return
+        try:
+            for name, count in write(valid).items():
+                report[name] += count
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.exception("Bulk write of %d %s failed.", len(valid), label)
+            message = f"Chunk rejected by the database: {e.__class__.__name__}"
+            record_errors([(item[0], [message]) for item in valid])
+
+    chunk = []
+    for row in rows:
+        report["total_rows"] += 1
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            flush(chunk)
+            chunk = []
+    if chunk:
+        flush(chunk)
+
+    elapsed = time.perf_counter() - started
+    report["elapsed_seconds"] = round(elapsed, 3)
+    report["rows_per_second"] = round(report["total_rows"] / elapsed, 1) if elapsed else None
+    logger.info("Import of %s finished: %d rows, %d failed in %.2fs.",
+                label, report["total_rows"], report["failed"], elapsed)
+    return report
@@ -0,0 +1,134 @@
+# backend/utils/cache_backends.py
+# Extra Flask-Caching backends.
+#
+# LocalRedisCache is the regular Redis backend wired to an in-process stand-in for a
+# Redis server, so the Redis code path (key prefixes, pickling, TTLs) can run in tests
+# and single-node dev without a server. Enable it with:
+#     CACHE_TYPE = "utils.cache_backends.LocalRedisCache"
+
+import fnmatch
+import threading
+import time
+
+from flask_caching.backends.rediscache import RedisCache
+
+
+class LocalRedis:
+    """The subset of the redis-py client API used by cachelib's RedisCache."""
+
+    def __init__(self):
+        self._data = {}
+        self._expires = {}
+        self._lock = threading.RLock()
+
+    def _alive(self, name):
+        expires = self._expires.get(name)
+        if expires is not None and expires <= time.monotonic():
+            self._data.pop(name, None)
+            self._expires.pop(name, None)
+        return name in self._data
+
+    def get(self, name):
+        with self._lock:
+            return self._data.get(name) if self._alive(name) else None
+
+    def mget(self, names):
+        with self._lock:
+            return [self.get(name) for name in names]
+
+    def set(self, name, value, ex=None, px=None, nx=False):
+        with self._lock:
+            if nx and self._alive(name):
+                return None
+            self._data[name] = value
+            self._expires.pop(name, None)
+            if ex is not None or px is not None:
+                self._expires[name] = _now() + (ex if ex is not None else px / 1000)
+            return True
+
+    def setex(self, name, time, value):
+        with self._lock:
+            self.set(name, value)
+            self.expire(name, time)
+            return True
+
+    def setnx(self, name, value):
+        with self._lock:
+            if self._alive(name):
+                return False
+            return self.set(name, value)
+
+    def expire(self, name, time):
+        with self._lock:
+            if not self._alive(name):
+                return False
+            self._expires[name] = _now() + int(time)
+            return True
+
+    def delete(self, *names):
+        with self._lock:
+            removed = 0
+            for name in names:
+                if self._alive(name):
+                    removed += 1
+                self._data.pop(name, None)
+                self._expires.pop(name, None)
+            return removed
+
+    def exists(self, *names):
+        with self._lock:
+            return sum(1 for name in names if self._alive(name))
+
+    def keys(self, pattern="*"):
+        with self._lock:
+            return [name for name in list(self._data) if self._alive(name) and fnmatch.fnmatchcase(name, pattern)]
+
+    def incr(self, name, amount=1):
+        with self._lock:
+            value = int(self.get(name) or 0) + amount
+            self._data[name] = str(value).encode()
+            return value
+
+    def flushdb(self):
+        with self._lock:
+            self._data.clear()
+            self._expires.clear()
+            return True
+
+    def pipeline(self, transaction=True):
+        return _LocalPipeline(self)
+
+
+class _LocalPipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        def queue(*args, **kwargs):
+            self._calls.append((method, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        with self._client._lock:
+            return [method(*args, **kwargs) for method, args, kwargs in self._calls]
+
+
+def _now():
+    return time.monotonic()
+
+
+class LocalRedisCache(RedisCache):
+    """Flask-Caching RedisCache backed by a process-local LocalRedis client."""
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        kwargs.update(dict(
+            host=LocalRedis(),
+            key_prefix=config.get("CACHE_KEY_PREFIX"),
+            default_timeout=config.get("CACHE_DEFAULT_TIMEOUT", 300),
+        ))
+        return cls(*args, **kwargs)
@@ -0,0 +1,86 @@
+# backend/utils/conditional.py
+# Conditional GET (ETag / Last-Modified) for read endpoints over slowly changing tables.
+#
+# A validator is computed with one cheap aggregate query (no rows are loaded): for a whole
+# table, max(updated_at) plus count(*) (the count catches deletes, which leave no
+# timestamp behind); for a single row, its updated_at. The ETag hashes the validator with
+# the request path and query string, so every page or filter gets its own tag. When the
+# client's If-None-Match matches, the view is never called and a bodiless 304 is returned.
+#
+# If-Modified-Since is only honoured for single rows: a delete does not move a table's
+# max(updated_at), so for lists only the ETag is reliable.
+
+import hashlib
+from functools import wraps
+
+from flask import request, make_response, Response
+from sqlalchemy import func
+
+from extensions import db
+from utils.db_routing import read_only
+
+
+class Validator:
+    __slots__ = ("version", "last_modified", "use_last_modified")
+
+    def __init__(self, version, last_modified, use_last_modified=False):
+        self.version = version
+        self.last_modified = last_modified
+        self.use_last_modified = use_last_modified
+
+
+@read_only
+def table_validator(model):
+    last_modified, count = db.session.query(func.max(model.updated_at), func.count()).select_from(model).one()
+    return Validator(f"{model.__tablename__}:{last_modified}:{count}", last_modified)
+
+
+@read_only
+def row_validator(model, row_id):
+    """None if the row does not exist (the view then produces its usual 404)."""
+    last_modified = db.session.query(model.updated_at).filter(model.id == row_id).scalar()
+    if last_modified is None:
+        return None
+    return Validator(f"{model.__tablename__}:{row_id}:{last_modified}", last_modified, use_last_modified=True)
+
+
+def _not_modified(etag, last_modified):
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if last_modified is not None and request.if_modified_since is not None:
+        return last_modified.replace(microsecond=0) <= request.if_modified_since.replace(tzinfo=None)
+    return False
+
+
+def conditional(get_validator):
+    """
+    Answer GETs with 304 when the client's copy is current.
+    ``get_validator(**view_kwargs)`` returns a Validator, or None to skip the check.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            validator = get_validator(**kwargs)
+            if validator is None:
+                return view(*args, **kwargs)
+
+            # Accept picks JSON vs NDJSON for streamable lists, so it is part of the tag
+            etag = hashlib.sha1(
+                f"{validator.version}|{request.full_path}|{request.headers.get('Accept', '')}".encode()
+            ).hexdigest()
+            last_modified = validator.last_modified if validator.use_last_modified else None
+            if _not_modified(etag, last_modified):
+                response = Response(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag, weak=True)
+            if validator.last_modified is not None:
+                response.last_modified = validator.last_modified
+            response.headers["Cache-Control"] = "no-cache"  # cache, but revalidate every time
+            response.vary.add("Accept")
+            return response
+        return wrapper
+    return decorator
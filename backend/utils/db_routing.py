@@ -0,0 +1,79 @@
+# backend/utils/db_routing.py
+# Read-replica routing for the Flask-SQLAlchemy session.
+#
+# Code running inside `read_replica()` (or a function decorated with `@read_only`) has
+# its queries sent to the "replica" bind from SQLALCHEMY_BINDS. Everything else goes to
+# the primary, and so does every read once the session has pending changes or has
+# written in the current transaction (flush or DML), so a session always sees its own
+# writes. Without a replica bind configured, everything goes to the primary.
+#
+# Replicas lag: only use this for reads that tolerate slightly stale data, never for
+# reads that a write in the same request depends on. Loaders that fill a shared cache or
+# index run inside `read_primary()`: a write bumps the cache version, and a reload from a
+# replica that has not caught up would store the old data under the new version.
+
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from flask_sqlalchemy.session import Session
+
+REPLICA_BIND_KEY = "replica"
+
+_use_replica = ContextVar("use_read_replica", default=False)
+_force_primary = ContextVar("force_primary", default=False)
+
+
+class RoutingSession(Session):
+    _pinned_to_primary = False  # wrote in the current transaction
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if self._flushing or (clause is not None and getattr(clause, "is_dml", False)):
+            self._pinned_to_primary = True
+        elif (bind is None and _use_replica.get() and not _force_primary.get() and not self._pinned_to_primary
+                and not (self.new or self.deleted or self.dirty)):
+            replica = self._db.engines.get(REPLICA_BIND_KEY)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+
+    def commit(self):
+        super().commit()
+        self._pinned_to_primary = False
+
+    def rollback(self):
+        super().rollback()
+        self._pinned_to_primary = False
+
+    def close(self):
+        super().close()
+        self._pinned_to_primary = False
+
+
+@contextmanager
+def read_replica():
+    """Route reads in this block to the replica bind, if one is configured."""
+    token = _use_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+@contextmanager
+def read_primary():
+    """Route reads in this block to the primary, including @read_only functions called from it."""
+    token = _force_primary.set(True)
+    try:
+        yield
+    finally:
+        _force_primary.reset(token)
+
+
+def read_only(fn):
+    """Decorator form of read_replica() for read-only service functions."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with read_replica():
+            return fn(*args, **kwargs)
+    return wrapper
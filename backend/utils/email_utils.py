@@ -0,0 +1,13 @@
+# backend/utils/email_utils.py
+
+from flask import render_template
+from flask_mail import Message
+
+from extensions import mail
+
+
+def send_email(subject, recipients, template, **context):
+    """Render templates/emails/<template>.html and send it with Flask-Mail (blocking SMTP)."""
+    message = Message(subject=subject, recipients=list(recipients))
+    message.html = render_template(f"emails/{template}.html", **context)
+    mail.send(message)
@@ -0,0 +1,349 @@
+# backend/utils/idempotency.py
+# Idempotency-Key support for POST endpoints that create things.
+#
+#     @booking_bp.route("/", methods=["POST"])
+#     @jwt_required()
+#     @idempotent
+#     def create_booking(): ...
+#
+# The first request with a given key (per user and endpoint) runs normally and its
+# response (status, body, content type) is stored for IDEMPOTENCY_TTL_SECONDS. Retries
+# with the same key get the stored response back, marked "Idempotent-Replayed: true",
+# without running the view. A duplicate arriving while the first is still running waits
+# for it (up to IDEMPOTENCY_WAIT_SECONDS) instead of racing it. Reusing a key for a
+# different request body is rejected with 422.
+#
+# Only responses the view returns with a status below 500 are stored; exceptions and 5xx
+# release the key so the client can retry for real. Stores: "memory" (per process) or
+# "redis" (shared; "local-redis" runs the same code against an in-process stand-in).
+#
+# Every claim carries a random owner token. While the view runs, the owner keeps extending
+# its IDEMPOTENCY_LOCK_SECONDS lock, so a slow request is not mistaken for a dead one and
+# run a second time. complete/extend/release only act while the key still holds the
+# owner's token, so an owner whose lock did lapse cannot overwrite the next owner's entry.
+
+import base64
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from functools import wraps
+
+from flask import request, jsonify, make_response, Response
+from flask_jwt_extended import get_jwt_identity
+
+logger = logging.getLogger(__name__)
+
+HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+
+PENDING = "pending"
+DONE = "done"
+
+
+class MemoryIdempotencyStore:
+    """Per-process store; waiters are woken as soon as the owning request finishes."""
+
+    def __init__(self):
+        self._entries = {}  # key -> (record, expires_at)
+        self._changed = threading.Condition()
+        self._last_purge = time.monotonic()
+
+    def _get(self, key, now):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= now:
+            del self._entries[key]
+            return None
+        return entry[0]
+
+    def _purge(self, now):
+        if now - self._last_purge < 60:
+            return
+        self._last_purge = now
+        for key in [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+
+    def claim(self, key, record, lock_seconds):
+        with self._changed:
+            now = time.monotonic()
+            self._purge(now)
+            existing = self._get(key, now)
+            if existing is not None:
+                return existing
+            self._entries[key] = (record, now + lock_seconds)
+            return None
+
+    def _owned(self, key, token, now):
+        existing = self._get(key, now)
+        return existing is None or existing.get("token") == token
+
+    def complete(self, key, token, record, ttl_seconds):
+        with self._changed:
+            now = time.monotonic()
+            if not self._owned(key, token, now):
+                return False
+            self._entries[key] = (record, now + ttl_seconds)
+            self._changed.notify_all()
+            return True
+
+    def extend(self, key, token, lock_seconds):
+        with self._changed:
+            now = time.monotonic()
+            existing = self._get(key, now)
+            if existing is None or existing.get("token") != token:
+                return False
+            self._entries[key] = (existing, now + lock_seconds)
+            return True
+
+    def release(self, key, token):
+        with self._changed:
+            existing = self._get(key, time.monotonic())
+            if existing is not None and existing.get("token") == token:
+                del self._entries[key]
+            self._changed.notify_all()
+
+    def wait(self, key, timeout):
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                now = time.monotonic()
+                existing = self._get(key, now)
+                if existing is None or existing["state"] != PENDING or now >= deadline:
+                    return existing
+                self._changed.wait(deadline - now)
+
+
+# Owner-checked writes, atomic on the Redis server: act only while the key is missing
+# (complete) or still holds the caller's token.
+_COMPLETE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current and cjson.decode(current)['token'] ~= ARGV[1] then return 0 end
+redis.call('SET', KEYS[1], ARGV[2], 'PX', ARGV[3])
+return 1
+"""
+_EXTEND_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current or cjson.decode(current)['token'] ~= ARGV[1] then return 0 end
+return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+"""
+_RELEASE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current or cjson.decode(current)['token'] ~= ARGV[1] then return 0 end
+return redis.call('DEL', KEYS[1])
+"""
+
+
+class RedisIdempotencyStore:
+    """
+    Shared store on any client with the redis-py get/set(nx, px)/delete API. Owner checks
+    run as Lua scripts on a real server; a client without scripting (the in-process
+    LocalRedis) lives in this process, so a process lock makes them atomic there.
+    """
+
+    poll_interval = 0.05  # seconds between checks while waiting for an in-flight request
+
+    def __init__(self, client, prefix="idem:"):
+        self.client = client
+        self.prefix = prefix
+        self._scripts = None
+        self._lock = threading.Lock()
+        if hasattr(client, "register_script"):
+            self._scripts = {name: client.register_script(source) for name, source in (
+                ("complete", _COMPLETE_SCRIPT), ("extend", _EXTEND_SCRIPT), ("release", _RELEASE_SCRIPT))}
+
+    def _load(self, key):
+        raw = self.client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def claim(self, key, record, lock_seconds):
+        while True:
+            if self.client.set(self.prefix + key, json.dumps(record), nx=True, px=int(lock_seconds * 1000)):
+                return None
+            existing = self._load(key)
+            if existing is not None:
+                return existing
+            # expired between SET NX and GET: try again
+
+    def complete(self, key, token, record, ttl_seconds):
+        value, px = json.dumps(record), int(ttl_seconds * 1000)
+        if self._scripts:
+            return bool(self._scripts["complete"](keys=[self.prefix + key], args=[token, value, px]))
+        with self._lock:
+            existing = self._load(key)
+            if existing is not None and existing.get("token") != token:
+                return False
+            self.client.set(self.prefix + key, value, px=px)
+            return True
+
+    def extend(self, key, token, lock_seconds):
+        px = int(lock_seconds * 1000)
+        if self._scripts:
+            return bool(self._scripts["extend"](keys=[self.prefix + key], args=[token, px]))
+        with self._lock:
+            existing = self._load(key)
+            if existing is None or existing.get("token") != token:
+                return False
+            self.client.set(self.prefix + key, json.dumps(existing), px=px)
+            return True
+
+    def release(self, key, token):
+        if self._scripts:
+            self._scripts["release"](keys=[self.prefix + key], args=[token])
+            return
+        with self._lock:
+            existing = self._load(key)
+            if existing is not None and existing.get("token") == token:
+                self.client.delete(self.prefix + key)
+
+    def wait(self, key, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            existing = self._load(key)
+            if existing is None or existing["state"] != PENDING or time.monotonic() >= deadline:
+                return existing
+            time.sleep(self.poll_interval)
+
+
+def _fingerprint():
+    digest = hashlib.sha256()
+    for part in (request.method, request.path, request.query_string, request.get_data(cache=True)):
+        digest.update(part if isinstance(part, bytes) else part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _error(message, status):
+    response = jsonify({"status": "error", "message": message})
+    response.status_code = status
+    return response
+
+
+def _replay(record):
+    stored = record["response"]
+    response = Response(base64.b64decode(stored["body"]), status=stored["status"],
+                        content_type=stored["content_type"])
+    if stored.get("location"):
+        response.headers["Location"] = stored["location"]
+    response.headers["Idempotent-Replayed"] = "true"
+    return response
+
+
+class Idempotency:
+
+    def __init__(self):
+        self.store = MemoryIdempotencyStore()
+        self.ttl = 86400
+        self.lock_seconds = 30
+        self.wait_seconds = 10
+
+    def init_app(self, app):
+        config = app.config
+        self.ttl = config.get("IDEMPOTENCY_TTL_SECONDS", 86400)
+        self.lock_seconds = config.get("IDEMPOTENCY_LOCK_SECONDS", 30)
+        self.wait_seconds = config.get("IDEMPOTENCY_WAIT_SECONDS", 10)
+
+        backend = config.get("IDEMPOTENCY_BACKEND", "memory")
+        if backend == "memory":
+            self.store = MemoryIdempotencyStore()
+        elif backend == "redis":
+            import redis
+            self.store = RedisIdempotencyStore(
+                redis.Redis.from_url(config.get("IDEMPOTENCY_REDIS_URL")), config.get("CACHE_KEY_PREFIX", "") + "idem:")
+        elif backend == "local-redis":
+            from utils.cache_backends import LocalRedis
+            self.store = RedisIdempotencyStore(LocalRedis())
+        else:
+            raise ValueError(f"Unknown IDEMPOTENCY_BACKEND {backend!r}")
+
+    def _keep_claimed(self, key, token):
+        """Extend our lock every third of IDEMPOTENCY_LOCK_SECONDS until the returned event is set."""
+        stop = threading.Event()
+
+        def extend():
+            while not stop.wait(self.lock_seconds / 3):
+                try:
+                    if not self.store.extend(key, token, self.lock_seconds):
+                        return
+                except Exception:
+                    logger.exception("Failed to extend the idempotency lock on %s.", key)
+
+        threading.Thread(target=extend, name="idempotency-heartbeat", daemon=True).start()
+        return stop
+
+    def handle(self, view, args, kwargs):
+        client_key = request.headers.get(HEADER)
+        if not client_key:
+            return view(*args, **kwargs)
+        if len(client_key) > MAX_KEY_LENGTH:
+            return _error(f"{HEADER} must be at most {MAX_KEY_LENGTH} characters.", 400)
+
+        key = f"{request.method}:{request.path}:{get_jwt_identity()}:{client_key}"
+        fingerprint = _fingerprint()
+        token = uuid.uuid4().hex
+        pending = {"state": PENDING, "fingerprint": fingerprint, "token": token}
+
+        deadline = time.monotonic() + self.wait_seconds
+        while True:
+            existing = self.store.claim(key, pending, self.lock_seconds)
+            if existing is None:
+                break  # ours to run
+            if existing["fingerprint"] != fingerprint:
+                return _error(f"{HEADER} was already used for a different request.", 422)
+            if existing["state"] == DONE:
+                return _replay(existing)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                response = _error("A request with this Idempotency-Key is still in progress.", 409)
+                response.headers["Retry-After"] = "1"
+                return response
+            existing = self.store.wait(key, remaining)
+            if existing is not None and existing["state"] == DONE:
+                return _replay(existing) if existing["fingerprint"] == fingerprint else \
+                    _error(f"{HEADER} was already used for a different request.", 422)
+            # released (the first attempt failed) or still pending: try to claim again
+
+        heartbeat = self._keep_claimed(key, token)
+        try:
+            response = make_response(view(*args, **kwargs))
+        except BaseException:
+            self.store.release(key, token)
+            raise
+        finally:
+            heartbeat.set()
+
+        if response.status_code >= 500 or response.is_streamed:
+            self.store.release(key, token)
+            return response
+        try:
+            stored = self.store.complete(key, token, {
+                "state": DONE,
+                "fingerprint": fingerprint,
+                "token": token,
+                "response": {
+                    "status": response.status_code,
+                    "body": base64.b64encode(response.get_data()).decode("ascii"),
+                    "content_type": response.content_type,
+                    "location": response.headers.get("Location"),
+                },
+            }, self.ttl)
+            if not stored:
+                logger.warning("Lost the claim on %s while the request ran; its response was not stored.", key)
+        except Exception:
+            # The work is committed; failing to remember it must not fail the request
+            logger.exception("Failed to store idempotent response for %s.", key)
+        return response
+
+
+idempotency = Idempotency()
+
+
+def idempotent(view):
+    """Honour the Idempotency-Key header on this view. Place below @jwt_required()."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        return idempotency.handle(view, args, kwargs)
+    return wrapper
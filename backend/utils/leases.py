@@ -0,0 +1,60 @@
+# backend/utils/leases.py
+# Database leases for jobs that must run on one node at a time.
+#
+# A lease is a row in job_leases. Taking it is a single conditional UPDATE (free, expired,
+# or already ours) or, the first time, an INSERT guarded by the primary key, so two nodes
+# can never both hold it. The holder renews it on every run; if that node dies the lease
+# simply expires and another node takes over. Expiry uses each node's clock, so keep the
+# lease well above the expected clock skew.
+
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update, or_
+from sqlalchemy.exc import IntegrityError
+
+from extensions import db
+from models.job_lease import JobLease
+
+# Identifies this process as a lease holder
+HOLDER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def acquire_lease(name, ttl_seconds, holder=HOLDER_ID):
+    """Take or renew the lease ``name`` for ``ttl_seconds``. Commits; returns True if we hold it."""
+    now = _utcnow()
+    expires_at = now + timedelta(seconds=ttl_seconds)
+    taken = db.session.execute(
+        update(JobLease)
+        .where(JobLease.name == name, or_(JobLease.holder == holder, JobLease.expires_at <= now))
+        .values(holder=holder, expires_at=expires_at)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if taken:
+        db.session.commit()
+        return True
+
+    try:
+        db.session.add(JobLease(name=name, holder=holder, expires_at=expires_at))
+        db.session.commit()
+        return True
+    except IntegrityError:
+        db.session.rollback()  # someone else holds a live lease
+        return False
+
+
+def release_lease(name, holder=HOLDER_ID):
+    """Give the lease up early, e.g. on shutdown. Commits."""
+    db.session.execute(
+        update(JobLease)
+        .where(JobLease.name == name, JobLease.holder == holder)
+        .values(expires_at=_utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
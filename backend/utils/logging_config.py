@@ -1,69 +1,178 @@
 # backend/utils/logging_config.py
-# Sets up logging to both file and console, rotating logs to avoid unlimited file growth
-
+# Sets up non-blocking logging: request threads only put records on an in-memory queue,
+# and a background QueueListener formats them (JSON or text) and writes them to the
+# console and a rotating log file.
+#
+# - If the queue is full, records are dropped (and counted) instead of blocking the caller.
+# - Noisy loggers can be sampled: LOG_SAMPLING="services.flight_service=0.1" keeps ~10%
+#   of their DEBUG/INFO records. Warnings and errors are never sampled.
+# - Rotation is by size (LOG_MAX_BYTES) or by time (LOG_ROTATE_WHEN), see config.py.
+
+import atexit
+import copy
+import json
 import logging
-from logging.handlers import RotatingFileHandler
 import os
-
-def init_logging(app):
-    log_dir = os.path.join(os.getcwd(), 'logs')
+import queue
+import random
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+
+# Attributes every LogRecord has; anything else was passed via `extra=` and is emitted as a field
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener = None
+_queue_handler = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line."""
+
+    def format(self, record):
+        document = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                document[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            document["exc_info"] = record.exc_text
+        if record.stack_info:
+            document["stack_info"] = record.stack_info
+        return json.dumps(document, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of DEBUG/INFO records from the configured loggers (and their children)."""
+
+    def __init__(self, rates):
+        super().__init__()
+        # Longest prefix first, so "services.flight_service" wins over "services"
+        self.rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def filter(self, record):
+        if record.levelno > logging.INFO or not self.rates:
+            return True
+        for prefix, rate in self.rates:
+            if record.name == prefix or record.name.startswith(prefix + "."):
+                return random.random() < rate
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that drops records when the queue is full instead of blocking or erroring."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._exception_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        # Only resolve the message and traceback here; formatting happens on the listener thread
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self):
+        # The queue may be full at shutdown; wait for room rather than fail to stop
+        self.queue.put(self._sentinel)
+
+
+def parse_sampling(value):
+    """'a.b=0.1,c=0.5' -> {'a.b': 0.1, 'c': 0.5}"""
+    rates = {}
+    for item in filter(None, (part.strip() for part in (value or "").split(","))):
+        name, _, rate = item.partition("=")
+        rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+    return rates
+
+
+def _file_handler(config):
+    log_dir = config.get("LOG_DIR") or os.path.join(os.getcwd(), 'logs')
     os.makedirs(log_dir, exist_ok=True)
     log_file = os.path.join(log_dir, 'app.log')
 
-    formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
+    backup_count = config.get("LOG_BACKUP_COUNT", 10)
+    if config.get("LOG_ROTATION", "size") == "time":
+        return TimedRotatingFileHandler(
+            log_file, when=config.get("LOG_ROTATE_WHEN", "midnight"), backupCount=backup_count,
+            encoding="utf-8", utc=True
+        )
+    return RotatingFileHandler(
+        log_file, maxBytes=config.get("LOG_MAX_BYTES", 50 * 1024 * 1024), backupCount=backup_count,
+        encoding="utf-8"
     )
 
-    file_handler = RotatingFileHandler(log_file, maxBytes=10240, backupCount=5)
-    file_handler.setFormatter(formatter)
-    file_handler.setLevel(logging.INFO)  # TODO: Set to DEBUG if needed
-
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
-    stream_handler.setLevel(logging.INFO)
-
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(stream_handler)
-
-    app.logger = root_logger
-
-    # TODO: Add email alerts for critical errors (in production only)
-
 
-'''
-# backend/utils/logging_config.py
+def stop_logging():
+    """Flush queued records and stop the listener (also registered with atexit)."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
 
-import logging
-from logging.handlers import RotatingFileHandler
-import os
 
 def init_logging(app):
-    log_dir = os.path.join(os.getcwd(), 'logs')
-    os.makedirs(log_dir, exist_ok=True)
-    log_file = os.path.join(log_dir, 'app.log')
+    global _listener, _queue_handler
+    config = app.config
+    level = logging.getLevelName(config.get("LOG_LEVEL", "INFO").upper())
+
+    if config.get("LOG_FORMAT", "json") == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s')
+
+    handlers = [logging.StreamHandler()]
+    if config.get("LOG_TO_FILE", True):
+        handlers.append(_file_handler(config))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        handler.setLevel(level)
+
+    # Re-initialising (e.g. several apps in one process) replaces the previous pipeline
+    stop_logging()
+
+    queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=config.get("LOG_QUEUE_SIZE", 10000)))
+    queue_handler.addFilter(SamplingFilter(parse_sampling(config.get("LOG_SAMPLING"))))
+    listener = _Listener(queue_handler.queue, *handlers, respect_handler_level=True)
+    listener.start()
 
-    formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
-    )
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(queue_handler)
+    _listener, _queue_handler = listener, queue_handler
 
-    file_handler = RotatingFileHandler(log_file, maxBytes=10240, backupCount=5)
-    file_handler.setFormatter(formatter)
-    file_handler.setLevel(logging.INFO)  # Adjust to DEBUG if needed
+    app.logger = root_logger
 
-    # Optional: Stream handler for console output during dev
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
-    stream_handler.setLevel(logging.INFO)
+    # TODO: Add email alerts for critical errors (in production only)
 
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(stream_handler)
 
-    app.logger = root_logger  # Link Flask's logger to this one
+def dropped_log_records():
+    return _queue_handler.dropped if _queue_handler is not None else 0
 
-    # TODO: Add email alerts for critical errors (in production only)
 
-'''
\ No newline at end of file
+atexit.register(stop_logging)
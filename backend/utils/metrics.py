@@ -0,0 +1,208 @@
+# backend/utils/metrics.py
+# Per-request instrumentation: latency histograms, SQL statement count/time, response
+# size and status codes, labelled by blueprint, endpoint (URL rule) and method.
+#
+# SQL numbers come from the per-request QueryCounter in utils.query_counter (engine
+# cursor events). Recording a request is a handful of dict updates under one lock, so
+# it is cheap enough to leave on in production. Metrics are per process; scrape every
+# worker (or aggregate upstream) when running several.
+
+import bisect
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from flask import g, request
+
+from utils.logging_config import dropped_log_records
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # seconds
+SQL_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)  # statements per request
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+def _labels(**labels):
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class RequestMetrics:
+
+    def __init__(self):
+        self.enabled = False
+        self.server_timing = False
+        self._lock = threading.Lock()
+        self._collectors = {}
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._latency = {}
+            self._sql_count = {}
+            self._sql_seconds = defaultdict(float)
+            self._response_bytes = defaultdict(int)
+            self._requests = defaultdict(int)
+            self._started = time.time()
+
+    def init_app(self, app):
+        self.enabled = app.config.get("METRICS_ENABLED", True)
+        self.server_timing = app.config.get("METRICS_SERVER_TIMING", True)
+        if not self.enabled:
+            return
+
+        @app.before_request
+        def start_timer():
+            g.request_started = time.perf_counter()
+
+        @app.after_request
+        def record(response):
+            started = g.pop("request_started", None)
+            if started is None:
+                return response
+            duration = time.perf_counter() - started
+            counter = g.get("sql_query_counter")
+            sql_count = counter.count if counter else 0
+            sql_seconds = counter.duration if counter else 0.0
+
+            self.observe(
+                blueprint=request.blueprint or "none",
+                endpoint=request.url_rule.rule if request.url_rule else "unmatched",
+                method=request.method,
+                status=response.status_code,
+                duration=duration,
+                sql_count=sql_count,
+                sql_seconds=sql_seconds,
+                response_bytes=response.calculate_content_length(),
+            )
+            if self.server_timing:
+                response.headers.add(
+                    "Server-Timing",
+                    f'app;dur={duration * 1000:.1f}, '
+                    f'db;dur={sql_seconds * 1000:.1f};desc="{sql_count} queries"'
+                )
+            return response
+
+    def register_collector(self, name, collect):
+        """
+        Add metrics owned by another component (e.g. a background job) to render().
+        ``collect()`` returns (metric_name, kind, help_text, samples) tuples, samples being
+        (labels dict, value) pairs. Registering a name again replaces its collector.
+        """
+        with self._lock:
+            self._collectors[name] = collect
+
+    def observe(self, blueprint, endpoint, method, status, duration, sql_count=0, sql_seconds=0.0,
+                response_bytes=None):
+        key = (blueprint, endpoint, method)
+        with self._lock:
+            latency = self._latency.get(key)
+            if latency is None:
+                latency = self._latency[key] = _Histogram(LATENCY_BUCKETS)
+                self._sql_count[key] = _Histogram(SQL_COUNT_BUCKETS)
+            latency.observe(duration)
+            self._sql_count[key].observe(sql_count)
+            self._sql_seconds[key] += sql_seconds
+            if response_bytes is not None:  # unknown for streamed responses
+                self._response_bytes[key] += response_bytes
+            self._requests[key + (status,)] += 1
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            latency = {key: (list(h.counts), h.total, h.count) for key, h in self._latency.items()}
+            sql_count = {key: (list(h.counts), h.total, h.count) for key, h in self._sql_count.items()}
+            sql_seconds = dict(self._sql_seconds)
+            response_bytes = dict(self._response_bytes)
+            requests = dict(self._requests)
+            started = self._started
+            collectors = list(self._collectors.values())
+
+        lines = []
+
+        def header(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def histogram(name, buckets, series):
+            for (blueprint, endpoint, method), (counts, total, count) in sorted(series.items()):
+                base = _labels(blueprint=blueprint, endpoint=endpoint, method=method)
+                cumulative = 0
+                for bound, bucket_count in zip(list(buckets) + ["+Inf"], counts):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{base},le="{bound}"}} {cumulative}')
+                lines.append(f"{name}_sum{{{base}}} {_format_number(total)}")
+                lines.append(f"{name}_count{{{base}}} {count}")
+
+        def counter(name, series):
+            for (blueprint, endpoint, method, *rest), value in sorted(series.items()):
+                extra = {"status": rest[0]} if rest else {}
+                labels = _labels(blueprint=blueprint, endpoint=endpoint, method=method, **extra)
+                lines.append(f"{name}{{{labels}}} {_format_number(value)}")
+
+        header("http_requests_total", "counter", "Requests by blueprint, endpoint, method and status code.")
+        counter("http_requests_total", requests)
+
+        header("http_request_duration_seconds", "histogram", "Request latency until the response is built.")
+        histogram("http_request_duration_seconds", LATENCY_BUCKETS, latency)
+
+        header("http_request_sql_statements", "histogram", "SQL statements issued per request.")
+        histogram("http_request_sql_statements", SQL_COUNT_BUCKETS, sql_count)
+
+        header("http_request_sql_seconds_total", "counter", "Time spent executing SQL.")
+        counter("http_request_sql_seconds_total", sql_seconds)
+
+        header("http_response_size_bytes_total", "counter", "Response body bytes (streamed responses excluded).")
+        counter("http_response_size_bytes_total", response_bytes)
+
+        # Per-blueprint roll-up, so dashboards do not need to aggregate every endpoint
+        by_blueprint = defaultdict(lambda: [0, 0.0])
+        for (blueprint, _, _), (_, total, count) in latency.items():
+            by_blueprint[blueprint][0] += count
+            by_blueprint[blueprint][1] += total
+        header("http_blueprint_requests_total", "counter", "Requests per blueprint.")
+        for blueprint, (count, _) in sorted(by_blueprint.items()):
+            lines.append(f"http_blueprint_requests_total{{{_labels(blueprint=blueprint)}}} {count}")
+        header("http_blueprint_duration_seconds_total", "counter", "Total request time per blueprint.")
+        for blueprint, (_, total) in sorted(by_blueprint.items()):
+            lines.append(f"http_blueprint_duration_seconds_total{{{_labels(blueprint=blueprint)}}} {_format_number(total)}")
+
+        header("log_records_dropped_total", "counter", "Log records dropped because the logging queue was full.")
+        lines.append(f"log_records_dropped_total {dropped_log_records()}")
+
+        for collect in collectors:
+            for name, kind, help_text, samples in collect():
+                header(name, kind, help_text)
+                for labels, value in samples:
+                    lines.append(f"{name}{{{_labels(**labels)}}} {_format_number(value)}" if labels
+                                 else f"{name} {_format_number(value)}")
+
+        header("process_metrics_start_time_seconds", "gauge", "Unix time the metrics were last reset.")
+        lines.append(f"process_metrics_start_time_seconds {_format_number(started)}")
+        return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetrics()
@@ -0,0 +1,112 @@
+# backend/utils/pagination.py
+# Keyset (cursor) pagination over (sort key, id).
+# Cursors are opaque to clients: base64 of the last row's sort key and id, so each
+# page is one indexed range scan no matter how deep the client has paged.
+
+import base64
+import binascii
+import json
+from collections import namedtuple
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask import request, current_app
+from sqlalchemy import and_, or_
+
+from exceptions.custom_exceptions import BadRequestError
+
+Page = namedtuple("Page", ["items", "next_cursor"])
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    if hasattr(value, "value"):  # Enum members
+        return value.value
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "dec" in value:
+            return Decimal(value["dec"])
+    return value
+
+
+def encode_cursor(sort_name, sort_value, row_id):
+    payload = json.dumps([sort_name, _encode_value(sort_value), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, sort_name):
+    """Return (sort_value, row_id) from a cursor issued for ``sort_name``."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        name, sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if name != sort_name or not isinstance(row_id, int):
+            raise ValueError("cursor was issued for a different listing")
+        return _decode_value(sort_value), row_id
+    except (ValueError, TypeError, binascii.Error, json.JSONDecodeError):
+        raise BadRequestError("Invalid cursor.")
+
+
+def get_page_args():
+    """Read ``limit`` and ``cursor`` from the query string, clamping limit to the configured maximum."""
+    default_limit = current_app.config.get("PAGINATION_DEFAULT_LIMIT", 50)
+    max_limit = current_app.config.get("PAGINATION_MAX_LIMIT", 200)
+    limit = request.args.get("limit", default_limit, type=int)
+    if limit < 1:
+        raise BadRequestError("limit must be a positive integer.")
+    return min(limit, max_limit), request.args.get("cursor") or None
+
+
+def paginate(query, sort_column, id_column, limit, cursor=None, descending=False):
+    """
+    Return one Page of ``query`` ordered by (sort_column, id_column).
+
+    Fetches ``limit + 1`` rows to find out whether another page exists, so no
+    COUNT query is needed. Works for entity queries and column-only queries,
+    as long as both columns are selected under their attribute names.
+    """
+    sort_name = sort_column.key
+
+    if cursor:
+        last_value, last_id = decode_cursor(cursor, sort_name)
+        if descending:
+            query = query.filter(or_(
+                sort_column < last_value,
+                and_(sort_column == last_value, id_column < last_id)
+            ))
+        else:
+            query = query.filter(or_(
+                sort_column > last_value,
+                and_(sort_column == last_value, id_column > last_id)
+            ))
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    rows = query.limit(limit + 1).all()
+    items = rows[:limit]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(sort_name, getattr(last, sort_name), getattr(last, id_column.key))
+
+    return Page(items, next_cursor)
+
+
+def page_response(items, next_cursor):
+    """Standard response body for paginated list endpoints."""
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,46 @@
+# backend/utils/periodic.py
+# Minimal in-process scheduler for maintenance jobs (hold sweeper, flight lifecycle).
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """
+    Calls ``run_scheduled()`` every ``interval`` seconds on a daemon thread, inside an app
+    context. ``init_app`` only configures a job; server entry points start the enabled ones
+    (app.start_background_jobs), so CLI commands, workers, tests and benchmarks run none.
+    """
+
+    thread_name = "periodic-job"
+
+    def __init__(self, interval=60):
+        self.interval = interval
+        self.enabled = False
+        self._app = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    def run_scheduled(self):
+        raise NotImplementedError
+
+    def start(self, app):
+        self._app = app
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name=self.thread_name, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            with self._app.app_context():
+                try:
+                    self.run_scheduled()
+                except Exception:
+                    logger.exception("Scheduled job %s failed.", self.thread_name)
@@ -0,0 +1,99 @@
+# backend/utils/query_counter.py
+# Counts SQL statements (and their time) per request, or inside an explicit block.
+#
+# Engine-wide cursor events feed whichever QueryCounter is active: one opened with
+# `count_queries()`, otherwise the one attached to the current request. After each
+# request the count is checked against SQL_QUERY_BUDGET; when SQL_QUERY_BUDGET_STRICT
+# is on (the testing config) going over budget fails the request, so N+1 regressions
+# show up as test failures instead of slow pages.
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from exceptions.custom_exceptions import QueryBudgetExceededError
+
+logger = logging.getLogger(__name__)
+
+_active = ContextVar("sql_query_counter", default=None)
+_listening = False
+
+
+class QueryCounter:
+    MAX_RECORDED = 20
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0  # seconds
+        self.statements = []  # first MAX_RECORDED statements, for diagnostics
+
+    def record(self, statement, duration):
+        self.count += 1
+        self.duration += duration
+        if len(self.statements) < self.MAX_RECORDED:
+            self.statements.append(statement)
+
+
+def current_counter():
+    counter = _active.get()
+    if counter is None and has_request_context():
+        counter = g.get("sql_query_counter")
+    return counter
+
+
+@contextmanager
+def count_queries():
+    """Count the statements issued inside the block: ``with count_queries() as counter: ...``"""
+    counter = QueryCounter()
+    token = _active.set(counter)
+    try:
+        yield counter
+    finally:
+        _active.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    counter = current_counter()
+    if counter is not None:
+        counter.record(statement, time.perf_counter() - started)
+
+
+def _install_listeners():
+    global _listening
+    if not _listening:
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _listening = True
+
+
+def init_app(app):
+    _install_listeners()
+
+    @app.before_request
+    def start_counting():
+        g.sql_query_counter = QueryCounter()
+
+    @app.after_request
+    def check_budget(response):
+        budget = app.config.get("SQL_QUERY_BUDGET", 0)
+        counter = g.get("sql_query_counter")
+        if not budget or counter is None or counter.count <= budget:
+            return response
+
+        message = (f"{request.method} {request.path} issued {counter.count} SQL statements "
+                   f"(budget {budget}).")
+        if app.config.get("SQL_QUERY_BUDGET_STRICT"):
+            logger.error("%s First statements: %s", message, counter.statements)
+            raise QueryBudgetExceededError(message)
+        logger.warning(message)
+        return response
@@ -0,0 +1,62 @@
+# backend/utils/streaming.py
+# Chunked JSON / NDJSON responses for list endpoints that need the whole table.
+# Rows are pulled from the database in batches with yield_per and serialized as they
+# arrive, so memory stays bounded by the chunk size instead of the table size.
+
+import logging
+from flask import Response, request, current_app, stream_with_context
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def wants_ndjson():
+    return request.accept_mimetypes.best == NDJSON_MIMETYPE
+
+
+def wants_stream():
+    """True if the client asked for a streamed response (?stream=1 or Accept: application/x-ndjson)."""
+    return request.args.get("stream", "").lower() in ("1", "true", "yes") or wants_ndjson()
+
+
+def stream_query(query, dump, chunk_size=None):
+    """
+    Stream every row of ``query`` through ``dump`` (row -> dict).
+
+    Sends a JSON array by default, or one JSON document per line when the
+    client accepts NDJSON. Output is flushed once per chunk of rows.
+    """
+    chunk_size = chunk_size or current_app.config.get("STREAM_CHUNK_SIZE", 500)
+    ndjson = wants_ndjson()
+    dumps = current_app.json.dumps
+
+    def generate():
+        rows = query.yield_per(chunk_size)
+        buffer = []
+        count = 0
+        if not ndjson:
+            yield "["
+        try:
+            for row in rows:
+                document = dumps(dump(row))
+                if ndjson:
+                    buffer.append(document + "\n")
+                else:
+                    buffer.append(document if count == 0 else "," + document)
+                count += 1
+                if len(buffer) >= chunk_size:
+                    yield "".join(buffer)
+                    buffer = []
+            if buffer:
+                yield "".join(buffer)
+        except Exception:
+            # Headers are already sent; all we can do is log and cut the stream short
+            logger.exception("Streaming response aborted after %d rows.", count)
+            raise
+        if not ndjson:
+            yield "]"
+        logger.debug("Streamed %d rows.", count)
+
+    mimetype = NDJSON_MIMETYPE if ndjson else "application/json"
+    return Response(stream_with_context(generate()), mimetype=mimetype)
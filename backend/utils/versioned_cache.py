@@ -0,0 +1,116 @@
+# backend/utils/versioned_cache.py
+# Read-through caching on top of the Flask-Caching `cache` extension, using versioned keys.
+#
+# Every namespace (e.g. "airports") has a version. Entries are keyed as
+# "<namespace>:v<version>:<key>", so a write only has to bump the version to make every
+# cached entry of that namespace unreachable; stale entries simply expire.
+# Cache failures never fail the request: we log and fall back to the loader.
+#
+# A bump only reaches the workers that read the same version store. CACHE_VERSION_BACKEND
+# selects it: "cache" keeps versions next to the entries, which is shared with a Redis or
+# filesystem cache but private to each process with SimpleCache, where other workers keep
+# serving their entries until they time out (REFERENCE_CACHE_TIMEOUT bounds that). "redis"
+# keeps versions in Redis (CACHE_VERSION_REDIS_URL), so every worker sees a bump at once
+# while entries stay in the local cache; "local-redis" runs that code path in-process.
+
+import logging
+import time
+
+from cachelib.redis import RedisCache
+
+from extensions import cache
+from utils.db_routing import read_primary
+
+logger = logging.getLogger(__name__)
+
+# Backends that live inside one process, so versions kept in them are not shared
+_PROCESS_LOCAL_CACHES = {"SimpleCache", "simple", "NullCache", "null"}
+
+
+class VersionStore:
+    """Where namespace versions live: the ``cache`` extension itself, or a shared Redis."""
+
+    def __init__(self):
+        self.store = None  # None: the cache extension
+
+    def init_app(self, app):
+        config = app.config
+        backend = config.get("CACHE_VERSION_BACKEND", "cache")
+        prefix = config.get("CACHE_KEY_PREFIX", "") + "version:"
+        if backend == "cache":
+            self.store = None
+            if config.get("CACHE_TYPE") in _PROCESS_LOCAL_CACHES:
+                logger.info("Cache versions are per process (CACHE_TYPE=%s); with several workers, "
+                            "writes reach the others' caches only after REFERENCE_CACHE_TIMEOUT.",
+                            config.get("CACHE_TYPE"))
+        elif backend == "redis":
+            import redis
+            self.store = RedisCache(host=redis.Redis.from_url(config.get("CACHE_VERSION_REDIS_URL")),
+                                    key_prefix=prefix)
+        elif backend == "local-redis":
+            from utils.cache_backends import LocalRedis
+            self.store = RedisCache(host=LocalRedis(), key_prefix=prefix)
+        else:
+            raise ValueError(f"Unknown CACHE_VERSION_BACKEND {backend!r}")
+
+    def _backend(self):
+        return cache if self.store is None else self.store
+
+    def get(self, key):
+        return self._backend().get(key)
+
+    def add(self, key, value):
+        return self._backend().add(key, value, timeout=0)
+
+    def set(self, key, value):
+        return self._backend().set(key, value, timeout=0)
+
+
+cache_versions = VersionStore()
+
+
+def _version_key(namespace):
+    return f"{namespace}:version"
+
+
+def get_version(namespace):
+    version = cache_versions.get(_version_key(namespace))
+    if version is None:
+        # Seed with a timestamp so a version lost to eviction never reuses an old number
+        cache_versions.add(_version_key(namespace), time.time_ns())
+        version = cache_versions.get(_version_key(namespace))
+    return version
+
+
+def bump_version(namespace):
+    """Invalidate every entry cached under ``namespace``."""
+    try:
+        cache_versions.set(_version_key(namespace), time.time_ns())
+    except Exception:
+        logger.exception("Failed to bump cache version for %s.", namespace)
+
+
+def cached(namespace, key, loader, timeout=None):
+    """
+    Return the cached value for ``key`` in ``namespace``, calling ``loader()`` on a miss.
+    ``None`` results are not cached. The loader reads from the primary, so what is cached
+    under the current version includes every write that bumped it.
+    """
+    try:
+        full_key = f"{namespace}:v{get_version(namespace)}:{key}"
+        value = cache.get(full_key)
+    except Exception:
+        logger.exception("Cache read failed for %s:%s; loading from the database.", namespace, key)
+        return loader()
+
+    if value is not None:
+        return value
+
+    with read_primary():
+        value = loader()
+    if value is not None:
+        try:
+            cache.set(full_key, value, timeout=timeout)
+        except Exception:
+            logger.exception("Cache write failed for %s.", full_key)
+    return value
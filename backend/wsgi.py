@@ -2,9 +2,10 @@
 # WSGI entry point for the Flask application
 # Entry point when deploying the app with a WSGI server like Gunicorn or uWSGI
 
-from app import create_app
+from app import create_app, start_background_jobs
 
 app = create_app()
+start_background_jobs(app)
 
 if __name__ == "__main__":
     # For local testing only